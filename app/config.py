@@ -103,7 +103,17 @@ class Settings(BaseSettings):
     EXCEL_AUTO_IMPORT: bool = True
     EXCEL_DATASOURCE_DIR: str = "datasource"
     EXCEL_POLL_SECONDS: int = 10
+    EXCEL_WATCH_MODE: str = "auto"
+    EXCEL_WATCH_DEBOUNCE_SECONDS: float = 1.0
+    EXCEL_IMPORT_QUEUE_SIZE: int = 16
+    EXCEL_STREAMING_IMPORT: bool = True
+    EXCEL_PARSE_WORKERS: int = 1
+    EXCEL_IMPORT_CHUNK_ROWS: int = 5000
+    EXCEL_IMPORT_STALE_SECONDS: int = 1800
     EXCEL_IMPORT_SHEETS: Optional[str] = None
+    INGEST_MAX_CONCURRENT_JOBS: int = 1
+    INGEST_MAX_PENDING_JOBS: int = 20
+    INGEST_UPLOAD_MAX_BYTES: int = 200 * 1024 * 1024
     EXCEL_DAILY_UPDATE_SHEET_ALIASES: Optional[str] = None
     EXCEL_SOLD_REPORT_SHEET_ALIASES: Optional[str] = None
     EXCEL_PURCHASE_REPORT_SHEET_ALIASES: Optional[str] = None
@@ -11,3 +11,6 @@ DANGER_LEVELS = ("EARLY", "HIGH", "CRITICAL")
 AGING_STATUSES = ("HEALTHY", "TRANSFER", "RR_TT", "VERY_DANGER")
 
 DEFAULT_DASHBOARD_PATH = "/dashboard"
+
+# Width and height, in points, of the product image cell in the PDF report.
+PDF_IMAGE_SIZE = (122, 108)
@@ -0,0 +1,13 @@
+import hashlib
+import json
+
+# Standard library only: the SQLite schema migration imports this without
+# the decision rules. These are the keys of an ``evaluate_inventory`` result
+# that make up a profile; the per-row ``context`` is left out.
+DECISION_PROFILE_FIELDS = ("status", "eligible_actions", "lifecycle_action", "explanation")
+
+
+def encode_decision_profile(profile):
+    """Return ``(sha256, canonical JSON)`` for a decision profile."""
+    encoded = json.dumps(profile, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest(), encoded
@@ -1,12 +1,24 @@
-def evaluate_inventory(category, age_days, demand_band, danger_level):
-    actions = []
-    explanation = []
-    context = {
-        "category": category,
-        "age_days": age_days,
-    }
+from functools import lru_cache
+
+# Age at which low and medium demand stock is put up for transfer review.
+_TRANSFER_REVIEW_AGE_DAYS = 180
 
+
+def decision_profile_key(age_days, demand_band, danger_level):
+    """The inputs ``evaluate_inventory`` actually branches on, as a hashable key."""
     demand_value = str(demand_band or "").strip().upper() or "M"
+    review_age = age_days is not None and age_days >= _TRANSFER_REVIEW_AGE_DAYS
+    return danger_level, review_age, demand_value
+
+
+@lru_cache(maxsize=None)
+def decision_profile(danger_level, review_age, demand_value):
+    """Memoized decision for a ``decision_profile_key``, without the per-row context.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    actions = []
+    explanation = []
 
     if danger_level == "CRITICAL":
         actions += ["RATE_REVISION", "STIPEND_INCENTIVE", "PRIORITY_TRANSFER"]
@@ -15,7 +27,7 @@ def evaluate_inventory(category, age_days, demand_band, danger_level):
         actions.append("PRIORITY_TRANSFER")
         explanation.append("High aging risk")
 
-    if age_days is not None and age_days >= 180 and demand_value in ("L", "M"):
+    if review_age and demand_value in ("L", "M"):
         actions.append("TRANSFER_REVIEW")
         explanation.append("Aging crossed transfer review threshold")
 
@@ -29,5 +41,23 @@ def evaluate_inventory(category, age_days, demand_band, danger_level):
         "eligible_actions": sorted(set(actions)),
         "lifecycle_action": "RESET" if "RATE_REVISION" in actions else "CONTINUE",
         "explanation": explanation,
-        "context": context,
     }
+
+
+def decision_with_context(profile, category, age_days):
+    """Rebuild the full ``evaluate_inventory`` result from a profile and its row."""
+    return {
+        "status": profile["status"],
+        "eligible_actions": list(profile["eligible_actions"]),
+        "lifecycle_action": profile["lifecycle_action"],
+        "explanation": list(profile["explanation"]),
+        "context": {
+            "category": category,
+            "age_days": age_days,
+        },
+    }
+
+
+def evaluate_inventory(category, age_days, demand_band, danger_level):
+    profile = decision_profile(*decision_profile_key(age_days, demand_band, danger_level))
+    return decision_with_context(profile, category, age_days)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_BUFFER_SIZE = 64 * 1024
+
+_libc = None
+
+
+def _load_libc():
+    global _libc
+    if _libc is not None:
+        return _libc or None
+    _libc = False
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, "inotify_init1") or not hasattr(libc, "inotify_add_watch"):
+        return None
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_init1.restype = ctypes.c_int
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_add_watch.restype = ctypes.c_int
+    _libc = libc
+    return libc
+
+
+def inotify_available() -> bool:
+    return _load_libc() is not None
+
+
+def _raise_errno(message: str) -> None:
+    err = ctypes.get_errno()
+    raise OSError(err, "{}: {}".format(message, os.strerror(err)))
+
+
+class InotifyWatcher:
+    """Minimal inotify reader for a single directory (Linux only)."""
+
+    def __init__(self, directory, mask: int = IN_CLOSE_WRITE | IN_MOVED_TO) -> None:
+        libc = _load_libc()
+        if libc is None:
+            raise OSError("inotify is not available on this platform")
+        self.directory = Path(directory)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            _raise_errno("inotify_init1 failed")
+        watch = libc.inotify_add_watch(fd, os.fsencode(str(self.directory)), mask)
+        if watch < 0:
+            os.close(fd)
+            _raise_errno("inotify_add_watch failed for {}".format(self.directory))
+        self._fd: Optional[int] = fd
+
+    def read_events(self, timeout: float) -> List[Tuple[int, str]]:
+        """Wait up to ``timeout`` seconds and return ``(mask, file_name)`` pairs."""
+        if self._fd is None:
+            return []
+        ready, _, _ = select.select([self._fd], [], [], max(0.0, timeout))
+        if not ready:
+            return []
+        try:
+            data = os.read(self._fd, _READ_BUFFER_SIZE)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            events.append((mask, os.fsdecode(name)))
+        return events
+
+    def close(self) -> None:
+        if self._fd is None:
+            return
+        os.close(self._fd)
+        self._fd = None
+
+
+__all__ = [
+    "IN_CLOSE_WRITE",
+    "IN_IGNORED",
+    "IN_MOVED_TO",
+    "IN_Q_OVERFLOW",
+    "InotifyWatcher",
+    "inotify_available",
+]
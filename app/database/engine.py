@@ -1,3 +1,4 @@
+import json
 import logging
 import sqlite3
 
@@ -7,6 +8,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.pool import StaticPool
 
 from app.config import Settings, get_settings
+from app.core.decision_encoding import DECISION_PROFILE_FIELDS, encode_decision_profile
 
 
 app_settings: Settings = get_settings()
@@ -70,6 +72,9 @@ _SQLITE_COLUMN_DEFAULTS = {
     "inventory": {
         "current_price": "REAL NOT NULL DEFAULT 0",
     },
+    "daily_snapshots": {
+        "decision_profile_id": "INTEGER REFERENCES decision_profiles(id)",
+    },
     "delivery_logs": {
         "provider_message_id": "TEXT",
         "webhook_status": "TEXT",
@@ -87,6 +92,19 @@ _SQLITE_POST_ADD_UPDATES = {
 }
 
 
+# Unique keys added to tables that may predate them: index name -> (table, columns).
+_SQLITE_UNIQUE_INDEXES = {
+    "uq_sales_store_product_date": ("sales", ("store_id", "product_id", "sale_date")),
+    "uq_daily_snapshots_date_store_product": (
+        "daily_snapshots",
+        ("snapshot_date", "store_id", "product_id"),
+    ),
+}
+# Derived tables that are rebuilt daily: duplicates blocking their unique key
+# are dropped, keeping the newest row, instead of leaving the key out.
+_SQLITE_DEDUPLICATED_TABLES = {"daily_snapshots"}
+
+
 def _escape_sqlite_identifier(value: str) -> str:
     return value.replace('"', '""')
 
@@ -115,6 +133,105 @@ def _has_store_style_unique(columns):
     return set(columns) == {"store_id", "style_code"}
 
 
+def _ensure_sqlite_unique_indexes(conn):
+    for index_name, (table_name, columns) in _SQLITE_UNIQUE_INDEXES.items():
+        if not _get_sqlite_columns(conn, table_name):
+            continue
+        escaped_table = _escape_sqlite_identifier(table_name)
+        # noinspection SqlNoDataSourceInspection
+        indexes = conn.exec_driver_sql(
+            f'PRAGMA index_list("{escaped_table}")'
+        ).mappings().all()
+        if any(
+            index.get("unique")
+            and _get_sqlite_index_columns(conn, index["name"]) == list(columns)
+            for index in indexes
+        ):
+            continue
+        column_list = ", ".join(columns)
+        # noinspection SqlNoDataSourceInspection
+        duplicate = conn.exec_driver_sql(
+            f'SELECT 1 FROM "{escaped_table}" GROUP BY {column_list} HAVING COUNT(*) > 1 LIMIT 1'
+        ).fetchone()
+        if duplicate and table_name in _SQLITE_DEDUPLICATED_TABLES:
+            # noinspection SqlNoDataSourceInspection
+            deleted = conn.exec_driver_sql(
+                f'DELETE FROM "{escaped_table}" WHERE id NOT IN '
+                f'(SELECT MAX(id) FROM "{escaped_table}" GROUP BY {column_list})'
+            ).rowcount
+            logger.warning(
+                "Deleted %s duplicate rows from %s(%s) to add its unique index.",
+                deleted,
+                table_name,
+                column_list,
+            )
+        elif duplicate:
+            logger.warning(
+                "Skipping unique index on %s(%s) due to duplicates.", table_name, column_list
+            )
+            continue
+        # noinspection SqlNoDataSourceInspection
+        conn.exec_driver_sql(
+            f'CREATE UNIQUE INDEX IF NOT EXISTS "{index_name}" '
+            f'ON "{escaped_table}"({column_list})'
+        )
+
+
+def _migrate_sqlite_snapshot_decisions(conn):
+    """Move legacy ``daily_snapshots.decision`` JSON into ``decision_profiles``.
+
+    Each row's decision, minus its context, is stored once per distinct
+    profile; the snapshot keeps the profile id and the JSON column is dropped.
+    Snapshots are no longer written with a ``decision``, so a table that keeps
+    its ``NOT NULL`` column cannot take new rows: raises ``RuntimeError`` when
+    SQLite is too old to drop it.
+    """
+    if "decision" not in _get_sqlite_columns(conn, "daily_snapshots"):
+        return
+    if not _get_sqlite_columns(conn, "decision_profiles"):
+        return
+    if sqlite3.sqlite_version_info < (3, 35, 0):
+        raise RuntimeError(
+            "SQLite {} cannot drop daily_snapshots.decision; upgrade to 3.35+ to migrate it.".format(
+                sqlite3.sqlite_version
+            )
+        )
+
+    # noinspection SqlNoDataSourceInspection
+    profile_ids = dict(
+        conn.exec_driver_sql("SELECT profile_hash, id FROM decision_profiles").fetchall()
+    )
+    updates = []
+    # noinspection SqlNoDataSourceInspection
+    legacy_rows = conn.exec_driver_sql(
+        "SELECT id, decision FROM daily_snapshots WHERE decision_profile_id IS NULL"
+    ).fetchall()
+    for snapshot_id, decision_text in legacy_rows:
+        try:
+            decision = json.loads(decision_text or "{}")
+        except ValueError:
+            decision = {}
+        profile = {key: decision.get(key) for key in DECISION_PROFILE_FIELDS}
+        profile_hash, encoded = encode_decision_profile(profile)
+        if profile_hash not in profile_ids:
+            # noinspection SqlNoDataSourceInspection
+            cursor = conn.exec_driver_sql(
+                "INSERT INTO decision_profiles (profile_hash, decision, created_at) "
+                "VALUES (?, ?, CURRENT_TIMESTAMP)",
+                (profile_hash, encoded),
+            )
+            profile_ids[profile_hash] = cursor.lastrowid
+        updates.append((profile_ids[profile_hash], snapshot_id))
+    if updates:
+        # noinspection SqlNoDataSourceInspection
+        conn.exec_driver_sql(
+            "UPDATE daily_snapshots SET decision_profile_id = ? WHERE id = ?", updates
+        )
+    # noinspection SqlNoDataSourceInspection
+    conn.exec_driver_sql("ALTER TABLE daily_snapshots DROP COLUMN decision")
+    logger.info("Moved %s snapshot decisions into decision_profiles.", len(updates))
+
+
 def ensure_sqlite_schema():
     if not is_sqlite:
         return
@@ -146,6 +263,15 @@ def ensure_sqlite_schema():
                     # noinspection SqlNoDataSourceInspection
                     conn.exec_driver_sql(update_stmt)
 
+        with conn.begin():
+            _ensure_sqlite_unique_indexes(conn)
+
+        try:
+            with conn.begin():
+                _migrate_sqlite_snapshot_decisions(conn)
+        except SQLAlchemyError as exc:
+            raise RuntimeError("Unable to migrate daily_snapshots.decision.") from exc
+
         if not products_exists:
             return
 
@@ -32,7 +32,13 @@ from app.scheduler.job_scheduler import (
     parse_time,
 )
 from app.services.alert_service import run_alerts
-from app.services.ingestion_service import ExcelWatchService, ensure_datasource_dir
+from app.services.ingestion_service import (
+    ExcelWatchService,
+    ensure_datasource_dir,
+    shutdown_image_writes,
+    shutdown_parse_pool,
+)
+from app.services.import_job_service import get_import_job_manager, shutdown_import_jobs
 from app.services.report_service import create_and_send_daily_alert_reports
 
 
@@ -40,15 +46,24 @@ def _import_models():
     for module_name in (
         "app.models.alert",
         "app.models.daily_snapshot",
+        "app.models.decision_profile",
         "app.models.delivery_logs",
+        "app.models.import_checkpoint",
+        "app.models.import_fingerprint",
+        "app.models.inferred_sale",
         "app.models.inventory",
+        "app.models.inventory_delta",
         "app.models.job_log",
         "app.models.lifecycle",
         "app.models.price_history",
         "app.models.product",
+        "app.models.product_image",
+        "app.models.purchase",
+        "app.models.report_import_line",
         "app.models.risk_log",
         "app.models.sales",
         "app.models.stores",
+        "app.models.workbook_import",
     ):
         importlib.import_module(module_name)
 
@@ -82,6 +97,10 @@ excel_watch_service = ExcelWatchService(
     watch_dir=settings.EXCEL_DATASOURCE_DIR,
     poll_seconds=settings.EXCEL_POLL_SECONDS,
     sheets=settings.EXCEL_IMPORT_SHEETS,
+    watch_mode=settings.EXCEL_WATCH_MODE,
+    debounce_seconds=settings.EXCEL_WATCH_DEBOUNCE_SECONDS,
+    queue_size=settings.EXCEL_IMPORT_QUEUE_SIZE,
+    import_jobs=get_import_job_manager,
 )
 
 
@@ -154,6 +173,9 @@ async def lifespan(_app: FastAPI):
         if scheduler_thread is not None and scheduler_thread.is_alive():
             scheduler_thread.join(timeout=max(1, settings.SCHEDULER_POLL_SECONDS) + 2)
         excel_watch_service.stop()
+        shutdown_import_jobs()
+        shutdown_parse_pool()
+        shutdown_image_writes()
 
 
 app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
@@ -1,6 +1,7 @@
 from datetime import date
 import logging
-import math
+
+import numpy as np
 
 from app.ml.features import build_feature_dict
 from app.ml.model_io import load_model, model_available
@@ -9,6 +10,10 @@ from app.ml.model_io import load_model, model_available
 _VALUE_RISK_CAP = 0.2
 _VALUE_SCALE = 1000000.0
 
+# Upper age bounds (days, exclusive) and their risk; older stock gets _AGE_RISK_MAX.
+_AGE_RISK_STEPS = ((90, 0.15), (180, 0.3), (250, 0.55), (365, 0.75))
+_AGE_RISK_MAX = 0.9
+
 _CATEGORY_RISK = {
     "dress": 0.03,
     "dress material": 0.02,
@@ -22,36 +27,30 @@ _MODEL_LOAD_ERROR = None
 
 _LOGGER = logging.getLogger(__name__)
 
-def _clamp(value, low=0.0, high=1.0):
-    if value < low:
-        return low
-    if value > high:
-        return high
-    return value
-
-
-def _age_risk(age_days):
-    if age_days < 90:
-        return 0.15
-    if age_days < 180:
-        return 0.3
-    if age_days < 250:
-        return 0.55
-    if age_days < 365:
-        return 0.75
-    return 0.9
-
-
-def _heuristic_risk(category, quantity, cost_price, lifecycle_start_date):
-    age_days = max(0, (date.today() - lifecycle_start_date).days)
-    age_component = _age_risk(age_days)
-
-    stock_value = max(0.0, float(quantity) * float(cost_price))
-    value_component = min(stock_value / _VALUE_SCALE, 1.0) * _VALUE_RISK_CAP
-
-    category_component = _CATEGORY_RISK.get(str(category).lower(), 0.0)
-
-    return _clamp(age_component + value_component + category_component)
+def _heuristic_risk(rows):
+    """Age, stock-value and category risk for every row, as a float array."""
+    count = len(rows)
+    start_days = np.fromiter(
+        (row["lifecycle_start_date"].toordinal() for row in rows),
+        dtype=np.int64,
+        count=count,
+    )
+    age_days = np.maximum(0, date.today().toordinal() - start_days)
+    bounds = np.array([upper_bound for upper_bound, _ in _AGE_RISK_STEPS])
+    risks = np.array([risk for _, risk in _AGE_RISK_STEPS] + [_AGE_RISK_MAX])
+    age_component = risks[np.searchsorted(bounds, age_days, side="right")]
+
+    quantity = np.fromiter((float(row["quantity"]) for row in rows), dtype=float, count=count)
+    cost_price = np.fromiter((float(row["cost_price"]) for row in rows), dtype=float, count=count)
+    stock_value = np.maximum(0.0, quantity * cost_price)
+    value_component = np.minimum(stock_value / _VALUE_SCALE, 1.0) * _VALUE_RISK_CAP
+
+    category_component = np.fromiter(
+        (_CATEGORY_RISK.get(str(row["category"]).lower(), 0.0) for row in rows),
+        dtype=float,
+        count=count,
+    )
+    return np.clip(age_component + value_component + category_component, 0.0, 1.0)
 
 
 def _is_weak_label_model(metadata):
@@ -108,55 +107,53 @@ def get_model_runtime_info():
     }
 
 
-def predict_risk(
-    category,
-    quantity,
-    cost_price,
-    lifecycle_start_date,
-    *,
-    as_of_date=None,
-    age_days=None,
-    current_price=None,
-    mrp=None,
-    department_name=None,
-    supplier_name=None,
-    store_id=None,
-):
-    """Return a 0..1 risk score using the trained model when available."""
-    features = build_feature_dict(
-        category=category,
-        quantity=quantity,
-        cost_price=cost_price,
-        lifecycle_start_date=lifecycle_start_date,
-        as_of_date=as_of_date,
-        age_days=age_days,
-        current_price=current_price,
-        mrp=mrp,
-        department_name=department_name,
-        supplier_name=supplier_name,
-        store_id=store_id,
-    )
+def predict_risk_batch(rows, *, as_of_date=None):
+    """Score many inventory rows at once; returns a float array aligned with ``rows``.
+
+    Each row is a mapping with the keyword arguments of ``predict_risk``
+    (``category``, ``quantity``, ``cost_price`` and ``lifecycle_start_date``
+    are required). The model sees one feature matrix in a single call, and the
+    heuristic fallback and weak-label blending run as array operations.
+    """
+    rows = list(rows)
+    if not rows:
+        return np.zeros(0)
 
     model = _load_model_once()
     if model is not None:
+        features = [
+            build_feature_dict(
+                category=row["category"],
+                quantity=row["quantity"],
+                cost_price=row["cost_price"],
+                lifecycle_start_date=row["lifecycle_start_date"],
+                as_of_date=as_of_date,
+                age_days=row.get("age_days"),
+                current_price=row.get("current_price"),
+                mrp=row.get("mrp"),
+                department_name=row.get("department_name"),
+                supplier_name=row.get("supplier_name"),
+                store_id=row.get("store_id"),
+            )
+            for row in rows
+        ]
         try:
             if hasattr(model, "predict_proba"):
-                prob = model.predict_proba([features])[0][1]
+                probability = np.asarray(model.predict_proba(features), dtype=float)[:, 1]
             elif hasattr(model, "decision_function"):
-                score = model.decision_function([features])[0]
-                prob = 1.0 / (1.0 + math.exp(-float(score)))
+                score = np.asarray(model.decision_function(features), dtype=float)
+                probability = 1.0 / (1.0 + np.exp(-score))
             else:
-                prob = model.predict([features])[0]
+                probability = np.asarray(model.predict(features), dtype=float)
 
-            probability = _clamp(float(prob))
+            probability = np.clip(probability, 0.0, 1.0)
 
             # Weak-label training can be overconfident; blend with domain heuristics for stability.
             if _is_weak_label_model(_MODEL_METADATA):
-                heuristic = _heuristic_risk(category, quantity, cost_price, lifecycle_start_date)
-                probability = (0.65 * probability) + (0.35 * heuristic)
-                probability = _clamp(probability, low=0.02, high=0.98)
+                probability = (0.65 * probability) + (0.35 * _heuristic_risk(rows))
+                probability = np.clip(probability, 0.02, 0.98)
 
-            return _clamp(probability)
+            return probability
         except Exception as exc:
             # Handle runtime incompatibility (for example, sklearn artifact/version mismatch) safely.
             global _MODEL, _MODEL_LOAD_ERROR
@@ -164,7 +161,37 @@ def predict_risk(
             _MODEL = None
             _MODEL_LOAD_ERROR = exc
 
-    return _heuristic_risk(category, quantity, cost_price, lifecycle_start_date)
+    return _heuristic_risk(rows)
+
+
+def predict_risk(
+    category,
+    quantity,
+    cost_price,
+    lifecycle_start_date,
+    *,
+    as_of_date=None,
+    age_days=None,
+    current_price=None,
+    mrp=None,
+    department_name=None,
+    supplier_name=None,
+    store_id=None,
+):
+    """Return a 0..1 risk score using the trained model when available."""
+    row = {
+        "category": category,
+        "quantity": quantity,
+        "cost_price": cost_price,
+        "lifecycle_start_date": lifecycle_start_date,
+        "age_days": age_days,
+        "current_price": current_price,
+        "mrp": mrp,
+        "department_name": department_name,
+        "supplier_name": supplier_name,
+        "store_id": store_id,
+    }
+    return float(predict_risk_batch([row], as_of_date=as_of_date)[0])
 
 
-__all__ = ["predict_risk", "model_is_available", "get_model_runtime_info"]
+__all__ = ["predict_risk", "predict_risk_batch", "model_is_available", "get_model_runtime_info"]
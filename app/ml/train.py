@@ -37,12 +37,18 @@ def _load_rows(engine, query, params=None):
 
 
 def _load_sales(engine):
+    # Stores that never send a sold report fall back to sales inferred from
+    # quantity drops between inventory imports.
     # noinspection SqlNoDataSourceInspection
     return _load_rows(
         engine,
         """
-        SELECT store_id, product_id, sale_date, quantity_sold
+        SELECT store_id, product_id, sale_date, quantity_sold, 0 AS inferred
         FROM sales
+        UNION ALL
+        SELECT store_id, product_id, sale_date, quantity_sold, 1 AS inferred
+        FROM inferred_sales
+        WHERE store_id NOT IN (SELECT DISTINCT store_id FROM sales)
         """,
     )
 
@@ -95,6 +101,15 @@ def _load_inventory(engine):
     )
 
 
+def _sales_source(sales_rows):
+    inferred = {bool(row.get("inferred")) for row in sales_rows}
+    if inferred == {True}:
+        return "inferred_sales"
+    if inferred == {False}:
+        return "sales"
+    return "sales+inferred_sales"
+
+
 def _build_sales_index(sales_rows):
     index = {}
     for row in sales_rows:
@@ -310,7 +325,7 @@ def build_training_data(engine, horizon_days, as_of_date=None):
             as_of_fn=snapshot_as_of,
             age_days_fn=lambda row: row.get("age_days"),
         )
-        return features, labels, dates, "daily_snapshots+sales"
+        return features, labels, dates, "daily_snapshots+" + _sales_source(sales_rows)
 
     inventory_rows = _load_inventory(engine)
     if not inventory_rows:
@@ -332,7 +347,7 @@ def build_training_data(engine, horizon_days, as_of_date=None):
         label_fn=inventory_label,
         as_of_fn=inventory_as_of,
     )
-    return features, labels, dates, "inventory+recent_sales"
+    return features, labels, dates, "inventory+recent_" + _sales_source(sales_rows)
 
 
 def _split_data(labels, dates, test_size, random_state, use_time_split):
@@ -2,30 +2,48 @@ import importlib
 
 from app.models.alert import Alert
 from app.models.daily_snapshot import DailySnapshot
+from app.models.decision_profile import DecisionProfile
 from app.models.delivery_logs import DeliveryLog
+from app.models.import_checkpoint import ImportCheckpoint
+from app.models.import_fingerprint import ImportRowFingerprint
+from app.models.inferred_sale import InferredSale
 from app.models.inventory import Inventory
+from app.models.inventory_delta import InventoryDelta
 from app.models.job_log import JobLog
 from app.models.lifecycle import LifecycleHistory
 from app.models.price_history import PriceHistory
 from app.models.product import Product
+from app.models.product_image import ProductImage
+from app.models.purchase import Purchase
+from app.models.report_import_line import ReportImportLine
 from app.models.risk_log import RiskLog
 from app.models.sales import Sales
 from app.models.stores import Store
+from app.models.workbook_import import WorkbookImport
 
 
 def import_all_models() -> None:
     for module_name in (
         "app.models.alert",
         "app.models.daily_snapshot",
+        "app.models.decision_profile",
         "app.models.delivery_logs",
+        "app.models.import_checkpoint",
+        "app.models.import_fingerprint",
+        "app.models.inferred_sale",
         "app.models.inventory",
+        "app.models.inventory_delta",
         "app.models.job_log",
         "app.models.lifecycle",
         "app.models.price_history",
         "app.models.product",
+        "app.models.product_image",
+        "app.models.purchase",
+        "app.models.report_import_line",
         "app.models.risk_log",
         "app.models.sales",
         "app.models.stores",
+        "app.models.workbook_import",
     ):
         importlib.import_module(module_name)
 
@@ -33,14 +51,23 @@ def import_all_models() -> None:
 __all__ = [
     "Alert",
     "DailySnapshot",
+    "DecisionProfile",
     "DeliveryLog",
+    "ImportCheckpoint",
+    "ImportRowFingerprint",
+    "InferredSale",
     "Inventory",
+    "InventoryDelta",
     "JobLog",
     "LifecycleHistory",
     "PriceHistory",
     "Product",
+    "ProductImage",
+    "Purchase",
+    "ReportImportLine",
     "RiskLog",
     "Sales",
     "Store",
+    "WorkbookImport",
     "import_all_models",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Date, Float, ForeignKey, Index, Integer, String
+from sqlalchemy import Column, Date, Float, ForeignKey, Index, Integer, String, UniqueConstraint
 
 from app.database.base import Base
 
@@ -22,10 +22,14 @@ class DailySnapshot(Base):
 
     status = Column(String, nullable=False)
     demand_band = Column(String(1), nullable=False)
-    decision = Column(String, nullable=False)
+    # evaluate_inventory's result minus its context (category and age_days).
+    decision_profile_id = Column(Integer, ForeignKey("decision_profiles.id"), nullable=False)
 
     __table_args__ = (
         Index("idx_snapshot_psd", "product_id", "store_id", "snapshot_date"),
+        UniqueConstraint(
+            "snapshot_date", "store_id", "product_id", name="uq_daily_snapshots_date_store_product"
+        ),
     )
 
 
@@ -0,0 +1,23 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.database.base import Base
+
+
+class DecisionProfile(Base):
+    __tablename__ = "decision_profiles"
+
+    id = Column(Integer, primary_key=True)
+    profile_hash = Column(String(64), nullable=False, unique=True)
+
+    # Canonical JSON of the decision without its per-row context.
+    decision = Column(String, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+
+__all__ = ["DecisionProfile"]
@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Integer, String, UniqueConstraint
+
+from app.database.base import Base
+
+
+class ImportCheckpoint(Base):
+    __tablename__ = "import_checkpoints"
+
+    id = Column(Integer, primary_key=True)
+    sha256 = Column(String(64), nullable=False)
+    sheet_key = Column(String(64), nullable=False)
+    rows_done = Column(Integer, nullable=False, default=0)
+    result = Column(String)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+    __table_args__ = (
+        UniqueConstraint("sha256", "sheet_key", name="uq_import_checkpoints_sha256_sheet"),
+    )
+
+
+__all__ = ["ImportCheckpoint"]
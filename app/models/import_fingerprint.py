@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Integer, String, UniqueConstraint
+
+from app.database.base import Base
+
+
+class ImportRowFingerprint(Base):
+    __tablename__ = "import_row_fingerprints"
+
+    id = Column(Integer, primary_key=True)
+    store_id = Column(Integer, nullable=False)
+    style_code = Column(String, nullable=False)
+
+    row_hash = Column(String(64), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+    __table_args__ = (
+        UniqueConstraint("store_id", "style_code", name="uq_import_row_fingerprints_store_style"),
+    )
+
+
+__all__ = ["ImportRowFingerprint"]
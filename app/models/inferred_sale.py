@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Date, ForeignKey, Integer, UniqueConstraint
+
+from app.database.base import Base
+
+
+class InferredSale(Base):
+    __tablename__ = "inferred_sales"
+
+    id = Column(Integer, primary_key=True)
+    store_id = Column(Integer, ForeignKey("stores.id"), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+
+    quantity_sold = Column(Integer, nullable=False)
+    sale_date = Column(Date, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "store_id",
+            "product_id",
+            "sale_date",
+            name="uq_inferred_sales_store_product_date",
+        ),
+    )
+
+
+__all__ = ["InferredSale"]
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer
+
+from app.database.base import Base
+
+
+class InventoryDelta(Base):
+    __tablename__ = "inventory_deltas"
+
+    id = Column(Integer, primary_key=True)
+    store_id = Column(Integer, ForeignKey("stores.id"), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+
+    observed_date = Column(Date, nullable=False)
+    previous_quantity = Column(Integer, nullable=False)
+    quantity = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("idx_inventory_deltas_date", "observed_date"),
+    )
+
+
+__all__ = ["InventoryDelta"]
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Date, ForeignKey, Integer, UniqueConstraint
+
+from app.database.base import Base
+
+
+class Purchase(Base):
+    __tablename__ = "purchases"
+
+    id = Column(Integer, primary_key=True)
+    store_id = Column(Integer, ForeignKey("stores.id"), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+
+    quantity_purchased = Column(Integer, nullable=False)
+    purchase_date = Column(Date, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "store_id",
+            "product_id",
+            "purchase_date",
+            name="uq_purchases_store_product_date",
+        ),
+    )
+
+
+__all__ = ["Purchase"]
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Date, Index, Integer, String
+
+from app.database.base import Base
+
+
+class ReportImportLine(Base):
+    __tablename__ = "report_import_lines"
+
+    id = Column(Integer, primary_key=True)
+    # The import's content hash (or a per-run key), so a resumed import finds its lines.
+    import_key = Column(String(64), nullable=False)
+    sheet_key = Column(String(64), nullable=False)
+    store_id = Column(Integer, nullable=False)
+    product_id = Column(Integer, nullable=False)
+
+    report_date = Column(Date, nullable=False)
+    quantity = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("idx_report_import_lines_import_sheet", "import_key", "sheet_key"),
+    )
+
+
+__all__ = ["ReportImportLine"]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Date, ForeignKey, Index, Integer
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer, UniqueConstraint
 
 from app.database.base import Base
 
@@ -15,6 +15,7 @@ class Sales(Base):
 
     __table_args__ = (
         Index("idx_sales_product_store_date", "product_id", "store_id", "sale_date"),
+        UniqueConstraint("store_id", "product_id", "sale_date", name="uq_sales_store_product_date"),
     )
 
 
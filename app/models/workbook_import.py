@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, UniqueConstraint
+
+from app.database.base import Base
+
+
+class WorkbookImport(Base):
+    __tablename__ = "workbook_imports"
+
+    id = Column(Integer, primary_key=True)
+    sha256 = Column(String(64), nullable=False)
+    file_path = Column(String, nullable=False)
+    file_size = Column(Integer, nullable=False)
+
+    status = Column(String(20), nullable=False, default="running")
+    attempt = Column(Integer, nullable=False, default=1)
+    result = Column(String)
+    error_message = Column(String)
+    duration_seconds = Column(Float)
+    locked_by = Column(String(120))
+
+    started_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    finished_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        UniqueConstraint("sha256", name="uq_workbook_imports_sha256"),
+        Index("idx_workbook_imports_started_at", "started_at"),
+    )
+
+
+__all__ = ["WorkbookImport"]
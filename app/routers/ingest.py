@@ -1,22 +1,102 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Response, UploadFile, status
 from openpyxl.utils.exceptions import InvalidFileException
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
 
-from app.dependencies import require_auth
-from app.schemas.inventory import ExcelIngestRequest
-from app.services.ingestion_service import import_workbook
+from app.dependencies import get_db, require_auth
+from app.schemas.inventory import (
+    ExcelIngestRequest,
+    ImportJobRead,
+    UploadIngestResponse,
+    WorkbookImportRead,
+)
+from app.services.import_history_service import list_workbook_imports
+from app.services.import_job_service import (
+    ImportQueueFullError,
+    get_import_job_manager,
+    submit_upload,
+)
+from app.services.ingestion_service import import_workbook, normalize_sheet_list
+from app.services.upload_service import UploadTooLargeError
 
 router = APIRouter(prefix="/ingest", tags=["Ingest"])
 
 
 @router.post("/excel")
-def ingest_excel(payload: ExcelIngestRequest, _auth=Depends(require_auth)):
+def ingest_excel(payload: ExcelIngestRequest, response: Response, _auth=Depends(require_auth)):
+    if payload.wait:
+        try:
+            results = import_workbook(
+                payload.path,
+                sheets=payload.sheets,
+                dry_run=payload.dry_run,
+            )
+        except (OSError, ValueError, SQLAlchemyError, InvalidFileException) as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        return {"results": results}
+
     try:
-        results = import_workbook(
+        job = get_import_job_manager().submit(
             payload.path,
             sheets=payload.sheets,
             dry_run=payload.dry_run,
         )
-    except (OSError, ValueError, SQLAlchemyError, InvalidFileException) as exc:
+    except ImportQueueFullError as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
+    except (OSError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    response.status_code = status.HTTP_202_ACCEPTED
+    return ImportJobRead.model_validate(job.to_dict())
+
+
+@router.post("/upload", response_model=UploadIngestResponse)
+def ingest_upload(
+    response: Response,
+    file: UploadFile = File(..., description="Workbook (.xlsx) or .csv/.tsv file, optionally .gz."),
+    sheets: Optional[str] = Form(None, description="Comma-separated sheets to import."),
+    dry_run: bool = Form(False),
+    _auth=Depends(require_auth),
+):
+    try:
+        upload, job = submit_upload(
+            file.file,
+            filename=file.filename,
+            sheets=normalize_sheet_list(sheets),
+            dry_run=dry_run,
+        )
+    except UploadTooLargeError as exc:
+        raise HTTPException(status_code=413, detail=str(exc)) from exc
+    except ImportQueueFullError as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
+    except (OSError, ValueError, SQLAlchemyError) as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return {"results": results}
+    finally:
+        file.file.close()
+
+    if job is not None:
+        response.status_code = status.HTTP_202_ACCEPTED
+    return UploadIngestResponse(
+        sha256=upload.sha256,
+        size=upload.size,
+        duplicate=job is None,
+        job=ImportJobRead.model_validate(job.to_dict()) if job is not None else None,
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=ImportJobRead)
+def ingest_job(job_id: str, _auth=Depends(require_auth)):
+    job = get_import_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job.to_dict()
+
+
+@router.get("/history", response_model=list[WorkbookImportRead])
+def ingest_history(
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of imports to return."),
+    db: Session = Depends(get_db),
+    _auth=Depends(require_auth),
+):
+    return list_workbook_imports(db, limit=limit)
@@ -6,9 +6,15 @@ from sqlalchemy.orm import Session
 
 from app.dependencies import get_db, require_auth
 from app.models.product import Product
-from app.schemas.product import ProductPriceOverride, ProductReadWithHistory
+from app.schemas.product import (
+    ProductPriceBulkRequest,
+    ProductPriceBulkResult,
+    ProductPriceOverride,
+    ProductReadWithHistory,
+)
 from app.services.product_service import (
     apply_price_update,
+    bulk_update_prices,
     calculate_days_active,
     load_price_history,
 )
@@ -128,4 +134,41 @@ def upsert_product_price(
     return ProductReadWithHistory(**base)
 
 
+@router.post("/price/bulk", response_model=ProductPriceBulkResult)
+def bulk_update_product_prices(
+    payload: ProductPriceBulkRequest,
+    db: Session = Depends(get_db),
+    _auth=Depends(require_auth),
+):
+    negative = sorted({item.style_code for item in payload.items if item.price < 0})
+    if negative:
+        raise HTTPException(
+            status_code=400,
+            detail="price must be non-negative: {}".format(", ".join(negative[:20])),
+        )
+
+    result = bulk_update_prices(db, [item.model_dump() for item in payload.items])
+    if result["ambiguous"]:
+        db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail="store_id is required when multiple products share a style_code: {}".format(
+                ", ".join(sorted(set(result["ambiguous"]))[:20])
+            ),
+        )
+    if result["not_found"]:
+        db.rollback()
+        raise HTTPException(
+            status_code=404,
+            detail="Products not found: {}".format(", ".join(sorted(set(result["not_found"]))[:20])),
+        )
+
+    db.commit()
+    return ProductPriceBulkResult(
+        updated=result["updated"],
+        unchanged=result["unchanged"],
+        price_changes=result["price_changes"],
+    )
+
+
 __all__ = ["router"]
@@ -1,4 +1,5 @@
-from datetime import date
+import json
+from datetime import date, datetime
 from typing import List, Optional
 
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator
@@ -34,8 +35,67 @@ class ExcelIngestRequest(BaseModel):
     path: str = Field(min_length=3, max_length=400)
     sheets: Optional[List[str]] = None
     dry_run: bool = False
+    wait: bool = False
 
     @field_validator("path", mode="before")
     @classmethod
     def _normalize_path(cls, value):
         return str(value).strip() if value is not None else value
+
+
+class WorkbookImportRead(BaseModel):
+    id: int
+    sha256: str
+    file_path: str
+    file_size: int
+    status: str
+    attempt: int
+    result: Optional[dict] = None
+    error_message: Optional[str] = None
+    duration_seconds: Optional[float] = None
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator("result", mode="before")
+    @classmethod
+    def _decode_result(cls, value):
+        if isinstance(value, str):
+            try:
+                return json.loads(value)
+            except ValueError:
+                return None
+        return value
+
+
+class ImportProgressRead(BaseModel):
+    phase: str
+    rows_parsed: int
+    rows_applied: int
+    rows_total: Optional[int] = None
+    elapsed_seconds: float
+    rows_per_second: Optional[float] = None
+    eta_seconds: Optional[float] = None
+
+
+class ImportJobRead(BaseModel):
+    id: str
+    path: str
+    sheets: Optional[List[str]] = None
+    dry_run: bool
+    workbook_import_id: Optional[int] = None
+    status: str
+    progress: ImportProgressRead
+    results: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class UploadIngestResponse(BaseModel):
+    sha256: str
+    size: int
+    duplicate: bool
+    job: Optional[ImportJobRead] = None
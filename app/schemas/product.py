@@ -53,3 +53,19 @@ class ProductReadWithHistory(ProductRead):
     last_price_update: Optional[datetime] = None
     days_active: Optional[int] = None
     price_history: List[PriceHistoryRead] = Field(default_factory=list)
+
+
+class ProductPriceBulkItem(BaseModel):
+    style_code: str
+    price: float
+    store_id: Optional[int] = None
+
+
+class ProductPriceBulkRequest(BaseModel):
+    items: List[ProductPriceBulkItem] = Field(default_factory=list)
+
+
+class ProductPriceBulkResult(BaseModel):
+    updated: int
+    unchanged: int
+    price_changes: List[dict] = Field(default_factory=list)
@@ -1,21 +1,25 @@
-import json
 from datetime import date, timedelta
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, insert, inspect, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.config import get_settings
 from app.core.aging_rules import classify_status_with_default
 from app.core.danger_rules import danger_level
-from app.core.decision_engine import evaluate_inventory
+from app.core.decision_engine import decision_profile, decision_profile_key
+from app.core.demand_rules import demand_band
 from app.database import SessionLocal
 from app.models.alert import Alert
 from app.models.daily_snapshot import DailySnapshot
 from app.models.inventory import Inventory
 from app.models.product import Product
 from app.models.stores import Store
-from app.services.ml_service import predict_and_log
+from app.services.decision_profile_service import get_or_create_decision_profile
+from app.services.ml_service import predict_and_log_batch
 from app.services.notification_service import send_inventory_alert
+from app.services.sales_service import load_lifecycle_report_totals, load_recent_sales_totals
 from app.services.whatsapp_service import send_whatsapp
 
 settings = get_settings()
@@ -25,6 +29,8 @@ _STATUS_RANK = {
     "RR_TT": 2,
     "VERY_DANGER": 3,
 }
+_SNAPSHOT_BATCH_SIZE = 1000
+_SNAPSHOT_KEY = ("snapshot_date", "store_id", "product_id")
 _ALERT_PRIORITY = {
     "RULE-CRITICAL": 300,
     "RULE-HIGH": 250,
@@ -34,17 +40,54 @@ _ALERT_PRIORITY = {
 }
 
 
-def _build_style_store_index(inventories, today):
+def _peer_rank(item):
+    return (
+        _STATUS_RANK.get(item["status"], 99),
+        item["age_days"],
+        item["quantity"],
+    )
+
+
+def _add_style_peer(peers, item):
+    """Keep ``peers`` as [best, runner-up]; the runner-up is from a different store.
+
+    That is all ``build_transfer_hint`` needs: whichever store asks, its best
+    peer is the best entry or, if that entry is its own, the runner-up. Ties
+    keep the entry seen first, as ``min`` over the full list would.
+    """
+    if not peers:
+        peers.append(item)
+        return
+    best = peers[0]
+    runner_up = peers[1] if len(peers) > 1 else None
+    if _peer_rank(item) < _peer_rank(best):
+        if item["store_id"] != best["store_id"]:
+            runner_up = best
+        peers[:] = [item] if runner_up is None else [item, runner_up]
+    elif item["store_id"] != best["store_id"] and (
+        runner_up is None or _peer_rank(item) < _peer_rank(runner_up)
+    ):
+        peers[1:] = [item]
+
+
+def build_style_store_index(rows, today):
+    """Best and runner-up store entry per style code, for ``build_transfer_hint``.
+
+    ``rows`` are inventory rows with ``style_code``, ``category``,
+    ``store_name`` and ``store_city``; store id, quantity and lifecycle start
+    are read from ``row.Inventory`` when present, else from the row itself.
+    """
     style_store_index = {}
-    for row in inventories:
-        inv = row.Inventory
+    for row in rows:
+        inv = getattr(row, "Inventory", row)
         style_code = (row.style_code or "").strip()
         if not style_code:
             continue
 
         age_days = (today - inv.lifecycle_start_date).days
         status = classify_status_with_default(row.category, age_days)
-        style_store_index.setdefault(style_code, []).append(
+        _add_style_peer(
+            style_store_index.setdefault(style_code, []),
             {
                 "store_id": inv.store_id,
                 "store_name": row.store_name,
@@ -52,7 +95,7 @@ def _build_style_store_index(inventories, today):
                 "age_days": age_days,
                 "status": status,
                 "quantity": inv.quantity,
-            }
+            },
         )
     return style_store_index
 
@@ -67,14 +110,7 @@ def build_transfer_hint(style_code, style_store_index, current_store_id):
     if not peers:
         return "No peer-store data for this style yet."
 
-    best_store = min(
-        peers,
-        key=lambda item: (
-            _STATUS_RANK.get(item["status"], 99),
-            item["age_days"],
-            item["quantity"],
-        ),
-    )
+    best_store = min(peers, key=_peer_rank)
 
     store_id_value = str(best_store.get("store_id")).strip()
     store_name_value = str(best_store.get("store_name") or "").strip()
@@ -126,48 +162,99 @@ def _format_store_label(store_id, store_name, store_city):
     return label
 
 
-def alert_already_sent(db, alert_date, alert_type, category, phone):
-    stmt = (
-        select(Alert.id)
-        .where(
-            Alert.alert_date == alert_date,
-            Alert.alert_type == alert_type,
-            Alert.category == category,
-            Alert.phone_number == phone,
-            Alert.delivered.is_(True),
-        )
-        .limit(1)
+def _load_alert_index(db, since_date):
+    """Alerts dated ``since_date`` or later, keyed by (date, type, category, phone).
+
+    One query answers the dedup, cooldown and upsert checks for a whole run.
+    """
+    return {
+        (alert.alert_date, alert.alert_type, alert.category, alert.phone_number): alert
+        for alert in db.execute(select(Alert).where(Alert.alert_date >= since_date)).scalars()
+    }
+
+
+def _has_snapshot_unique_key(db):
+    inspector = inspect(db.connection())
+    key = list(_SNAPSHOT_KEY)
+    return any(
+        constraint["column_names"] == key
+        for constraint in inspector.get_unique_constraints(DailySnapshot.__tablename__)
+    ) or any(
+        index["unique"] and index["column_names"] == key
+        for index in inspector.get_indexes(DailySnapshot.__tablename__)
     )
-    return db.execute(stmt).first() is not None
 
 
-def _find_existing_alert(db, alert_date, alert_type, category, phone):
-    stmt = (
-        select(Alert)
-        .where(
-            Alert.alert_date == alert_date,
-            Alert.alert_type == alert_type,
-            Alert.category == category,
-            Alert.phone_number == phone,
-        )
-        .limit(1)
+def _snapshot_insert_factory(db):
+    """The dialect ``insert`` to upsert snapshots with, or ``None`` to match stored keys instead.
+
+    ``ON CONFLICT`` needs the unique (snapshot_date, store_id, product_id)
+    key, which a table created before it may still lack: SQLite leaves it
+    out while other tables' duplicates block it, and PostgreSQL tables are
+    never migrated.
+    """
+    dialect_name = db.get_bind().dialect.name
+    insert_factory = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}.get(dialect_name)
+    if insert_factory is None or not _has_snapshot_unique_key(db):
+        return None
+    return insert_factory
+
+
+def _load_snapshot_keys(db, snapshot_date):
+    """(snapshot_date, store_id, product_id) of the snapshots already stored for ``snapshot_date``."""
+    stmt = select(*(getattr(DailySnapshot, name) for name in _SNAPSHOT_KEY)).where(
+        DailySnapshot.snapshot_date == snapshot_date
     )
-    return db.execute(stmt).scalar_one_or_none()
-
-
-def _recent_alert_sent(db, *, since_date, alert_type, category, phone):
-    stmt = (
-        select(Alert.id)
-        .where(
-            Alert.alert_date >= since_date,
-            Alert.alert_type == alert_type,
-            Alert.category == category,
-            Alert.phone_number == phone,
-            Alert.delivered.is_(True),
-        )
-        .limit(1)
+    return {tuple(row) for row in db.execute(stmt)}
+
+
+def _upsert_daily_snapshots(db, snapshot_rows, insert_factory, snapshot_keys=None):
+    """Write ``snapshot_rows`` (column dicts) keyed on (snapshot_date, store_id, product_id).
+
+    With an ``insert_factory`` from ``_snapshot_insert_factory`` they take one
+    executemany ``INSERT ... ON CONFLICT DO UPDATE``. Otherwise
+    ``snapshot_keys``, the stored keys from ``_load_snapshot_keys``, splits
+    them into an executemany INSERT and a keyed UPDATE, and gains the
+    inserted keys so later batches update those rows.
+    """
+    if not snapshot_rows:
+        return
+    if insert_factory is None:
+        inserts = []
+        updates = []
+        for values in snapshot_rows:
+            key = tuple(values[name] for name in _SNAPSHOT_KEY)
+            if key in snapshot_keys:
+                updates.append(
+                    {
+                        **{name: value for name, value in values.items() if name not in _SNAPSHOT_KEY},
+                        **{f"key_{name}": value for name, value in zip(_SNAPSHOT_KEY, key)},
+                    }
+                )
+            else:
+                inserts.append(values)
+                snapshot_keys.add(key)
+        if inserts:
+            db.execute(insert(DailySnapshot), inserts)
+        if updates:
+            table = DailySnapshot.__table__
+            db.execute(
+                update(table).where(
+                    *(table.c[name] == bindparam(f"key_{name}") for name in _SNAPSHOT_KEY)
+                ),
+                updates,
+            )
+        return
+    stmt = insert_factory(DailySnapshot)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(_SNAPSHOT_KEY),
+        set_={
+            name: stmt.excluded[name]
+            for name in snapshot_rows[0]
+            if name not in _SNAPSHOT_KEY
+        },
     )
-    return db.execute(stmt).first() is not None
+    db.execute(stmt, snapshot_rows)
 
 
 def _resolve_ml_reason(ml_risk):
@@ -238,7 +325,9 @@ def run_alerts(*, send_notifications=True, always_send=None):
         .outerjoin(Store, Store.id == Inventory.store_id)
         .order_by(Inventory.lifecycle_start_date.asc(), Inventory.quantity.desc())
     ).all()
-    style_store_index = _build_style_store_index(inventories, today)
+    style_store_index = build_style_store_index(inventories, today)
+    sold_totals, purchased_totals = load_lifecycle_report_totals(db)
+    recent_sales = load_recent_sales_totals(db, today - timedelta(days=29))
 
     sent_alerts = set()
     recipient_alert_counts = {}
@@ -253,14 +342,13 @@ def run_alerts(*, send_notifications=True, always_send=None):
     stats = {"snapshots": 0, "alerts": 0}
 
     try:
-        existing_snapshots = {
-            (snapshot.store_id, snapshot.product_id): snapshot
-            for snapshot in db.execute(
-                select(DailySnapshot).where(DailySnapshot.snapshot_date == today)
-            ).scalars()
-        }
-
-        alert_candidates = []
+        snapshot_insert = _snapshot_insert_factory(db)
+        snapshot_keys = _load_snapshot_keys(db, today) if snapshot_insert is None else None
+        # Keyed so a batch never upserts the same row twice; the last row wins.
+        pending_snapshots = {}
+        decision_profile_ids = {}
+        risk_inputs = []
+        pending_candidates = []
 
         for row in inventories:
             inv = row.Inventory
@@ -271,7 +359,6 @@ def run_alerts(*, send_notifications=True, always_send=None):
             supplier_name = (row.supplier_name or "").strip() or "N/A"
             image_url = row.image_url
             store_label = _format_store_label(inv.store_id, row.store_name, row.store_city)
-            transfer_hint = build_transfer_hint(style_code, style_store_index, inv.store_id)
 
             age = (today - inv.lifecycle_start_date).days
             status = classify_status_with_default(category, age)
@@ -283,55 +370,54 @@ def run_alerts(*, send_notifications=True, always_send=None):
             if mrp_value is None or mrp_value <= 0:
                 mrp_value = unit_price
 
-            decision = evaluate_inventory(
-                category=category,
-                age_days=age,
-                demand_band="M",
-                danger_level=danger,
-            )
-
-            snapshot_key = (inv.store_id, inv.product_id)
-            snapshot = existing_snapshots.get(snapshot_key)
-            if snapshot is None:
-                snapshot = DailySnapshot(
-                    snapshot_date=today,
-                    store_id=inv.store_id,
-                    product_id=inv.product_id,
-                )
-                existing_snapshots[snapshot_key] = snapshot
-                db.add(snapshot)
-
-            snapshot.age_days = age
-            snapshot.status = status
-            snapshot.demand_band = "M"
-            snapshot.quantity = inv.quantity
-            snapshot.cost_price = unit_price
-            snapshot.mrp = mrp_value
-            snapshot.stock_value = inv.quantity * unit_price
-            snapshot.decision = json.dumps(decision)
+            rolling_30_sales = recent_sales.get((inv.store_id, inv.product_id), 0)
+            # Stock averaged over the window: what is left now plus half of what sold.
+            band = demand_band(rolling_30_sales, inv.quantity + rolling_30_sales / 2)
+            # Snapshots reference a shared profile; the context is the row's own
+            # category and age_days.
+            profile_key = decision_profile_key(age, band, danger)
+            profile_id = decision_profile_ids.get(profile_key)
+            if profile_id is None:
+                profile_id = get_or_create_decision_profile(db, decision_profile(*profile_key))
+                decision_profile_ids[profile_key] = profile_id
+
+            pending_snapshots[(inv.store_id, inv.product_id)] = {
+                "snapshot_date": today,
+                "store_id": inv.store_id,
+                "product_id": inv.product_id,
+                "age_days": age,
+                "status": status,
+                "demand_band": band,
+                "quantity": inv.quantity,
+                "cost_price": unit_price,
+                "mrp": mrp_value,
+                "stock_value": inv.quantity * unit_price,
+                "decision_profile_id": profile_id,
+            }
             stats["snapshots"] += 1
+            if len(pending_snapshots) >= _SNAPSHOT_BATCH_SIZE:
+                _upsert_daily_snapshots(
+                    db, list(pending_snapshots.values()), snapshot_insert, snapshot_keys
+                )
+                pending_snapshots.clear()
 
-            ml_risk = predict_and_log(
-                db=db,
-                category=category,
-                quantity=inv.quantity,
-                cost_price=unit_price,
-                lifecycle_start_date=inv.lifecycle_start_date,
-                current_price=inv.current_price,
-                mrp=mrp_value,
-                store_id=inv.store_id,
-                product_id=inv.product_id,
+            risk_inputs.append(
+                {
+                    "category": category,
+                    "quantity": inv.quantity,
+                    "cost_price": unit_price,
+                    "lifecycle_start_date": inv.lifecycle_start_date,
+                    "current_price": inv.current_price,
+                    "mrp": mrp_value,
+                    "store_id": inv.store_id,
+                    "product_id": inv.product_id,
+                }
             )
-
             if str(status or "").strip().upper() == "HEALTHY":
+                pending_candidates.append(None)
                 continue
 
-            capital_value = inv.quantity * unit_price
-            alert_reason = _resolve_alert_reason(danger, ml_risk)
-            if _is_low_signal_ml_alert(alert_reason, danger, capital_value):
-                continue
-
-            alert_candidates.append(
+            pending_candidates.append(
                 {
                     "row": row,
                     "category": category,
@@ -340,15 +426,43 @@ def run_alerts(*, send_notifications=True, always_send=None):
                     "supplier_name": supplier_name,
                     "image_url": image_url,
                     "store_label": store_label,
-                    "transfer_hint": transfer_hint,
                     "status": status,
                     "age": age,
-                    "ml_risk": ml_risk,
-                    "capital_value": capital_value,
-                    "alert_reason": alert_reason,
+                    "danger": danger,
+                    "capital_value": inv.quantity * unit_price,
                 }
             )
 
+        _upsert_daily_snapshots(db, list(pending_snapshots.values()), snapshot_insert, snapshot_keys)
+        pending_snapshots.clear()
+
+        # Every row is scored (and logged) in one model call rather than one per row.
+        ml_risks = predict_and_log_batch(db, risk_inputs)
+
+        alert_candidates = []
+        for candidate, ml_risk in zip(pending_candidates, ml_risks):
+            if candidate is None:
+                continue
+            alert_reason = _resolve_alert_reason(candidate["danger"], ml_risk)
+            if _is_low_signal_ml_alert(alert_reason, candidate["danger"], candidate["capital_value"]):
+                continue
+            candidate["ml_risk"] = ml_risk
+            candidate["alert_reason"] = alert_reason
+            candidate["transfer_hint"] = build_transfer_hint(
+                candidate["style_code"],
+                style_store_index,
+                candidate["row"].Inventory.store_id,
+            )
+            alert_candidates.append(candidate)
+
+        alert_index = _load_alert_index(db, cooldown_start)
+        recently_delivered = {
+            (alert_type, alert_category, alert_phone)
+            for (alert_date, alert_type, alert_category, alert_phone), alert in alert_index.items()
+            if alert.delivered and alert_date >= cooldown_start
+        }
+        new_alerts = []
+
         alert_candidates.sort(
             key=lambda item: _alert_sort_key(
                 item["alert_reason"],
@@ -378,39 +492,20 @@ def run_alerts(*, send_notifications=True, always_send=None):
                 if alert_key in sent_alerts:
                     continue
 
+                existing_alert = alert_index.get(alert_key)
                 if not always_send_enabled:
-                    if _recent_alert_sent(
-                        db,
-                        since_date=cooldown_start,
-                        alert_type=alert_reason,
-                        category=category,
-                        phone=phone,
-                    ):
-                        sent_alerts.add(alert_key)
-                        continue
-
-                existing_alert = _find_existing_alert(
-                    db,
-                    alert_date=today,
-                    alert_type=alert_reason,
-                    category=category,
-                    phone=phone,
-                )
-
-                if not always_send_enabled:
-                    if alert_already_sent(
-                        db,
-                        alert_date=today,
-                        alert_type=alert_reason,
-                        category=category,
-                        phone=phone,
+                    # Cooldown window first, then today's delivered alert.
+                    if (alert_reason, category, phone) in recently_delivered or (
+                        existing_alert is not None and existing_alert.delivered
                     ):
                         sent_alerts.add(alert_key)
                         continue
 
                 mrp_display = "{:,.0f}".format(mrp_value)
                 cbs_qty_display = str(inv.quantity)
-                sold_report_display = "0"
+                report_key = (inv.store_id, inv.product_id)
+                purchase_report_display = str(purchased_totals.get(report_key, 0))
+                sold_report_display = str(sold_totals.get(report_key, 0))
                 message = (
                     "\u26A0 INVENTORY ALERT ({})\n\n"
                     "Department: {}\n"
@@ -420,7 +515,7 @@ def run_alerts(*, send_notifications=True, always_send=None):
                     "Branch: {}\n"
                     "Stock Days: {}\n"
                     "Aging: {}\n"
-                    "Purchase Report: 0\n"
+                    "Purchase Report: {}\n"
                     "Sold Report: {}\n"
                     "CBS Qty: {}\n"
                 ).format(
@@ -432,6 +527,7 @@ def run_alerts(*, send_notifications=True, always_send=None):
                     candidate["store_label"],
                     candidate["age"],
                     candidate["status"],
+                    purchase_report_display,
                     sold_report_display,
                     cbs_qty_display,
                 )
@@ -463,19 +559,19 @@ def run_alerts(*, send_notifications=True, always_send=None):
                         failure_reason = " | ".join(channel_failures)
 
                 if existing_alert is None:
-                    db.add(
-                        Alert(
-                            alert_date=today,
-                            alert_type=alert_reason,
-                            category=category,
-                            store_id=inv.store_id,
-                            recipient=recipient_name,
-                            phone_number=phone,
-                            message=message,
-                            capital_value=capital_value,
-                            delivered=delivered,
-                            failure_reason=failure_reason,
-                        )
+                    new_alerts.append(
+                        {
+                            "alert_date": today,
+                            "alert_type": alert_reason,
+                            "category": category,
+                            "store_id": inv.store_id,
+                            "recipient": recipient_name,
+                            "phone_number": phone,
+                            "message": message,
+                            "capital_value": capital_value,
+                            "delivered": delivered,
+                            "failure_reason": failure_reason,
+                        }
                     )
                 else:
                     existing_alert.store_id = inv.store_id
@@ -489,6 +585,8 @@ def run_alerts(*, send_notifications=True, always_send=None):
                 stats["alerts"] += 1
                 sent_alerts.add(alert_key)
 
+        if new_alerts:
+            db.execute(insert(Alert), new_alerts)
         db.commit()
     except SQLAlchemyError:
         db.rollback()
@@ -7,6 +7,8 @@ from urllib.parse import urlparse
 import requests
 from dotenv import load_dotenv
 
+from app.services.image_service import RENDITION_TELEGRAM, find_rendition
+
 logger = logging.getLogger(__name__)
 
 _TELEGRAM_SEND_MESSAGE_URL = "https://api.telegram.org/bot{}/sendMessage"
@@ -165,7 +167,7 @@ def _send_photo(
 
     try:
         if source_kind == "local":
-            image_path = Path(source_value)
+            image_path = find_rendition(Path(source_value), RENDITION_TELEGRAM) or Path(source_value)
             with image_path.open("rb") as image_file:
                 response = requests.post(
                     photo_url,
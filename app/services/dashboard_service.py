@@ -5,6 +5,7 @@ from sqlalchemy import text
 from app.core.aging_rules import classify_status_with_default
 from app.core.danger_rules import calculate_age_in_days, danger_level
 from app.database.engine import engine
+from app.services.image_service import RENDITION_THUMB, rendition_url
 
 AGING_STATUS_ALIASES = {
     "healthy": "HEALTHY",
@@ -261,6 +262,7 @@ def inventory_by_status(status_filters=None, store_query=None, store_id=None, li
             "department_name": row.get("department_name"),
             "supplier_name": row.get("supplier_name"),
             "image_url": row.get("image_url"),
+            "thumbnail_url": rendition_url(row.get("image_url"), RENDITION_THUMB),
             "store_id": store_value,
             "quantity": row.get("quantity") or 0,
             "age_days": age_days,
@@ -0,0 +1,65 @@
+import json
+from collections.abc import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.decision_encoding import encode_decision_profile
+from app.core.decision_engine import decision_with_context
+from app.models.daily_snapshot import DailySnapshot
+from app.models.decision_profile import DecisionProfile
+from app.models.product import Product
+
+
+def get_or_create_decision_profile(db: Session, profile: dict) -> int:
+    """Return the ``decision_profiles`` id for ``profile``, inserting the row if it is new."""
+    profile_hash, encoded = encode_decision_profile(profile)
+    profile_id = db.execute(
+        select(DecisionProfile.id).where(DecisionProfile.profile_hash == profile_hash)
+    ).scalar_one_or_none()
+    if profile_id is None:
+        row = DecisionProfile(profile_hash=profile_hash, decision=encoded)
+        db.add(row)
+        db.flush()
+        profile_id = row.id
+    return profile_id
+
+
+def load_decision_profiles(db: Session, profile_ids: Iterable[int]) -> dict[int, dict]:
+    profile_ids = list(set(profile_ids))
+    if not profile_ids:
+        return {}
+    stmt = select(DecisionProfile.id, DecisionProfile.decision).where(DecisionProfile.id.in_(profile_ids))
+    return {profile_id: json.loads(decision) for profile_id, decision in db.execute(stmt)}
+
+
+def load_snapshot_decisions(
+    db: Session,
+    snapshots: Iterable[DailySnapshot],
+    batch_size: int = 500,
+) -> list[dict]:
+    """Decode each snapshot's decision back to the full ``evaluate_inventory`` result.
+
+    The context is rebuilt from the snapshot's ``age_days`` and its product's
+    category. Results are in ``snapshots`` order.
+    """
+    snapshots = list(snapshots)
+    profiles = load_decision_profiles(db, (snapshot.decision_profile_id for snapshot in snapshots))
+    product_ids = sorted({snapshot.product_id for snapshot in snapshots})
+    categories = {}
+    for start in range(0, len(product_ids), batch_size):
+        stmt = select(Product.id, Product.category).where(
+            Product.id.in_(product_ids[start:start + batch_size])
+        )
+        categories.update((product_id, category) for product_id, category in db.execute(stmt))
+    return [
+        decision_with_context(
+            profiles[snapshot.decision_profile_id],
+            categories.get(snapshot.product_id),
+            snapshot.age_days,
+        )
+        for snapshot in snapshots
+    ]
+
+
+__all__ = ["get_or_create_decision_profile", "load_decision_profiles", "load_snapshot_decisions"]
@@ -0,0 +1,106 @@
+import logging
+from pathlib import Path
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from app.core.constants import PDF_IMAGE_SIZE, STATIC_DIR
+
+logger = logging.getLogger(__name__)
+
+RENDITION_PDF = "pdf"
+RENDITION_TELEGRAM = "telegram"
+RENDITION_THUMB = "thumb"
+
+# name -> (size, format, mode). "cover" crops to exactly ``size``; "contain"
+# only shrinks the picture to fit inside it.
+RENDITIONS = {
+    # The PDF report's image cell, in points (1 px per point, as drawn before).
+    RENDITION_PDF: (PDF_IMAGE_SIZE, "JPEG", "cover"),
+    # Telegram recompresses photos to 1280 px on the long side; larger uploads are wasted.
+    RENDITION_TELEGRAM: ((1280, 1280), "JPEG", "contain"),
+    # Dashboard table thumbnail (44 px CSS box) at 2x for high-density screens.
+    RENDITION_THUMB: ((96, 96), "WEBP", "cover"),
+}
+_FORMAT_EXTENSIONS = {"JPEG": ".jpg", "WEBP": ".webp"}
+_SAVE_OPTIONS = {
+    "JPEG": {"quality": 85, "optimize": True, "progressive": True},
+    "WEBP": {"quality": 80, "method": 4},
+}
+
+
+def rendition_path(path: Path, name: str) -> Path:
+    """Where the ``name`` rendition of the image at ``path`` lives: ``<stem>.<name><ext>``."""
+    _, image_format, _ = RENDITIONS[name]
+    return path.with_name(f"{path.stem}.{name}{_FORMAT_EXTENSIONS[image_format]}")
+
+
+def has_renditions(path: Path) -> bool:
+    """Whether every standard rendition of the image at ``path`` exists."""
+    return all(rendition_path(path, name).is_file() for name in RENDITIONS)
+
+
+def find_rendition(path: Path | None, name: str) -> Path | None:
+    if path is None:
+        return None
+    candidate = rendition_path(Path(path), name)
+    return candidate if candidate.is_file() else None
+
+
+def rendition_url(image_url, name: str) -> str | None:
+    """URL of the ``name`` rendition for a ``/static/...`` image URL, if it was generated."""
+    value = str(image_url or "").strip()
+    if not value.startswith("/static/"):
+        return None
+    rendition = find_rendition(STATIC_DIR / value.removeprefix("/static/"), name)
+    if rendition is None:
+        return None
+    return "{}/{}".format(value.rsplit("/", 1)[0], rendition.name)
+
+
+def _flatten(image: Image.Image) -> Image.Image:
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        rgba = image.convert("RGBA")
+        background = Image.new("RGB", rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+def create_renditions(path: Path) -> list[Path]:
+    """Write every standard rendition next to the original image at ``path``.
+
+    Returns the paths written; an unreadable image gets none and consumers
+    fall back to the original.
+    """
+    path = Path(path)
+    written = []
+    try:
+        with Image.open(path) as source:
+            source = _flatten(ImageOps.exif_transpose(source))
+            for name, (size, image_format, mode) in RENDITIONS.items():
+                if mode == "cover":
+                    rendered = ImageOps.fit(source, size, method=Image.Resampling.LANCZOS)
+                else:
+                    rendered = source.copy()
+                    rendered.thumbnail(size, Image.Resampling.LANCZOS)
+                target = rendition_path(path, name)
+                temp_path = target.with_name(f".{target.name}.tmp")
+                rendered.save(temp_path, format=image_format, **_SAVE_OPTIONS[image_format])
+                temp_path.replace(target)
+                written.append(target)
+    except (OSError, UnidentifiedImageError, ValueError):
+        logger.warning("Could not create renditions for %s.", path, exc_info=True)
+    return written
+
+
+__all__ = [
+    "RENDITIONS",
+    "RENDITION_PDF",
+    "RENDITION_TELEGRAM",
+    "RENDITION_THUMB",
+    "create_renditions",
+    "find_rendition",
+    "has_renditions",
+    "rendition_path",
+    "rendition_url",
+]
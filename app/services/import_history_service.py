@@ -0,0 +1,229 @@
+import hashlib
+import json
+import logging
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.import_checkpoint import ImportCheckpoint
+from app.models.workbook_import import WorkbookImport
+
+logger = logging.getLogger(__name__)
+
+STATUS_RUNNING = "running"
+STATUS_SUCCESS = "success"
+STATUS_FAILED = "failed"
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _utc_now():
+    return datetime.now(timezone.utc)
+
+
+def _ensure_utc(value):
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _owner_id():
+    return "{}:{}".format(socket.gethostname(), os.getpid())
+
+
+def _truncate_error(value, limit=1000):
+    return str(value or "")[:limit]
+
+
+def compute_file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def summarize_import_results(results):
+    summary = {}
+    for sheet_name, counts in (results or {}).items():
+        summary[sheet_name] = {
+            key: len(value) if isinstance(value, list) else value
+            for key, value in counts.items()
+        }
+    return summary
+
+
+def claim_workbook_import(*, sha256, file_path, file_size, stale_seconds=None):
+    """Reserve the import of a workbook by content hash.
+
+    Returns the claimed ``WorkbookImport`` row, or ``None`` when identical
+    content was already imported or is being imported by another worker.
+    """
+    if stale_seconds is None:
+        stale_seconds = get_settings().EXCEL_IMPORT_STALE_SECONDS
+    now = _utc_now()
+    owner = _owner_id()
+    db = SessionLocal()
+    try:
+        record = WorkbookImport(
+            sha256=sha256,
+            file_path=str(file_path),
+            file_size=int(file_size),
+            status=STATUS_RUNNING,
+            attempt=1,
+            started_at=now,
+            locked_by=owner,
+        )
+        db.add(record)
+        db.commit()
+        db.refresh(record)
+        return record
+    except IntegrityError:
+        db.rollback()
+        existing = db.execute(
+            select(WorkbookImport).where(WorkbookImport.sha256 == sha256)
+        ).scalar_one()
+
+        if existing.status == STATUS_SUCCESS:
+            return None
+        if existing.status == STATUS_RUNNING:
+            started_at = _ensure_utc(existing.started_at)
+            if started_at and now - started_at <= timedelta(seconds=stale_seconds):
+                return None
+
+        result = db.execute(
+            update(WorkbookImport)
+            .where(
+                WorkbookImport.id == existing.id,
+                WorkbookImport.status == existing.status,
+                WorkbookImport.attempt == existing.attempt,
+            )
+            .values(
+                file_path=str(file_path),
+                file_size=int(file_size),
+                status=STATUS_RUNNING,
+                attempt=existing.attempt + 1,
+                result=None,
+                error_message=None,
+                duration_seconds=None,
+                locked_by=owner,
+                started_at=now,
+                finished_at=None,
+            )
+        )
+        if result.rowcount != 1:
+            db.rollback()
+            return None
+        db.commit()
+        db.refresh(existing)
+        return existing
+    finally:
+        db.close()
+
+
+def complete_workbook_import(import_id, results, duration_seconds):
+    _execute_import_update(
+        import_id,
+        {
+            "status": STATUS_SUCCESS,
+            "result": json.dumps(summarize_import_results(results), sort_keys=True),
+            "error_message": None,
+            "duration_seconds": float(duration_seconds),
+            "finished_at": _utc_now(),
+        },
+    )
+
+
+def fail_workbook_import(import_id, error, duration_seconds):
+    _execute_import_update(
+        import_id,
+        {
+            "status": STATUS_FAILED,
+            "error_message": _truncate_error("{}: {}".format(type(error).__name__, error)),
+            "duration_seconds": float(duration_seconds),
+            "finished_at": _utc_now(),
+        },
+    )
+
+
+def _execute_import_update(import_id, values):
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(WorkbookImport)
+            .where(WorkbookImport.id == import_id)
+            .values(**values)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def list_workbook_imports(db, *, limit=50):
+    stmt = (
+        select(WorkbookImport)
+        .order_by(WorkbookImport.started_at.desc(), WorkbookImport.id.desc())
+        .limit(max(1, int(limit)))
+    )
+    return list(db.execute(stmt).scalars())
+
+
+def load_import_checkpoints(db, sha256):
+    """Return ``{sheet_key: (rows_done, counts)}`` recorded for a file's content hash."""
+    rows = db.execute(
+        select(ImportCheckpoint).where(ImportCheckpoint.sha256 == sha256)
+    ).scalars()
+    checkpoints = {}
+    for checkpoint in rows:
+        try:
+            counts = json.loads(checkpoint.result) if checkpoint.result else {}
+        except ValueError:
+            counts = {}
+        checkpoints[checkpoint.sheet_key] = (checkpoint.rows_done, counts)
+    return checkpoints
+
+
+def save_import_checkpoint(db, *, sha256, sheet_key, rows_done, counts):
+    """Stage a checkpoint in ``db``; it commits together with the rows it covers."""
+    checkpoint = db.execute(
+        select(ImportCheckpoint).where(
+            ImportCheckpoint.sha256 == sha256,
+            ImportCheckpoint.sheet_key == sheet_key,
+        )
+    ).scalar_one_or_none()
+    if checkpoint is None:
+        checkpoint = ImportCheckpoint(sha256=sha256, sheet_key=sheet_key)
+        db.add(checkpoint)
+    checkpoint.rows_done = int(rows_done)
+    checkpoint.result = json.dumps(
+        {key: value for key, value in counts.items() if not isinstance(value, list)},
+        sort_keys=True,
+    )
+    checkpoint.updated_at = _utc_now()
+
+
+def clear_import_checkpoints(db, sha256):
+    db.execute(delete(ImportCheckpoint).where(ImportCheckpoint.sha256 == sha256))
+
+
+__all__ = [
+    "STATUS_FAILED",
+    "STATUS_RUNNING",
+    "STATUS_SUCCESS",
+    "claim_workbook_import",
+    "clear_import_checkpoints",
+    "complete_workbook_import",
+    "compute_file_sha256",
+    "fail_workbook_import",
+    "list_workbook_imports",
+    "load_import_checkpoints",
+    "save_import_checkpoint",
+    "summarize_import_results",
+]
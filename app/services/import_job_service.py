@@ -0,0 +1,322 @@
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from openpyxl.utils.exceptions import InvalidFileException
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import get_settings
+from app.services.import_history_service import (
+    claim_workbook_import,
+    complete_workbook_import,
+    fail_workbook_import,
+)
+from app.services.ingestion_service import check_import_path, import_workbook
+from app.services.upload_service import spool_upload
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCESS = "success"
+STATUS_FAILED = "failed"
+
+IMPORT_JOB_EXCEPTIONS = (OSError, ValueError, SQLAlchemyError, InvalidFileException)
+
+_FINISHED_STATUSES = (STATUS_SUCCESS, STATUS_FAILED)
+
+
+class ImportQueueFullError(RuntimeError):
+    pass
+
+
+class ImportProgress:
+    """Counters an import updates from its own thread; readers take snapshots."""
+
+    def __init__(self):
+        self.phase = STATUS_QUEUED
+        self.rows_parsed = 0
+        self.rows_applied = 0
+        self.rows_total = None
+        self._started = None
+        self._apply_started = None
+        self._finished = None
+
+    def start(self):
+        self._started = time.monotonic()
+
+    def finish(self, phase):
+        self.phase = phase
+        self._finished = time.monotonic()
+
+    def set_phase(self, phase):
+        if phase == "applying" and self._apply_started is None:
+            self._apply_started = time.monotonic()
+        self.phase = phase
+
+    def set_total(self, total):
+        self.rows_total = total
+
+    def add_parsed(self, count):
+        self.rows_parsed += count
+
+    def add_applied(self, count):
+        if self._apply_started is None:
+            self._apply_started = time.monotonic()
+        self.rows_applied += count
+
+    def snapshot(self):
+        now = self._finished or time.monotonic()
+        elapsed = now - self._started if self._started is not None else 0.0
+        rows_per_second = None
+        eta_seconds = None
+        if self._apply_started is not None and self.rows_applied:
+            apply_elapsed = now - self._apply_started
+            if apply_elapsed > 0:
+                rows_per_second = round(self.rows_applied / apply_elapsed, 1)
+        if self._finished is None and rows_per_second and self.rows_total is not None:
+            eta_seconds = round(max(0, self.rows_total - self.rows_applied) / rows_per_second, 1)
+        return {
+            "phase": self.phase,
+            "rows_parsed": self.rows_parsed,
+            "rows_applied": self.rows_applied,
+            "rows_total": self.rows_total,
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": rows_per_second,
+            "eta_seconds": eta_seconds,
+        }
+
+
+class ImportJob:
+    def __init__(self, *, path, sheets, dry_run, workbook_import_id=None, source_sha256=None):
+        self.id = uuid.uuid4().hex
+        self.path = str(path)
+        self.sheets = sheets
+        self.dry_run = dry_run
+        self.workbook_import_id = workbook_import_id
+        # Already known from spooling or claiming, so the import need not hash the file again.
+        self.source_sha256 = source_sha256
+        self.status = STATUS_QUEUED
+        self.progress = ImportProgress()
+        self.results = None
+        self.error = None
+        self.created_at = datetime.now(timezone.utc)
+        self.started_at = None
+        self.finished_at = None
+        self._done = threading.Event()
+
+    def wait(self, timeout=None):
+        """Block until the job has finished; returns ``False`` if ``timeout`` ran out first."""
+        return self._done.wait(timeout)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "path": self.path,
+            "sheets": self.sheets,
+            "dry_run": self.dry_run,
+            "workbook_import_id": self.workbook_import_id,
+            "source_sha256": self.source_sha256,
+            "status": self.status,
+            "progress": self.progress.snapshot(),
+            "results": self.results,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class ImportJobManager:
+    """Runs imports on a small thread pool and keeps recent jobs in memory.
+
+    ``max_concurrent`` bounds how many imports write at once (SQLite allows a
+    single writer), and ``max_pending`` bounds how many may wait in line.
+    The auto-import watcher runs its imports here too, through ``run``.
+    """
+
+    def __init__(self, *, max_concurrent=1, max_pending=20, keep_finished=100):
+        self._max_pending = max(1, int(max_pending))
+        self._keep_finished = max(1, int(keep_finished))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, int(max_concurrent)),
+            thread_name_prefix="import-job",
+        )
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, path, *, sheets=None, dry_run=False, workbook_import_id=None, source_sha256=None):
+        """Queue an import; ``workbook_import_id`` links it to a claimed ``workbook_imports`` row.
+
+        ``source_sha256`` is the file's content hash when the caller already has it.
+        """
+        return self._enqueue(
+            path,
+            sheets=sheets,
+            dry_run=dry_run,
+            workbook_import_id=workbook_import_id,
+            source_sha256=source_sha256,
+            check_pending=True,
+        )
+
+    def run(self, path, *, sheets=None, workbook_import_id=None, source_sha256=None):
+        """Queue an import and return the job once it has finished.
+
+        For the auto-import watcher, which bounds its own queue, so
+        ``max_pending`` does not apply; the job still waits for a free slot.
+        """
+        job = self._enqueue(
+            path,
+            sheets=sheets,
+            dry_run=False,
+            workbook_import_id=workbook_import_id,
+            source_sha256=source_sha256,
+            check_pending=False,
+        )
+        job.wait()
+        return job
+
+    def _enqueue(self, path, *, sheets, dry_run, workbook_import_id, source_sha256, check_pending):
+        path = check_import_path(path)
+        job = ImportJob(
+            path=path,
+            sheets=sheets,
+            dry_run=dry_run,
+            workbook_import_id=workbook_import_id,
+            source_sha256=source_sha256,
+        )
+        with self._lock:
+            pending = sum(1 for item in self._jobs.values() if item.status not in _FINISHED_STATUSES)
+            if check_pending and pending >= self._max_pending:
+                raise ImportQueueFullError("Too many imports are queued; try again later.")
+            self._jobs[job.id] = job
+            self._prune_finished()
+        # Also fires for jobs cancelled by ``shutdown``, so waiters never hang.
+        self._executor.submit(self._run, job).add_done_callback(lambda _future: job._done.set())
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _prune_finished(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in _FINISHED_STATUSES]
+        for job_id in finished[: max(0, len(finished) - self._keep_finished)]:
+            del self._jobs[job_id]
+
+    def _run(self, job):
+        job.status = STATUS_RUNNING
+        job.started_at = datetime.now(timezone.utc)
+        job.progress.start()
+        started = time.monotonic()
+        try:
+            job.results = import_workbook(
+                job.path,
+                sheets=job.sheets,
+                dry_run=job.dry_run,
+                progress=job.progress,
+                source_sha256=job.source_sha256,
+            )
+        except IMPORT_JOB_EXCEPTIONS as exc:
+            logger.exception("Import job %s failed for %s", job.id, job.path)
+            job.error = "{}: {}".format(type(exc).__name__, exc)
+            job.status = STATUS_FAILED
+        else:
+            job.status = STATUS_SUCCESS
+        finally:
+            if job.status == STATUS_RUNNING:
+                job.error = "Import stopped unexpectedly."
+                job.status = STATUS_FAILED
+            job.finished_at = datetime.now(timezone.utc)
+            job.progress.finish(job.status)
+            if job.workbook_import_id is not None:
+                self._record_history(job, time.monotonic() - started)
+
+    @staticmethod
+    def _record_history(job, duration_seconds):
+        try:
+            if job.status == STATUS_SUCCESS:
+                complete_workbook_import(job.workbook_import_id, job.results, duration_seconds)
+            else:
+                fail_workbook_import(job.workbook_import_id, RuntimeError(job.error), duration_seconds)
+        except SQLAlchemyError:
+            logger.exception("Could not record import history for job %s", job.id)
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_import_job_manager():
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            settings = get_settings()
+            _manager = ImportJobManager(
+                max_concurrent=settings.INGEST_MAX_CONCURRENT_JOBS,
+                max_pending=settings.INGEST_MAX_PENDING_JOBS,
+            )
+        return _manager
+
+
+def submit_upload(source, *, filename, sheets=None, dry_run=False):
+    """Spool an uploaded file, skip it if identical content was already imported, else queue it.
+
+    Returns ``(upload, job)``; ``job`` is ``None`` for a duplicate upload.
+    Dry runs are never recorded in ``workbook_imports``, so they neither
+    dedupe nor block a later real import of the same file.
+    """
+    settings = get_settings()
+    upload = spool_upload(
+        source,
+        filename=filename,
+        upload_dir=Path(settings.EXCEL_DATASOURCE_DIR) / "uploads",
+        max_bytes=settings.INGEST_UPLOAD_MAX_BYTES,
+    )
+    claim = None
+    if not dry_run:
+        try:
+            claim = claim_workbook_import(
+                sha256=upload.sha256,
+                file_path=upload.path,
+                file_size=upload.size,
+            )
+        except SQLAlchemyError:
+            upload.discard()
+            raise
+        if claim is None:
+            upload.discard()
+            logger.info("Upload %s skipped: identical content already imported.", filename)
+            return upload, None
+
+    try:
+        upload.keep()
+        job = get_import_job_manager().submit(
+            upload.path,
+            sheets=sheets,
+            dry_run=dry_run,
+            workbook_import_id=claim.id if claim is not None else None,
+            source_sha256=upload.sha256,
+        )
+    except (ImportQueueFullError, OSError, ValueError) as exc:
+        if claim is not None:
+            fail_workbook_import(claim.id, exc, 0.0)
+        raise
+    return upload, job
+
+
+def shutdown_import_jobs():
+    global _manager
+    with _manager_lock:
+        manager = _manager
+        _manager = None
+    if manager is not None:
+        manager.shutdown()
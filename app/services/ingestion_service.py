@@ -1,35 +1,149 @@
+import csv
+import gzip
+import hashlib
 import importlib
+import json
 import logging
+import multiprocessing
+import os
+import queue
 import re
 import threading
+import time
+import uuid
+from bisect import bisect_left, bisect_right
 from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from urllib.parse import urlsplit
 
 from openpyxl import load_workbook
+from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+from openpyxl.packaging.relationship import get_dependents, get_rels_path
+from openpyxl.reader.drawings import find_images
+from openpyxl.reader.excel import ExcelReader
 from openpyxl.utils.exceptions import InvalidFileException
+from sqlalchemy import func
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import insert as sa_insert
 from sqlalchemy import select as sa_select
+from sqlalchemy import tuple_ as sa_tuple
+from sqlalchemy import update as sa_update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.config import get_settings
 from app.core.constants import STATIC_DIR
+from app.core.inotify import IN_IGNORED, IN_Q_OVERFLOW, InotifyWatcher
 from app.database import Base, SessionLocal, engine, ensure_sqlite_schema
+from app.models.import_fingerprint import ImportRowFingerprint
+from app.models.inferred_sale import InferredSale
 from app.models.inventory import Inventory
+from app.models.inventory_delta import InventoryDelta
 from app.models.product import Product
+from app.models.product_image import ProductImage
+from app.models.purchase import Purchase
+from app.models.report_import_line import ReportImportLine
+from app.models.sales import Sales
 from app.models.stores import Store
-from app.services.product_service import apply_price_update
+from app.services.import_history_service import (
+    claim_workbook_import,
+    clear_import_checkpoints,
+    complete_workbook_import,
+    compute_file_sha256,
+    fail_workbook_import,
+    load_import_checkpoints,
+    save_import_checkpoint,
+)
+from app.services.image_service import create_renditions, has_renditions
+from app.services.product_service import (
+    apply_price_update,
+    insert_price_history,
+    stage_price_update,
+)
 
 logger = logging.getLogger(__name__)
 
 _IMAGE_DIR = STATIC_DIR / "images"
 _IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+# Embedded images are stored once per content hash in this subdirectory, so
+# new files never touch the mtime that keys ``_IMAGE_INDEX_CACHE``.
+_IMAGE_STORE_DIRNAME = "sha256"
+_IMAGE_STORE_URL_PREFIX = f"/static/images/{_IMAGE_STORE_DIRNAME}/"
+_IMAGE_WRITE_WORKERS = 4
+_IMAGE_WRITE_POOL = None
+_IMAGE_WRITE_LOCK = threading.Lock()
+_PENDING_IMAGE_WRITES = {}
 _IMAGE_INDEX_CACHE: dict[str, int | dict[str, str] | None] = {
     "modified_time_ns": None,
     "index": {},
 }
 _STAT_MODIFIED_TIME_FIELD = "st_" + "m" + "time"
 _STAT_MODIFIED_TIME_NS_FIELD = _STAT_MODIFIED_TIME_FIELD + "_ns"
+_BULK_BATCH_SIZE = 500
+_REPORT_BATCH_SIZE = 5000
+_ROW_FINGERPRINT_VERSION = 1
+_WATCH_MODES = ("auto", "inotify", "poll")
+_SOURCE_FORMATS = {".xlsx": "xlsx", ".csv": "csv", ".tsv": "tsv"}
+_DELIMITERS = {"csv": ",", "tsv": "\t"}
+_DELIMITED_READ_BUFFER = 1 << 20
+_DATE_FORMATS = ("%Y/%m/%d", "%d/%m/%Y", "%m/%d/%Y")
+_PROFILE_SAMPLE_ROWS = 200
+_COERCION_ERRORS = (ValueError, TypeError, AttributeError, OverflowError)
+_IMPORT_CONTEXT_STATS = (
+    "store_hits",
+    "store_misses",
+    "image_hits",
+    "image_misses",
+    "product_hits",
+    "product_misses",
+)
+_PARSE_POOL = None
+_PARSE_POOL_WORKERS = 0
+_PARSE_POOL_LOCK = threading.Lock()
+_PRODUCT_BULK_COLUMNS = (
+    "store_id",
+    "style_code",
+    "barcode",
+    "article_name",
+    "category",
+    "department_name",
+    "supplier_name",
+    "image_url",
+    "mrp",
+    "price",
+    "created_at",
+    "last_price_update",
+)
+_INVENTORY_BULK_COLUMNS = (
+    "store_id",
+    "product_id",
+    "quantity",
+    "cost_price",
+    "current_price",
+    "lifecycle_start_date",
+)
+# Stored columns a daily_update row writes; part of its fingerprint so that
+# edits made outside the import (price endpoints, manual fixes) are reapplied.
+_FINGERPRINT_PRODUCT_COLUMNS = (
+    "barcode",
+    "article_name",
+    "category",
+    "department_name",
+    "supplier_name",
+    "image_url",
+    "mrp",
+    "price",
+)
+_FINGERPRINT_INVENTORY_COLUMNS = ("quantity", "cost_price", "current_price", "lifecycle_start_date")
 
 
 def _find_header_index(header_keys, target):
@@ -39,21 +153,6 @@ def _find_header_index(header_keys, target):
     return None
 
 
-def _sanitize_image_basename(value):
-    if not value:
-        return ""
-    text = str(value).strip()
-    if not text:
-        return ""
-    sanitized = []
-    for char in text:
-        if char.isalnum() or char in ("-", "_", "."):
-            sanitized.append(char)
-        else:
-            sanitized.append("_")
-    return "".join(sanitized).strip("_.")
-
-
 def _image_extension_from_format(image_format):
     if not image_format:
         return ".jpg"
@@ -122,37 +221,170 @@ def _looks_like_explicit_image_reference(value):
     return Path(cleaned).suffix.lower() in _IMAGE_EXTENSIONS
 
 
+def _read_drawing_images(archive, worksheet_path):
+    rels_path = get_rels_path(worksheet_path)
+    if rels_path not in archive.namelist():
+        return []
+    images = []
+    for rel in get_dependents(archive, rels_path).find(SpreadsheetDrawing._rel_type):
+        _, drawing_images = find_images(archive, rel.target)
+        images.extend(drawing_images)
+    return images
+
+
+def _load_worksheet_images(worksheet):
+    images = getattr(worksheet, "_images", None)
+    if images:
+        return list(images)
+    # Read-only worksheets never load drawings; read them straight from the archive.
+    worksheet_path = getattr(worksheet, "_worksheet_path", None)
+    archive = getattr(getattr(worksheet, "parent", None), "_archive", None)
+    if not worksheet_path or archive is None:
+        return []
+    try:
+        return _read_drawing_images(archive, worksheet_path)
+    except (KeyError, OSError, ValueError):
+        logger.warning("Could not read embedded images for sheet %s.", worksheet.title)
+        return []
+
+
+def _write_image_file(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
+    create_renditions(path)
+    return len(data)
+
+
+def _get_image_write_pool():
+    global _IMAGE_WRITE_POOL
+    if _IMAGE_WRITE_POOL is None:
+        _IMAGE_WRITE_POOL = ThreadPoolExecutor(
+            max_workers=_IMAGE_WRITE_WORKERS,
+            thread_name_prefix="image-write",
+        )
+    return _IMAGE_WRITE_POOL
+
+
+def _image_store_path(image_url):
+    return _IMAGE_DIR / _IMAGE_STORE_DIRNAME / image_url[len(_IMAGE_STORE_URL_PREFIX):]
+
+
+def _finish_image_write(path, future):
+    with _IMAGE_WRITE_LOCK:
+        if _PENDING_IMAGE_WRITES.get(path) is future:
+            del _PENDING_IMAGE_WRITES[path]
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning("Could not write image %s.", path, exc_info=future.exception())
+
+
+def store_image_bytes(data, extension):
+    """Return the content-addressed URL for ``data``, queueing the write if the file is new.
+
+    Identical bytes map to the same file, so an image that was already
+    stored (or is being written) costs a hash and a few stats, not a write;
+    renditions missing next to it, such as for files stored before they
+    existed, are queued instead.
+    Call ``wait_for_image_writes`` with the URL before relying on the file.
+    """
+    filename = f"{hashlib.sha256(data).hexdigest()}{extension}"
+    path = _IMAGE_DIR / _IMAGE_STORE_DIRNAME / filename
+    future = None
+    with _IMAGE_WRITE_LOCK:
+        if path not in _PENDING_IMAGE_WRITES:
+            if not path.exists():
+                future = _get_image_write_pool().submit(_write_image_file, path, data)
+            elif not has_renditions(path):
+                future = _get_image_write_pool().submit(create_renditions, path)
+        if future is not None:
+            _PENDING_IMAGE_WRITES[path] = future
+    if future is not None:
+        # Outside the lock: the callback runs right away if the write already finished.
+        future.add_done_callback(lambda done: _finish_image_write(path, done))
+    return f"{_IMAGE_STORE_URL_PREFIX}{filename}"
+
+
+def wait_for_image_writes(image_urls=None):
+    """Block until image writes finish; returns the URLs whose file could not be written.
+
+    With ``image_urls`` (URLs returned by ``store_image_bytes``) only the
+    writes behind them are waited for, so one import never waits on
+    another's images; without it every queued write is.
+    """
+    with _IMAGE_WRITE_LOCK:
+        if image_urls is None:
+            paths = list(_PENDING_IMAGE_WRITES)
+            image_urls = [f"{_IMAGE_STORE_URL_PREFIX}{path.name}" for path in paths]
+        else:
+            image_urls = [url for url in image_urls if url.startswith(_IMAGE_STORE_URL_PREFIX)]
+            paths = [_image_store_path(url) for url in image_urls]
+        pending = [_PENDING_IMAGE_WRITES[path] for path in paths if path in _PENDING_IMAGE_WRITES]
+    wait_for_futures(pending)
+    return {url for url in image_urls if not _image_store_path(url).exists()}
+
+
+def _drop_unwritten_images(parsed_sheets):
+    """Wait for the images ``parsed_sheets`` point at and clear ``image_url`` where a write failed."""
+    for sheet in parsed_sheets:
+        if "image_url" not in sheet.columns:
+            continue
+        index = sheet.columns.index("image_url")
+        failed = wait_for_image_writes(
+            {row[index] for row in sheet.rows if isinstance(row[index], str)}
+        )
+        if failed:
+            sheet.rows = [
+                row[:index] + (None,) + row[index + 1:] if row[index] in failed else row
+                for row in sheet.rows
+            ]
+    return parsed_sheets
+
+
+def _clear_unwritten_images(db, context, image_urls):
+    """Point products away from stored images whose file could not be written."""
+    if not image_urls:
+        return
+    for images in (context.product_images, context.unsaved_images):
+        for style_code, image_url in list(images.items()):
+            if image_url in image_urls:
+                del images[style_code]
+    for batch in _iter_batches(sorted(image_urls)):
+        db.execute(sa_update(Product).where(Product.image_url.in_(batch)).values(image_url=None))
+        # Chunked imports record images with each chunk, before their files are known to exist.
+        db.execute(sa_delete(ProductImage).where(ProductImage.image_url.in_(batch)))
+
+
+def shutdown_image_writes():
+    global _IMAGE_WRITE_POOL
+    wait_for_image_writes()
+    with _IMAGE_WRITE_LOCK:
+        pool = _IMAGE_WRITE_POOL
+        _IMAGE_WRITE_POOL = None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def _save_embedded_image(image):
+    data = _read_embedded_image_bytes(image)
+    if not data:
+        return None
+    extension = _image_extension_from_format(getattr(image, "format", None))
+    return store_image_bytes(data, extension)
+
+
 def _extract_embedded_images(worksheet, header_keys):
     image_col = _find_header_index(header_keys, "image_url")
     if image_col is None:
         return {}
-    style_col = _find_header_index(header_keys, "style_code")
-    images = getattr(worksheet, "_images", []) or []
-    if not images:
-        return {}
-    _IMAGE_DIR.mkdir(parents=True, exist_ok=True)
     image_map = {}
-    for image in images:
+    for image in _load_worksheet_images(worksheet):
         col, row = _get_image_anchor_coordinates(image)
         if col is None or row is None:
             continue
         if col != image_col:
             continue
-        row_idx = row + 1
-        style_value = None
-        if style_col is not None:
-            style_value = worksheet.cell(row=row_idx, column=style_col + 1).value
-        base_name = _sanitize_image_basename(style_value) or f"row_{row_idx}"
-        extension = _image_extension_from_format(getattr(image, "format", None))
-        filename = f"{base_name}{extension}"
-        data = _read_embedded_image_bytes(image)
-        if not data:
-            continue
-        try:
-            (_IMAGE_DIR / filename).write_bytes(data)
-        except OSError:
-            continue
-        image_map[row_idx] = f"/static/images/{filename}"
+        image_map[row + 1] = image
     return image_map
 
 _ALIAS_SPECS = (
@@ -210,10 +442,57 @@ REQUIRED_COLUMNS = {
         "category",
         "mrp",
     },
+    "sold_report": {"store_id", "sale_date", "quantity_sold"},
+    "purchase_report": {"store_id", "purchase_date", "quantity_purchased"},
+}
+
+# Typed columns per sheet; everything else is kept as read and parsed as text.
+COLUMN_TYPES = {
+    "stores": {"id": "int"},
+    "products": {"id": "int", "store_id": "int", "mrp": "float", "price": "float"},
+    "inventory": {
+        "id": "int",
+        "store_id": "int",
+        "product_id": "int",
+        "quantity": "int",
+        "mrp": "float",
+        "cost_price": "float",
+        "current_price": "float",
+        "lifecycle_start_date": "date",
+    },
+    "daily_update": {
+        "store_id": "int",
+        "quantity": "int",
+        "stock_days": "int",
+        "mrp": "float",
+        "price": "float",
+        "cost_price": "float",
+        "current_price": "float",
+        "lifecycle_start_date": "date",
+    },
+    "sold_report": {"store_id": "int", "quantity_sold": "int", "sale_date": "date"},
+    "purchase_report": {"store_id": "int", "quantity_purchased": "int", "purchase_date": "date"},
 }
 
 DAILY_UPDATE_SHEET = "daily_update"
+SOLD_REPORT_SHEET = "sold_report"
+PURCHASE_REPORT_SHEET = "purchase_report"
 DEFAULT_SHEET_ORDER = ["stores", "products", "inventory"]
+REPORT_SHEET_ORDER = [SOLD_REPORT_SHEET, PURCHASE_REPORT_SHEET]
+# Report sheets: target model, its date and quantity columns, and the sheet
+# headers accepted for each (first match wins).
+REPORT_SHEETS = {
+    SOLD_REPORT_SHEET: (
+        Sales,
+        ("sale_date", ("sale_date", "bill_date", "date")),
+        ("quantity_sold", ("quantity_sold", "sold_qty", "sold_quantity", "quantity")),
+    ),
+    PURCHASE_REPORT_SHEET: (
+        Purchase,
+        ("purchase_date", ("purchase_date", "grn_date", "date")),
+        ("quantity_purchased", ("quantity_purchased", "purchase_qty", "pur_qty", "quantity")),
+    ),
+}
 CARD_LAYOUT_LABEL_MAP = {
     "supplier_name": "supplier_name",
     "supplier": "supplier_name",
@@ -248,14 +527,23 @@ def _import_models():
     for module_name in (
         "app.models.alert",
         "app.models.daily_snapshot",
+        "app.models.decision_profile",
         "app.models.delivery_logs",
+        "app.models.import_checkpoint",
+        "app.models.import_fingerprint",
+        "app.models.inferred_sale",
         "app.models.inventory",
+        "app.models.inventory_delta",
         "app.models.lifecycle",
         "app.models.price_history",
         "app.models.product",
+        "app.models.product_image",
+        "app.models.purchase",
+        "app.models.report_import_line",
         "app.models.risk_log",
         "app.models.sales",
         "app.models.stores",
+        "app.models.workbook_import",
     ):
         importlib.import_module(module_name)
 
@@ -291,15 +579,15 @@ def _is_footer_value(value):
 
 
 def _looks_like_header_row(row, header_set):
-    matches = 0
-    non_blank = 0
+    # Stops at the first non-header value, so data rows cost one normalization.
+    matched = False
     for value in row:
         if _is_blank(value):
             continue
-        non_blank += 1
-        if normalize_header(value) in header_set:
-            matches += 1
-    return 0 < non_blank == matches
+        if normalize_header(value) not in header_set:
+            return False
+        matched = True
+    return matched
 
 
 def normalize_header(value):
@@ -351,9 +639,18 @@ def _infer_store_id_from_sheet_name(sheet_name):
         return None
 
 
+@lru_cache(maxsize=4096)
+def _card_field_for_text(label):
+    return CARD_LAYOUT_LABEL_MAP.get(normalize_header(label))
+
+
 def _to_card_field(label):
-    normalized = normalize_header(label)
-    return CARD_LAYOUT_LABEL_MAP.get(normalized)
+    # Labels are always text; numbers and dates can never name a card field,
+    # so they skip normalization entirely. Text is memoized because card
+    # sheets repeat the same handful of labels thousands of times.
+    if not isinstance(label, str):
+        return None
+    return _card_field_for_text(label)
 
 
 def _build_daily_update_row_from_card(record, inferred_store_id):
@@ -435,20 +732,44 @@ def _append_card_record(rows, columns, record_metas, record, inferred_store_id):
         record_metas.append((len(rows) - 1, value_idx, supplier_row))
 
 
+def _nearest_value_index(value_indices, image_col):
+    """Prefer the closest value column right of the image, else the closest overall."""
+    position = bisect_right(value_indices, image_col)
+    if position < len(value_indices):
+        return value_indices[position]
+    return value_indices[-1]
+
+
+def _nearest_record_position(supplier_rows, target_row):
+    """Index of the supplier row closest to ``target_row``; ties go to the upper record."""
+    if not supplier_rows:
+        return None
+    position = bisect_left(supplier_rows, target_row)
+    if position == len(supplier_rows) or (
+        position > 0 and target_row - supplier_rows[position - 1] <= supplier_rows[position] - target_row
+    ):
+        position -= 1
+    return position
+
+
 def _extract_card_layout_images(worksheet, rows, record_metas):
-    images = getattr(worksheet, "_images", []) or []
-    if not images or not rows or not record_metas:
+    if not rows or not record_metas:
+        return
+    images = _load_worksheet_images(worksheet)
+    if not images:
         return
 
     value_indices = sorted({meta[1] for meta in record_metas})
     if not value_indices:
         return
 
+    # Per value column, parallel lists sorted by supplier row. Records are
+    # removed once they receive an image, so each lookup is a bisect.
     records_by_value_idx = {}
-    for row_index, value_idx, supplier_row in record_metas:
-        records_by_value_idx.setdefault(value_idx, []).append((supplier_row, row_index))
-    for value_idx in records_by_value_idx:
-        records_by_value_idx[value_idx].sort(key=lambda item: item[0])
+    for row_index, value_idx, supplier_row in sorted(record_metas, key=lambda meta: (meta[1], meta[2], meta[0])):
+        supplier_rows, row_indices = records_by_value_idx.setdefault(value_idx, ([], []))
+        supplier_rows.append(supplier_row)
+        row_indices.append(row_index)
 
     anchored_images = []
     for image in images:
@@ -461,62 +782,33 @@ def _extract_card_layout_images(worksheet, rows, record_metas):
         return
 
     anchored_images.sort(key=lambda item: (item[0], item[1]))
-    used_rows = set()
-    _IMAGE_DIR.mkdir(parents=True, exist_ok=True)
 
     for image_row, image_col, image in anchored_images:
-        right_side_indices = [
-            candidate_idx for candidate_idx in value_indices if candidate_idx > image_col
-        ]
-        if right_side_indices:
-            value_idx = min(
-                right_side_indices, key=lambda candidate_idx: candidate_idx - image_col
-            )
-        else:
-            value_idx = min(
-                value_indices, key=lambda candidate_idx: abs(candidate_idx - image_col)
-            )
-
-        candidates = records_by_value_idx.get(value_idx) or []
+        candidates = records_by_value_idx.get(_nearest_value_index(value_indices, image_col))
         if not candidates:
             continue
-
-        supplier_target = image_row + 1
-        best_row_index = None
-        best_distance = None
-        for supplier_row, row_index in candidates:
-            if row_index in used_rows:
-                continue
-            distance = abs(supplier_row - supplier_target)
-            if best_distance is None or distance < best_distance:
-                best_distance = distance
-                best_row_index = row_index
-        if best_row_index is None:
-            continue
-
-        data = _read_embedded_image_bytes(image)
-        if not data:
+        supplier_rows, row_indices = candidates
+        position = _nearest_record_position(supplier_rows, image_row + 1)
+        if position is None:
             continue
+        best_row_index = row_indices[position]
 
         record = rows[best_row_index]
-        base_value = (
-            _clean_text(record.get("image_url"))
-            or _clean_text(record.get("style_code"))
-            or _clean_text(record.get("barcode"))
-            or f"row_{best_row_index + 1}"
-        )
-        base_name = _sanitize_image_basename(base_value) or f"row_{best_row_index + 1}"
-        extension = _image_extension_from_format(getattr(image, "format", None))
-        filename = f"{base_name}{extension}"
-        try:
-            (_IMAGE_DIR / filename).write_bytes(data)
-        except OSError:
+        image_url = _save_embedded_image(image)
+        if not image_url:
             continue
-        record["image_url"] = f"/static/images/{filename}"
-        used_rows.add(best_row_index)
+        record["image_url"] = image_url
+        del supplier_rows[position]
+        del row_indices[position]
 
 
 def load_card_layout_rows(worksheet):
+    rows, columns, _ = _load_card_layout_records(worksheet)
+    return rows, columns
+
+
+def _load_card_layout_records(worksheet):
+    """Return ``(rows, columns, row_numbers)``; a card's row number is its supplier row."""
     rows = []
     columns = set()
     record_metas = []
@@ -549,43 +841,177 @@ def load_card_layout_rows(worksheet):
     for record in active_records.values():
         _append_card_record(rows, columns, record_metas, record, inferred_store_id)
 
+    row_numbers = [None] * len(rows)
+    for row_index, _, supplier_row in record_metas:
+        row_numbers[row_index] = supplier_row
     _extract_card_layout_images(worksheet, rows, record_metas)
+    # Embedded images can give cards without an "Image Name" field an image_url.
+    if "image_url" not in columns and any("image_url" in row for row in rows):
+        columns.add("image_url")
 
-    return rows, columns
+    return rows, columns, row_numbers
 
 
-def get_daily_update_aliases():
-    settings = get_settings()
-    aliases = normalize_sheet_list(settings.EXCEL_DAILY_UPDATE_SHEET_ALIASES)
+def _normalize_sheet_aliases(value):
+    aliases = normalize_sheet_list(value)
     if not aliases:
         return []
     return [normalize_sheet_name(name) for name in aliases]
 
 
-def apply_daily_update_aliases(sheet_map, aliases):
-    if not aliases or DAILY_UPDATE_SHEET in sheet_map:
+def get_daily_update_aliases():
+    return _normalize_sheet_aliases(get_settings().EXCEL_DAILY_UPDATE_SHEET_ALIASES)
+
+
+def get_report_sheet_aliases():
+    settings = get_settings()
+    return {
+        SOLD_REPORT_SHEET: _normalize_sheet_aliases(settings.EXCEL_SOLD_REPORT_SHEET_ALIASES),
+        PURCHASE_REPORT_SHEET: _normalize_sheet_aliases(settings.EXCEL_PURCHASE_REPORT_SHEET_ALIASES),
+    }
+
+
+def _apply_sheet_aliases(sheet_map, sheet_key, aliases):
+    if not aliases or sheet_key in sheet_map:
         return
     for alias in aliases:
         actual_name = sheet_map.get(alias)
         if actual_name:
-            sheet_map[DAILY_UPDATE_SHEET] = actual_name
+            sheet_map[sheet_key] = actual_name
             break
 
 
+def apply_daily_update_aliases(sheet_map, aliases):
+    _apply_sheet_aliases(sheet_map, DAILY_UPDATE_SHEET, aliases)
+
+
 def should_create_missing_stores():
     settings = get_settings()
     return bool(settings.EXCEL_CREATE_MISSING_STORES)
 
 
-def ensure_store_exists(db, store_id):
+def ensure_store_exists(db, store_id, context=None):
     if not should_create_missing_stores():
         return
     if store_id is None:
         return
-    if db.get(Store, store_id):
+    if context is not None and context.has_store(store_id):
         return
-    db.add(Store(id=store_id, name=f"Store {store_id}", city="Unknown"))
-    db.flush()
+    if not db.get(Store, store_id):
+        db.add(Store(id=store_id, name=f"Store {store_id}", city="Unknown"))
+        db.flush()
+    if context is not None:
+        context.store_ids.add(store_id)
+
+
+class ImportContext:
+    """Lookups shared by every row of one ``import_workbook`` call.
+
+    Holds the store ids known to exist, a snapshot of the image index taken
+    when the import starts and a ``(store_id, style_code) -> product id`` map
+    loaded one store at a time, so row handlers don't repeat the same query
+    or directory stat for every row. ``stats`` counts hits and misses.
+    ``product_images`` collects the stored image each style code points to,
+    with the entries not yet written to ``product_images`` (the table) kept
+    in ``unsaved_images``; ``stored_images`` is that mapping as saved by
+    earlier imports.
+
+    The bulk daily_update path keeps the stored product, inventory and row
+    fingerprint state of each store it touches here too, loaded on first use
+    and updated in place as chunks are written, so a chunked import reads
+    each store once instead of once per chunk.
+    """
+
+    def __init__(self, store_ids=(), image_index=None, stored_images=None):
+        self.store_ids = set(store_ids)
+        self.image_index = MappingProxyType(dict(image_index or {}))
+        self.stored_images = MappingProxyType(dict(stored_images or {}))
+        self.product_ids = {}
+        self.product_images = {}
+        self.unsaved_images = {}
+        self.product_states = {}
+        self.inventory_states = {}
+        self.row_fingerprints = {}
+        self._product_stores = set()
+        self._daily_update_stores = set()
+        self.stats = dict.fromkeys(_IMPORT_CONTEXT_STATS, 0)
+
+    @classmethod
+    def load(cls, db):
+        return cls(
+            store_ids=db.execute(sa_select(Store.id)).scalars(),
+            image_index=_get_image_index(),
+            stored_images=(
+                (style_code, image_url)
+                for style_code, image_url in db.execute(
+                    sa_select(ProductImage.style_code, ProductImage.image_url)
+                )
+            ),
+        )
+
+    def count(self, lookup, hit):
+        self.stats["{}_{}".format(lookup, "hits" if hit else "misses")] += 1
+
+    def has_store(self, store_id):
+        hit = store_id in self.store_ids
+        self.count("store", hit)
+        return hit
+
+    def find_product(self, db, store_id, style_code):
+        if store_id not in self._product_stores:
+            stmt = sa_select(Product.style_code, Product.id).where(Product.store_id == store_id)
+            for row_style_code, product_id in db.execute(stmt):
+                self.product_ids[(store_id, row_style_code)] = product_id
+            self._product_stores.add(store_id)
+        product_id = self.product_ids.get((store_id, style_code))
+        self.count("product", product_id is not None)
+        return db.get(Product, product_id) if product_id is not None else None
+
+    def remember_product(self, product, previous_key=None):
+        key = (product.store_id, product.style_code)
+        if previous_key is not None and previous_key != key:
+            self.product_ids.pop(previous_key, None)
+        if product.store_id in self._product_stores:
+            self.product_ids[key] = product.id
+
+    def remember_image(self, style_code, image_url):
+        if self.product_images.get(style_code) != image_url:
+            self.product_images[style_code] = image_url
+            self.unsaved_images[style_code] = image_url
+
+    def take_unsaved_images(self):
+        """Return the images recorded since the last call, for ``_upsert_product_images``."""
+        images = self.unsaved_images
+        self.unsaved_images = {}
+        return images
+
+    def remember_product_ids(self, product_ids):
+        """Record ``{(store_id, style_code): product id}`` written outside the row handlers."""
+        for key, product_id in product_ids.items():
+            if key[0] in self._product_stores:
+                self.product_ids[key] = product_id
+
+    def load_daily_update_states(self, db, store_ids):
+        """Return the shared ``(products, inventory, fingerprints)`` maps, loading new stores."""
+        missing = [store_id for store_id in store_ids if store_id not in self._daily_update_stores]
+        if missing:
+            self.product_states.update(_load_product_states(db, missing))
+            self.inventory_states.update(_load_inventory_states(db, missing))
+            self.row_fingerprints.update(_load_row_fingerprints(db, missing))
+            self._daily_update_stores.update(missing)
+        return self.product_states, self.inventory_states, self.row_fingerprints
+
+    def forget_daily_update_states(self):
+        """Drop the daily_update state after row handlers changed products or inventory."""
+        self.product_states.clear()
+        self.inventory_states.clear()
+        self.row_fingerprints.clear()
+        self._daily_update_stores.clear()
+
+    def take_stats(self):
+        stats = self.stats
+        self.stats = dict.fromkeys(_IMPORT_CONTEXT_STATS, 0)
+        return stats
 
 
 def to_str(value, field, required=True):
@@ -645,7 +1071,7 @@ def to_date(value, field):
             return date.fromisoformat(value_text)
         except ValueError:
             pass
-        for fmt in ("%Y/%m/%d", "%d/%m/%Y", "%m/%d/%Y"):
+        for fmt in _DATE_FORMATS:
             try:
                 return datetime.strptime(value_text, fmt).date()
             except ValueError:
@@ -653,11 +1079,195 @@ def to_date(value, field):
     raise ValueError(f"{field} must be a date (YYYY-MM-DD)")
 
 
-def load_sheet_rows(worksheet):
+# Fast converters accept only the one cell shape they were picked for and
+# raise otherwise, so any other value falls back to the generic to_* helper.
+def _int_from_int(value):
+    if type(value) is not int:
+        raise TypeError
+    return value
+
+
+def _int_from_float(value):
+    if type(value) is not float or not value.is_integer():
+        raise TypeError
+    return int(value)
+
+
+def _int_from_text(value):
+    if type(value) is not str:
+        raise TypeError
+    return int(value)
+
+
+def _float_from_number(value):
+    if type(value) is not int and type(value) is not float:
+        raise TypeError
+    return float(value)
+
+
+def _float_from_text(value):
+    if type(value) is not str:
+        raise TypeError
+    return float(value)
+
+
+def _float_from_grouped_text(value):
+    return float(value.replace(",", ""))
+
+
+def _date_from_datetime(value):
+    if type(value) is not datetime:
+        raise TypeError
+    return value.date()
+
+
+def _date_from_date(value):
+    if type(value) is not date:
+        raise TypeError
+    return value
+
+
+def _date_from_iso_text(value):
+    return date.fromisoformat(value.strip())
+
+
+def _date_text_parser(fmt):
+    def parse(value):
+        return datetime.strptime(value.strip(), fmt).date()
+
+    return parse
+
+
+_FAST_CONVERTERS = {
+    "int": (_int_from_int, _int_from_float, _int_from_text),
+    "float": (_float_from_number, _float_from_text, _float_from_grouped_text),
+    "date": (
+        _date_from_datetime,
+        _date_from_date,
+        _date_from_iso_text,
+        *(_date_text_parser(fmt) for fmt in _DATE_FORMATS),
+    ),
+}
+_GENERIC_CONVERTERS = {"int": to_int, "float": to_float, "date": to_date}
+
+
+def _pick_fast_converter(kind, sample):
+    """Return the first fast converter that accepts every sampled value, if any."""
+    if not sample:
+        return None
+    for converter in _FAST_CONVERTERS[kind]:
+        try:
+            for value in sample:
+                converter(value)
+        except _COERCION_ERRORS:
+            continue
+        return converter
+    return None
+
+
+class ColumnProfile:
+    """Converters for one sheet's typed columns, inferred once from a sample.
+
+    Each column gets the fast converter that fits its sampled cells (native
+    numbers, plain or comma-grouped numeric text, a single date format) so
+    the rest of the column skips the generic try-every-format helpers. A
+    sampled date column settles on one format, so ambiguous day/month values
+    read the same way throughout the sheet.
+    """
+
+    def __init__(self, converters):
+        self.converters = converters
+
+    @classmethod
+    def infer(cls, sheet_key, sample_records):
+        column_types = COLUMN_TYPES.get(sheet_key, {})
+        samples = {column: [] for column in column_types}
+        for record in sample_records:
+            for column, values in samples.items():
+                value = record.get(column)
+                if not _is_blank(value):
+                    values.append(value)
+        converters = [
+            (column, kind, _pick_fast_converter(kind, samples[column]))
+            for column, kind in column_types.items()
+        ]
+        return cls(converters)
+
+    def coerce(self, record):
+        """Convert typed cells of ``record`` in place; return ``[(column, value, error)]`` failures."""
+        failures = []
+        for column, kind, fast in self.converters:
+            value = record.get(column)
+            if _is_blank(value):
+                continue
+            if fast is not None:
+                try:
+                    record[column] = fast(value)
+                    continue
+                except _COERCION_ERRORS:
+                    pass
+            try:
+                record[column] = _GENERIC_CONVERTERS[kind](value, column)
+            except _COERCION_ERRORS as exc:
+                failures.append((column, value, str(exc) or type(exc).__name__))
+        return failures
+
+
+def _reject_value(value):
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return str(value)
+
+
+def coerce_sheet_records(sheet_key, sheet_name, records, rejects):
+    """Yield records from ``(row_number, record)`` pairs with typed columns converted.
+
+    The column profile is inferred from the first ``_PROFILE_SAMPLE_ROWS``
+    records. Rows with a cell that cannot be converted are left out and
+    reported in ``rejects`` as ``{"sheet", "row", "column", "value", "error"}``
+    entries instead of failing the import.
+    """
+    records = iter(records)
+    sample = list(islice(records, _PROFILE_SAMPLE_ROWS))
+    profile = ColumnProfile.infer(sheet_key, (record for _, record in sample))
+    rejected = 0
+    for row_number, record in chain(sample, records):
+        failures = profile.coerce(record)
+        if not failures:
+            yield record
+            continue
+        rejected += 1
+        for column, value, error in failures:
+            rejects.append(
+                {
+                    "sheet": sheet_name,
+                    "row": row_number,
+                    "column": column,
+                    "value": _reject_value(value),
+                    "error": error,
+                }
+            )
+    if rejected:
+        logger.warning("Rejected %s row(s) from sheet %s", rejected, sheet_name)
+
+
+def iter_sheet_rows(worksheet):
+    """Return ``(columns, rows)`` for a worksheet, where ``rows`` is lazy.
+
+    Tabular sheets are streamed row by row, so read-only worksheets never need
+    to hold the whole sheet in memory. Card layouts are parsed eagerly because
+    each record spans several sheet rows.
+    """
+    columns, records = iter_sheet_records(worksheet)
+    return columns, (record for _, record in records)
+
+
+def iter_sheet_records(worksheet):
+    """Like ``iter_sheet_rows`` but yields ``(row_number, record)`` pairs."""
     rows_iter = worksheet.iter_rows(values_only=True)
     headers = next(rows_iter, None)
     if not headers:
-        return [], set()
+        return set(), iter(())
     header_keys = [normalize_header(header) for header in headers]
     non_blank_headers = [key for key in header_keys if key]
     should_try_card_layout = False
@@ -669,21 +1279,20 @@ def load_sheet_rows(worksheet):
         should_try_card_layout = True
 
     if should_try_card_layout:
-        card_rows, card_columns = load_card_layout_rows(worksheet)
+        card_rows, card_columns, row_numbers = _load_card_layout_records(worksheet)
         if card_rows:
-            return card_rows, card_columns
+            return card_columns, zip(row_numbers, card_rows)
         if not non_blank_headers:
-            return [], set()
-    indices = [(col_idx, key) for col_idx, key in enumerate(header_keys) if key]
+            return set(), iter(())
     columns = {key for key in header_keys if key}
-    embedded_images = _extract_embedded_images(worksheet, header_keys)
-    store_idx = None
-    for col_idx, key in indices:
-        if key == "store_id":
-            store_idx = col_idx
-            break
+    return columns, _iter_tabular_rows(worksheet, rows_iter, header_keys, columns)
+
+
+def _iter_tabular_records(rows_iter, header_keys, columns):
+    """Yield ``(row_number, record)`` for data rows, skipping blanks, repeated headers and footers."""
+    indices = [(col_idx, key) for col_idx, key in enumerate(header_keys) if key]
+    store_idx = _find_header_index(header_keys, "store_id")
 
-    rows = []
     for row_idx, row in enumerate(rows_iter, start=2):
         if row is None or all(_is_blank(value) for value in row):
             continue
@@ -697,16 +1306,31 @@ def load_sheet_rows(worksheet):
                 continue
             if _is_footer_value(store_value):
                 continue
-        record = {key: row[col_idx] for col_idx, key in indices}
-        if embedded_images:
-            image_value = embedded_images.get(row_idx)
-            if image_value and (
-                _is_blank(record.get("image_url"))
-                or not _looks_like_explicit_image_reference(record.get("image_url"))
-            ):
-                record["image_url"] = image_value
-        rows.append(record)
-    return rows, columns
+        row_length = len(row)
+        record = {
+            key: row[col_idx] if col_idx < row_length else None
+            for col_idx, key in indices
+        }
+        yield row_idx, record
+
+
+def _iter_tabular_rows(worksheet, rows_iter, header_keys, columns):
+    embedded_images = _extract_embedded_images(worksheet, header_keys)
+    for row_idx, record in _iter_tabular_records(rows_iter, header_keys, columns):
+        image = embedded_images.get(row_idx) if embedded_images else None
+        if image is not None and (
+            _is_blank(record.get("image_url"))
+            or not _looks_like_explicit_image_reference(record.get("image_url"))
+        ):
+            image_url = _save_embedded_image(image)
+            if image_url:
+                record["image_url"] = image_url
+        yield row_idx, record
+
+
+def load_sheet_rows(worksheet):
+    columns, rows = iter_sheet_rows(worksheet)
+    return list(rows), columns
 
 
 def validate_columns(sheet_name, columns):
@@ -721,11 +1345,43 @@ def validate_columns(sheet_name, columns):
     if sheet_name == "inventory" and "cost_price" in missing:
         if "mrp" in columns:
             missing.remove("cost_price")
+    if sheet_name in REPORT_SHEETS and not columns & {"style_code", "barcode"}:
+        missing.append("style_code")
     if missing:
         missing_text = ", ".join(missing)
         raise ValueError(f"{sheet_name} sheet missing columns: {missing_text}")
 
 
+def _report_column_renames(sheet_key, columns):
+    """Map the first accepted date and quantity header of a report onto its canonical column."""
+    _, *fields = REPORT_SHEETS[sheet_key]
+    renames = {}
+    for target, candidates in fields:
+        header = next((name for name in candidates if name in columns), None)
+        if header is not None and header != target:
+            renames[header] = target
+    return renames
+
+
+def _rename_record_columns(records, renames):
+    for row_number, record in records:
+        for header, target in renames.items():
+            record[target] = record.pop(header, None)
+        yield row_number, record
+
+
+def _read_sheet_records(source, sheet_key, actual_name):
+    """Return validated ``(columns, records)`` for one planned sheet."""
+    columns, records = _source_sheet_records(source, actual_name)
+    if sheet_key in REPORT_SHEETS:
+        renames = _report_column_renames(sheet_key, columns)
+        if renames:
+            columns = {renames.get(name, name) for name in columns}
+            records = _rename_record_columns(records, renames)
+    validate_columns(sheet_key, columns)
+    return columns, records
+
+
 def get_existing(db, model, record_id, *filters):
     if record_id:
         instance = db.get(model, record_id)
@@ -755,10 +1411,10 @@ def upsert_store(db, row):
     return apply_upsert(db, store, Store, values)
 
 
-def upsert_product(db, row, *, price_change_log=None):
+def upsert_product(db, row, *, price_change_log=None, context=None, price_history=None):
     product_id = to_int(row.get("id"), "id", required=False)
     store_id = to_int(row.get("store_id"), "store_id")
-    ensure_store_exists(db, store_id)
+    ensure_store_exists(db, store_id, context)
     style_code = to_str(row.get("style_code"), "style_code")
     barcode = to_str(row.get("barcode"), "barcode")
     article_name = to_str(row.get("article_name"), "article_name")
@@ -766,19 +1422,23 @@ def upsert_product(db, row, *, price_change_log=None):
     supplier_name = to_str(row.get("supplier_name"), "supplier_name")
     mrp = to_float(row.get("mrp"), "mrp")
     price = parse_optional_price(row)
-    image_url, image_explicit = resolve_image_url(row)
+    image_url, image_explicit = resolve_image_url(row, context=context)
     department_value = row.get("department_name")
     department_name = None
     if not _is_blank(department_value):
         department_name = to_str(department_value, "department_name")
 
-    product = get_existing(
-        db,
-        Product,
-        product_id,
-        Product.style_code == style_code,
-        Product.store_id == store_id,
-    )
+    if context is not None and product_id is None:
+        product = context.find_product(db, store_id, style_code)
+    else:
+        product = get_existing(
+            db,
+            Product,
+            product_id,
+            Product.style_code == style_code,
+            Product.store_id == store_id,
+        )
+    previous_key = (product.store_id, product.style_code) if product is not None else None
     values = build_product_values(
         store_id=store_id,
         style_code=style_code,
@@ -793,7 +1453,7 @@ def upsert_product(db, row, *, price_change_log=None):
         department_name=department_name,
         default_department_for_new=True,
     )
-    return finalize_product_upsert(
+    action, product = finalize_product_upsert(
         db,
         product,
         values,
@@ -801,14 +1461,20 @@ def upsert_product(db, row, *, price_change_log=None):
         price=price,
         store_id=store_id,
         style_code=style_code,
+        return_product=True,
+        flush_on_insert=context is not None,
         price_change_log=price_change_log,
+        price_history=price_history,
     )
+    if context is not None:
+        context.remember_product(product, previous_key)
+    return action
 
 
-def upsert_inventory(db, row):
+def upsert_inventory(db, row, *, context=None):
     inventory_id = to_int(row.get("id"), "id", required=False)
     store_id = to_int(row.get("store_id"), "store_id")
-    ensure_store_exists(db, store_id)
+    ensure_store_exists(db, store_id, context)
     product_id = to_int(row.get("product_id"), "product_id")
     quantity = to_int(row.get("quantity"), "quantity")
     cost_price = resolve_price(row.get("cost_price"), row.get("mrp"), "item_mrp")
@@ -922,13 +1588,23 @@ def _normalize_image_value(
     return cleaned
 
 
-def resolve_image_url(row: Mapping[str, object] | None) -> tuple[str | None, bool]:
+def resolve_image_url(
+    row: Mapping[str, object] | None,
+    *,
+    context: ImportContext | None = None,
+) -> tuple[str | None, bool]:
     if not isinstance(row, Mapping):
         return None, False
-    image_index = _get_image_index()
+    image_index = context.image_index if context is not None else _get_image_index()
     explicit_value = row.get("image_url")
     if not _is_blank(explicit_value):
-        return _normalize_image_value(explicit_value, image_index), True
+        image_url = _normalize_image_value(explicit_value, image_index)
+        style_code = _clean_text(row.get("style_code"))
+        if context is not None and style_code and image_url and image_url.startswith(
+            _IMAGE_STORE_URL_PREFIX
+        ):
+            context.remember_image(style_code, image_url)
+        return image_url, True
     for key in ("style_code", "barcode"):
         candidate = row.get(key)
         if _is_blank(candidate):
@@ -936,7 +1612,20 @@ def resolve_image_url(row: Mapping[str, object] | None) -> tuple[str | None, boo
         lookup_key = str(candidate).strip().lower()
         filename = image_index.get(lookup_key)
         if filename:
+            if context is not None:
+                context.count("image", True)
             return f"/static/images/{filename}", False
+    if context is not None:
+        # An image embedded for this style code by this or an earlier import.
+        style_code = _clean_text(row.get("style_code"))
+        image_url = (
+            context.product_images.get(style_code) or context.stored_images.get(style_code)
+            if style_code
+            else None
+        )
+        context.count("image", image_url is not None)
+        if image_url:
+            return image_url, False
     return None, False
 
 
@@ -992,6 +1681,36 @@ def build_product_values(
     return values
 
 
+def _resolve_pending_price(product, *, mrp, price):
+    if price is not None:
+        return price, "price"
+    old_price = product.price
+    old_mrp = product.mrp
+    if (
+        mrp is not None
+        and old_mrp is not None
+        and float(mrp) != float(old_mrp)
+        and (old_price is None or float(old_price) == float(old_mrp))
+    ):
+        return mrp, "mrp"
+    return None, None
+
+
+def _log_price_change(price_change_log, *, store_id, style_code, old_price, new_price, changed_at, source):
+    if price_change_log is None:
+        return
+    price_change_log.append(
+        {
+            "store_id": store_id,
+            "style_code": style_code,
+            "old_price": old_price if old_price is not None else 0.0,
+            "new_price": new_price,
+            "changed_at": changed_at.isoformat(),
+            "source": source,
+        }
+    )
+
+
 def finalize_product_upsert(
     db,
     product,
@@ -1004,44 +1723,37 @@ def finalize_product_upsert(
     return_product=False,
     flush_on_insert=False,
     price_change_log=None,
+    price_history=None,
 ):
+    """Update or insert one product.
+
+    With a ``price_history`` list the price change is only staged there, for
+    the caller to write with ``insert_price_history`` once per batch.
+    """
     if product:
         old_price = product.price
-        old_mrp = product.mrp
+        new_price, source = _resolve_pending_price(product, mrp=mrp, price=price)
         warn_store_mismatch(product, store_id, style_code)
         apply_product_updates(product, values)
-        if price is not None:
-            price_changed_at = apply_price_update(db, product, price)
-            if price_changed_at and price_change_log is not None:
-                price_change_log.append(
-                    {
-                        "store_id": store_id,
-                        "style_code": style_code,
-                        "old_price": old_price if old_price is not None else 0.0,
-                        "new_price": price,
-                        "changed_at": price_changed_at.isoformat(),
-                        "source": "price",
-                    }
+        if new_price is not None:
+            if price_history is None:
+                price_changed_at = apply_price_update(db, product, new_price)
+            else:
+                history_values = stage_price_update(product, new_price)
+                price_changed_at = None
+                if history_values is not None:
+                    price_history.append(history_values)
+                    price_changed_at = history_values["changed_at"]
+            if price_changed_at:
+                _log_price_change(
+                    price_change_log,
+                    store_id=store_id,
+                    style_code=style_code,
+                    old_price=old_price,
+                    new_price=new_price,
+                    changed_at=price_changed_at,
+                    source=source,
                 )
-        else:
-            if (
-                mrp is not None
-                and old_mrp is not None
-                and float(mrp) != float(old_mrp)
-                and (old_price is None or float(old_price) == float(old_mrp))
-            ):
-                mrp_changed_at = apply_price_update(db, product, mrp)
-                if mrp_changed_at and price_change_log is not None:
-                    price_change_log.append(
-                        {
-                            "store_id": store_id,
-                            "style_code": style_code,
-                            "old_price": old_price if old_price is not None else 0.0,
-                            "new_price": mrp,
-                            "changed_at": mrp_changed_at.isoformat(),
-                            "source": "mrp",
-                        }
-                    )
         if return_product:
             return "updated", product
         return "updated"
@@ -1064,9 +1776,8 @@ def build_product(values, mrp, price):
     return product
 
 
-def upsert_product_from_daily_update(db, row, *, price_change_log=None):
+def parse_daily_update_product(row, context=None):
     store_id = to_int(row.get("store_id"), "store_id")
-    ensure_store_exists(db, store_id)
     style_code = to_str(row.get("style_code"), "style_code")
     barcode_value = row.get("barcode")
     barcode = (
@@ -1087,76 +1798,122 @@ def upsert_product_from_daily_update(db, row, *, price_change_log=None):
     supplier_name = to_str(row.get("supplier_name"), "supplier_name")
     mrp = to_float(row.get("mrp"), "mrp")
     price = parse_optional_price(row)
-    image_url, image_explicit = resolve_image_url(row)
+    image_url, image_explicit = resolve_image_url(row, context=context)
     department_name = to_str(row.get("department_name"), "department_name")
+    return {
+        "store_id": store_id,
+        "style_code": style_code,
+        "barcode": barcode,
+        "article_name": article_name,
+        "category": category,
+        "supplier_name": supplier_name,
+        "mrp": mrp,
+        "price": price,
+        "image_url": image_url,
+        "image_explicit": image_explicit,
+        "department_name": department_name,
+    }
 
-    product = get_existing(
-        db,
-        Product,
-        None,
-        Product.style_code == style_code,
-        Product.store_id == store_id,
-    )
-    values = build_product_values(
-        store_id=store_id,
-        style_code=style_code,
-        barcode=barcode,
-        article_name=article_name,
-        category=category,
-        supplier_name=supplier_name,
-        mrp=mrp,
+
+def parse_daily_update_inventory(row):
+    quantity = to_int(row.get("quantity"), "quantity", required=False)
+    if quantity is None:
+        quantity = 0
+    mrp = to_float(row.get("mrp"), "mrp")
+    cost_price = resolve_price(row.get("cost_price"), mrp, "cost_price")
+    current_price = resolve_price(row.get("current_price"), mrp, "current_price")
+    lifecycle_start_date = resolve_lifecycle_start_date(row)
+    return {
+        "quantity": quantity,
+        "cost_price": cost_price,
+        "current_price": current_price,
+        "lifecycle_start_date": lifecycle_start_date,
+    }
+
+
+def _build_daily_update_product_values(fields, product):
+    return build_product_values(
+        store_id=fields["store_id"],
+        style_code=fields["style_code"],
+        barcode=fields["barcode"],
+        article_name=fields["article_name"],
+        category=fields["category"],
+        supplier_name=fields["supplier_name"],
+        mrp=fields["mrp"],
         product=product,
-        image_url=image_url,
-        image_explicit=image_explicit,
-        department_name=department_name,
+        image_url=fields["image_url"],
+        image_explicit=fields["image_explicit"],
+        department_name=fields["department_name"],
     )
-    return finalize_product_upsert(
+
+
+def upsert_product_from_daily_update(
+    db, row, *, price_change_log=None, context=None, price_history=None
+):
+    fields = parse_daily_update_product(row, context)
+    store_id = fields["store_id"]
+    style_code = fields["style_code"]
+    ensure_store_exists(db, store_id, context)
+
+    if context is not None:
+        product = context.find_product(db, store_id, style_code)
+    else:
+        product = get_existing(
+            db,
+            Product,
+            None,
+            Product.style_code == style_code,
+            Product.store_id == store_id,
+        )
+    values = _build_daily_update_product_values(fields, product)
+    action, product = finalize_product_upsert(
         db,
         product,
         values,
-        mrp=mrp,
-        price=price,
+        mrp=fields["mrp"],
+        price=fields["price"],
         store_id=store_id,
         style_code=style_code,
         return_product=True,
         flush_on_insert=True,
         price_change_log=price_change_log,
+        price_history=price_history,
     )
+    if context is not None:
+        context.remember_product(product)
+    return action, product
 
 
 def upsert_inventory_from_daily_update(db, row, product):
-    store_id = product.store_id
-    product_id = product.id
-    quantity = to_int(row.get("quantity"), "quantity", required=False)
-    if quantity is None:
-        quantity = 0
-    mrp = to_float(row.get("mrp"), "mrp")
-    cost_price = resolve_price(row.get("cost_price"), mrp, "cost_price")
-    current_price = resolve_price(row.get("current_price"), mrp, "current_price")
-    lifecycle_start_date = resolve_lifecycle_start_date(row)
-
+    values = {
+        "store_id": product.store_id,
+        "product_id": product.id,
+        **parse_daily_update_inventory(row),
+    }
     inventory = get_existing(
         db,
         Inventory,
         None,
-        Inventory.store_id == store_id,
-        Inventory.product_id == product_id,
+        Inventory.store_id == product.store_id,
+        Inventory.product_id == product.id,
     )
-    values = {
-        "store_id": store_id,
-        "product_id": product_id,
-        "quantity": quantity,
-        "cost_price": cost_price,
-        "current_price": current_price,
-        "lifecycle_start_date": lifecycle_start_date,
-    }
+    if inventory is not None and inventory.quantity != values["quantity"]:
+        db.add(
+            InventoryDelta(
+                store_id=product.store_id,
+                product_id=product.id,
+                observed_date=date.today(),
+                previous_quantity=inventory.quantity,
+                quantity=values["quantity"],
+            )
+        )
     return apply_upsert(db, inventory, Inventory, values)
 
 
-def import_daily_update_row(db, row, *, price_change_log=None):
+def import_daily_update_row(db, row, *, price_change_log=None, context=None, price_history=None):
     counts = {"inserted": 0, "updated": 0, "skipped": 0}
     product_action, product = upsert_product_from_daily_update(
-        db, row, price_change_log=price_change_log
+        db, row, price_change_log=price_change_log, context=context, price_history=price_history
     )
     counts[product_action] += 1
     inventory_action = upsert_inventory_from_daily_update(db, row, product)
@@ -1164,54 +1921,773 @@ def import_daily_update_row(db, row, *, price_change_log=None):
     return counts
 
 
-def import_rows(db, sheet_name, rows):
-    counts = {"inserted": 0, "updated": 0, "skipped": 0, "price_changes": []}
-    price_change_log = counts["price_changes"]
-    for row in rows:
-        if sheet_name == DAILY_UPDATE_SHEET:
-            row_counts = import_daily_update_row(db, row, price_change_log=price_change_log)
+def _bulk_insert_factory(db):
+    dialect_name = db.get_bind().dialect.name
+    if dialect_name == "sqlite":
+        return sqlite_insert
+    if dialect_name == "postgresql":
+        return postgresql_insert
+    return None
+
+
+def _iter_batches(items, size=_BULK_BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _iter_chunks(rows, size):
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _ensure_stores_exist_bulk(db, store_ids, context=None):
+    if not should_create_missing_stores() or not store_ids:
+        return
+    if context is not None:
+        store_ids = [store_id for store_id in store_ids if not context.has_store(store_id)]
+        if not store_ids:
+            return
+    existing = set(
+        db.execute(sa_select(Store.id).where(Store.id.in_(store_ids))).scalars()
+    )
+    missing = sorted(store_id for store_id in store_ids if store_id not in existing)
+    if missing:
+        db.execute(
+            sa_insert(Store),
+            [
+                {"id": store_id, "name": f"Store {store_id}", "city": "Unknown"}
+                for store_id in missing
+            ],
+        )
+    if context is not None:
+        context.store_ids.update(store_ids)
+
+
+def _load_product_states(db, store_ids):
+    columns = [Product.id, *(getattr(Product, name) for name in _PRODUCT_BULK_COLUMNS)]
+    states = {}
+    for row in db.execute(sa_select(*columns).where(Product.store_id.in_(store_ids))):
+        states[(row.store_id, row.style_code)] = SimpleNamespace(**row._asdict())
+    return states
+
+
+def _load_inventory_states(db, store_ids):
+    columns = [Inventory.id, *(getattr(Inventory, name) for name in _INVENTORY_BULK_COLUMNS)]
+    states = {}
+    stmt = (
+        sa_select(*columns)
+        .where(Inventory.store_id.in_(store_ids))
+        .order_by(Inventory.id)
+    )
+    for row in db.execute(stmt):
+        states.setdefault((row.store_id, row.product_id), row._asdict())
+    return states
+
+
+def _upsert_products_bulk(db, insert_factory, product_rows):
+    for batch in _iter_batches(product_rows):
+        stmt = insert_factory(Product)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["store_id", "style_code"],
+            set_={
+                name: stmt.excluded[name]
+                for name in _PRODUCT_BULK_COLUMNS
+                if name not in ("store_id", "style_code", "created_at")
+            },
+        )
+        db.execute(stmt, batch)
+
+
+def _load_product_ids(db, keys):
+    """Return ``{(store_id, style_code): product id}`` for the given keys."""
+    product_ids = {}
+    for batch in _iter_batches(sorted(keys)):
+        stmt = sa_select(Product.id, Product.store_id, Product.style_code).where(
+            sa_tuple(Product.store_id, Product.style_code).in_(batch)
+        )
+        product_ids.update(((row.store_id, row.style_code), row.id) for row in db.execute(stmt))
+    return product_ids
+
+
+def _load_inventory_ids(db, product_ids):
+    """Return ``{product_id: inventory id}``, keeping the oldest row per product."""
+    inventory_ids = {}
+    for batch in _iter_batches(sorted(product_ids)):
+        stmt = (
+            sa_select(Inventory.id, Inventory.product_id)
+            .where(Inventory.product_id.in_(batch))
+            .order_by(Inventory.id)
+        )
+        for row in db.execute(stmt):
+            inventory_ids.setdefault(row.product_id, row.id)
+    return inventory_ids
+
+
+def _upsert_product_images(db, product_images):
+    """Point each style code at its content-addressed image in ``product_images``."""
+    if not product_images:
+        return
+    now = datetime.now(timezone.utc)
+    image_rows = [
+        {
+            "style_code": style_code,
+            "sha256": Path(image_url).stem,
+            "image_url": image_url,
+            "updated_at": now,
+        }
+        for style_code, image_url in sorted(product_images.items())
+    ]
+    insert_factory = _bulk_insert_factory(db)
+    if insert_factory is None:
+        existing = {
+            image.style_code: image
+            for image in db.execute(
+                sa_select(ProductImage).where(ProductImage.style_code.in_(product_images))
+            ).scalars()
+        }
+        for values in image_rows:
+            image = existing.get(values["style_code"])
+            if image is None:
+                db.add(ProductImage(**values))
+            elif image.sha256 != values["sha256"]:
+                apply_upsert(db, image, ProductImage, values)
+        return
+    for batch in _iter_batches(image_rows):
+        stmt = insert_factory(ProductImage)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["style_code"],
+            set_={
+                "sha256": stmt.excluded.sha256,
+                "image_url": stmt.excluded.image_url,
+                "updated_at": stmt.excluded.updated_at,
+            },
+            where=ProductImage.sha256 != stmt.excluded.sha256,
+        )
+        db.execute(stmt, batch)
+
+
+def fingerprint_daily_update_row(product_fields, inventory_values):
+    payload = {
+        "version": _ROW_FINGERPRINT_VERSION,
+        "product": product_fields,
+        "inventory": inventory_values,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _fingerprint_value(value):
+    # Integer and REAL columns read back as int or float whatever was written.
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def _stored_row_fingerprint(row_hash, product, inventory):
+    """Combine a row's content hash with the product and inventory state it left behind."""
+    payload = {
+        "row": row_hash,
+        "product": {
+            name: _fingerprint_value(getattr(product, name))
+            for name in _FINGERPRINT_PRODUCT_COLUMNS
+        },
+        "inventory": {
+            name: _fingerprint_value(inventory.get(name))
+            for name in _FINGERPRINT_INVENTORY_COLUMNS
+        },
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _load_row_fingerprints(db, store_ids):
+    stmt = sa_select(
+        ImportRowFingerprint.store_id,
+        ImportRowFingerprint.style_code,
+        ImportRowFingerprint.row_hash,
+    ).where(ImportRowFingerprint.store_id.in_(store_ids))
+    return {(row.store_id, row.style_code): row.row_hash for row in db.execute(stmt)}
+
+
+def _upsert_row_fingerprints(db, insert_factory, fingerprints):
+    now = datetime.now(timezone.utc)
+    fingerprint_rows = [
+        {"store_id": store_id, "style_code": style_code, "row_hash": row_hash, "updated_at": now}
+        for (store_id, style_code), row_hash in fingerprints.items()
+    ]
+    for batch in _iter_batches(fingerprint_rows):
+        stmt = insert_factory(ImportRowFingerprint)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["store_id", "style_code"],
+            set_={
+                "row_hash": stmt.excluded.row_hash,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        db.execute(stmt, batch)
+
+
+def import_daily_update_rows(db, rows, *, price_change_log=None, progress=None, context=None):
+    """Apply daily_update rows with set-based reads and batched writes.
+
+    Produces the same counts, price history and price change log as calling
+    ``import_daily_update_row`` for every row, but reads existing products and
+    inventory once per import and writes them with batched statements. Rows
+    whose normalized content matches the fingerprint stored by a previous
+    import, and whose product and inventory still hold what that import
+    wrote, are counted as ``unchanged`` and not applied again. Every quantity
+    change on existing inventory is appended to ``inventory_deltas``.
+
+    With a ``context`` the stored state is read through
+    ``ImportContext.load_daily_update_states`` and brought up to date with
+    what this call wrote, so later chunks of the same import reuse it.
+    """
+    counts = {"inserted": 0, "updated": 0, "skipped": 0, "unchanged": 0}
+    insert_factory = _bulk_insert_factory(db)
+    if insert_factory is None:
+        price_history = []
+        for row in rows:
+            row_counts = import_daily_update_row(
+                db,
+                row,
+                price_change_log=price_change_log,
+                context=context,
+                price_history=price_history,
+            )
             for key, value in row_counts.items():
                 counts[key] += value
+            if progress is not None:
+                progress.add_applied(1)
+        insert_price_history(db, price_history)
+        return counts
+
+    parsed = [
+        (parse_daily_update_product(row, context), parse_daily_update_inventory(row))
+        for row in rows
+    ]
+    if not parsed:
+        return counts
+
+    store_ids = sorted({fields["store_id"] for fields, _ in parsed})
+    db.flush()
+    _ensure_stores_exist_bulk(db, store_ids, context)
+    if context is not None:
+        existing_products, existing_inventory, fingerprints = context.load_daily_update_states(
+            db, store_ids
+        )
+    else:
+        existing_products = _load_product_states(db, store_ids)
+        existing_inventory = _load_inventory_states(db, store_ids)
+        fingerprints = _load_row_fingerprints(db, store_ids)
+
+    product_states = {}
+    original_products = {}
+    inventory_states = {}
+    row_hashes = {}
+    price_history = []
+    now = datetime.now(timezone.utc)
+
+    staged = parsed if progress is None else _count_applied_rows(parsed, progress)
+    for fields, inventory_values in staged:
+        key = (fields["store_id"], fields["style_code"])
+        row_hash = fingerprint_daily_update_row(fields, inventory_values)
+        if key in row_hashes:
+            unchanged = row_hashes[key] == row_hash
+        else:
+            stored_product = existing_products.get(key)
+            stored_inventory = (
+                existing_inventory.get((key[0], stored_product.id))
+                if stored_product is not None
+                else None
+            )
+            unchanged = (
+                key in fingerprints
+                and stored_inventory is not None
+                and fingerprints[key]
+                == _stored_row_fingerprint(row_hash, stored_product, stored_inventory)
+            )
+        if unchanged:
+            counts["unchanged"] += 1
+            continue
+        row_hashes[key] = row_hash
+
+        product = product_states.get(key)
+        if product is None and key in existing_products:
+            product = existing_products[key]
+            original_products[key] = dict(vars(product))
+            product_states[key] = product
+
+        values = _build_daily_update_product_values(fields, product)
+        if product is None:
+            price = fields["price"] if fields["price"] is not None else fields["mrp"]
+            product = SimpleNamespace(
+                **{
+                    "id": None,
+                    "image_url": None,
+                    **values,
+                    "price": price,
+                    "created_at": now,
+                    "last_price_update": now if price is not None else None,
+                }
+            )
+            product_states[key] = product
+            counts["inserted"] += 1
+        else:
+            old_price = product.price
+            new_price, source = _resolve_pending_price(
+                product, mrp=fields["mrp"], price=fields["price"]
+            )
+            apply_product_updates(product, values)
+            history_values = stage_price_update(product, new_price)
+            if history_values is not None:
+                price_history.append((key, history_values))
+                _log_price_change(
+                    price_change_log,
+                    store_id=fields["store_id"],
+                    style_code=fields["style_code"],
+                    old_price=old_price,
+                    new_price=new_price,
+                    changed_at=history_values["changed_at"],
+                    source=source,
+                )
+            counts["updated"] += 1
+
+        inventory = inventory_states.get(key)
+        if inventory is None and product.id is not None:
+            inventory = existing_inventory.get((product.store_id, product.id))
+            if inventory is not None:
+                inventory = dict(inventory, _original=dict(inventory))
+        if inventory is None:
+            inventory_states[key] = dict(inventory_values, id=None)
+            counts["inserted"] += 1
+        else:
+            inventory.update(inventory_values)
+            inventory_states[key] = inventory
+            counts["updated"] += 1
+
+    product_rows = []
+    for key, product in product_states.items():
+        current = vars(product)
+        if original_products.get(key) == current:
+            continue
+        product_rows.append({name: current[name] for name in _PRODUCT_BULK_COLUMNS})
+    _upsert_products_bulk(db, insert_factory, product_rows)
+
+    product_ids = {key: product.id for key, product in product_states.items()}
+    new_keys = [key for key, product_id in product_ids.items() if product_id is None]
+    if new_keys:
+        product_ids.update(_load_product_ids(db, new_keys))
+
+    insert_price_history(
+        db,
+        [dict(history_values, product_id=product_ids[key]) for key, history_values in price_history],
+    )
+
+    inventory_inserts = []
+    inventory_updates = []
+    inventory_deltas = []
+    observed_date = date.today()
+    for key, inventory in inventory_states.items():
+        values = {name: inventory.get(name) for name in _INVENTORY_BULK_COLUMNS}
+        values["store_id"] = key[0]
+        values["product_id"] = product_ids[key]
+        if inventory["id"] is None:
+            inventory_inserts.append(values)
+            continue
+        original = inventory["_original"]
+        if all(original[name] == values[name] for name in _INVENTORY_BULK_COLUMNS):
             continue
+        inventory_updates.append(dict(values, id=inventory["id"]))
+        if original["quantity"] != values["quantity"]:
+            inventory_deltas.append(
+                {
+                    "store_id": values["store_id"],
+                    "product_id": values["product_id"],
+                    "observed_date": observed_date,
+                    "previous_quantity": original["quantity"],
+                    "quantity": values["quantity"],
+                }
+            )
+    for batch in _iter_batches(inventory_inserts):
+        db.execute(sa_insert(Inventory), batch)
+    for batch in _iter_batches(inventory_updates):
+        db.execute(sa_update(Inventory), batch)
+    for batch in _iter_batches(inventory_deltas):
+        db.execute(sa_insert(InventoryDelta), batch)
+    written_fingerprints = {
+        key: _stored_row_fingerprint(row_hash, product_states[key], inventory_states[key])
+        for key, row_hash in row_hashes.items()
+    }
+    _upsert_row_fingerprints(db, insert_factory, written_fingerprints)
+    if context is not None:
+        inventory_ids = _load_inventory_ids(db, [values["product_id"] for values in inventory_inserts])
+        for key, product in product_states.items():
+            product.id = product_ids[key]
+            existing_products[key] = product
+            inventory = {name: inventory_states[key].get(name) for name in _INVENTORY_BULK_COLUMNS}
+            inventory["store_id"] = key[0]
+            inventory["product_id"] = product.id
+            inventory["id"] = inventory_states[key]["id"] or inventory_ids[product.id]
+            existing_inventory[(key[0], product.id)] = inventory
+        fingerprints.update(written_fingerprints)
+        context.remember_product_ids(product_ids)
+
+    return counts
+
+
+def _load_report_product_ids(db, store_ids, column, values):
+    """Return ``{(store_id, value): product_id}`` for products whose ``column`` is in ``values``."""
+    product_ids = {}
+    for batch in _iter_batches(sorted(values)):
+        stmt = sa_select(Product.id, Product.store_id, column).where(
+            Product.store_id.in_(store_ids),
+            column.in_(batch),
+        )
+        for product_id, store_id, value in db.execute(stmt):
+            product_ids.setdefault((store_id, value), product_id)
+    return product_ids
+
+
+def _write_report_totals_preloaded(db, model, date_field, quantity_field, totals):
+    """Write ``{(store_id, product_id, date): quantity}`` and return ``(inserted, updated)``.
+
+    Dialect-neutral: existing rows are read first, and only new keys and
+    changed quantities are written.
+    """
+    date_column = getattr(model, date_field)
+    key_columns = sa_tuple(model.store_id, model.product_id, date_column)
+    existing = {}
+    for batch in _iter_batches(list(totals)):
+        stmt = sa_select(
+            model.id,
+            model.store_id,
+            model.product_id,
+            date_column,
+            getattr(model, quantity_field),
+        ).where(key_columns.in_(batch))
+        for row_id, store_id, product_id, day, quantity in db.execute(stmt):
+            existing[(store_id, product_id, day)] = (row_id, quantity)
+
+    inserts = []
+    updates = []
+    for (store_id, product_id, day), quantity in totals.items():
+        current = existing.get((store_id, product_id, day))
+        if current is None:
+            inserts.append(
+                {"store_id": store_id, "product_id": product_id, date_field: day, quantity_field: quantity}
+            )
+        elif current[1] != quantity:
+            updates.append({"id": current[0], quantity_field: quantity})
+    for batch in _iter_batches(inserts, _REPORT_BATCH_SIZE):
+        db.execute(model.__table__.insert(), batch)
+    for batch in _iter_batches(updates, _REPORT_BATCH_SIZE):
+        db.execute(sa_update(model), batch)
+    return len(inserts), len(updates)
+
+
+def stage_report_rows(db, sheet_name, rows, import_key, *, progress=None):
+    """Match report lines to products and stage them in ``report_import_lines``.
+
+    Rows are read in batches of ``_REPORT_BATCH_SIZE``, so a report of any
+    length is held in memory one batch at a time; lines are matched by store
+    and style code (or barcode) and summed per store, product and day within
+    the batch. ``merge_report_rows`` later sums the staged lines of the whole
+    sheet. Returns ``{"skipped": n}`` for lines that matched no product or
+    lack a date or quantity.
+    """
+    _, (date_field, _), (quantity_field, _) = REPORT_SHEETS[sheet_name]
+    skipped = 0
+    for batch in _iter_chunks(rows, _REPORT_BATCH_SIZE):
+        # Resolve by style code first; barcodes are only looked up for the rest.
+        lines = [
+            (
+                row.get("store_id"),
+                _clean_text(row.get("style_code")),
+                _clean_text(row.get("barcode")),
+                row.get(date_field),
+                row.get(quantity_field),
+            )
+            for row in batch
+        ]
+        store_ids = sorted({line[0] for line in lines if not _is_blank(line[0])})
+        style_codes = {line[1] for line in lines if line[1]}
+        by_style = (
+            _load_report_product_ids(db, store_ids, Product.style_code, style_codes)
+            if store_ids and style_codes
+            else {}
+        )
+        barcodes = {
+            line[2] for line in lines if line[2] and (line[0], line[1]) not in by_style
+        }
+        by_barcode = (
+            _load_report_product_ids(db, store_ids, Product.barcode, barcodes)
+            if store_ids and barcodes
+            else {}
+        )
+
+        totals = {}
+        for store_id, style_code, barcode, day, quantity in lines:
+            product_id = by_style.get((store_id, style_code))
+            if product_id is None:
+                product_id = by_barcode.get((store_id, barcode))
+            if product_id is None or _is_blank(day) or _is_blank(quantity):
+                skipped += 1
+                continue
+            key = (store_id, product_id, day)
+            totals[key] = totals.get(key, 0) + quantity
+        if totals:
+            db.execute(
+                sa_insert(ReportImportLine),
+                [
+                    {
+                        "import_key": import_key,
+                        "sheet_key": sheet_name,
+                        "store_id": store_id,
+                        "product_id": product_id,
+                        "report_date": day,
+                        "quantity": quantity,
+                    }
+                    for (store_id, product_id, day), quantity in totals.items()
+                ],
+            )
+        if progress is not None:
+            progress.add_applied(len(batch))
+    return {"skipped": skipped}
+
+
+def merge_report_rows(db, sheet_name, import_key):
+    """Write a sheet's staged lines into ``sales``/``purchases`` and drop them.
+
+    Lines are summed per ``(store_id, product_id, date)`` in the database. A
+    date that is already stored is replaced, not added to, so re-importing a
+    report is harmless. Returns ``inserted``, ``updated`` and ``unchanged``
+    counts.
+    """
+    model, (date_field, _), (quantity_field, _) = REPORT_SHEETS[sheet_name]
+    staged = (
+        ReportImportLine.import_key == import_key,
+        ReportImportLine.sheet_key == sheet_name,
+    )
+    grouped = (
+        sa_select(
+            ReportImportLine.store_id,
+            ReportImportLine.product_id,
+            ReportImportLine.report_date,
+            func.sum(ReportImportLine.quantity).label("quantity"),
+        )
+        .where(*staged)
+        .group_by(
+            ReportImportLine.store_id,
+            ReportImportLine.product_id,
+            ReportImportLine.report_date,
+        )
+    )
+
+    insert_factory = _bulk_insert_factory(db)
+    if insert_factory is None:
+        total = 0
+        inserted = 0
+        updated = 0
+        result = db.execute(grouped.execution_options(yield_per=_REPORT_BATCH_SIZE))
+        for partition in result.partitions():
+            totals = {(store_id, product_id, day): quantity for store_id, product_id, day, quantity in partition}
+            written = _write_report_totals_preloaded(db, model, date_field, quantity_field, totals)
+            total += len(totals)
+            inserted += written[0]
+            updated += written[1]
+    else:
+        groups = grouped.subquery()
+        total = db.execute(sa_select(func.count()).select_from(groups)).scalar_one()
+        inserted = db.execute(
+            sa_select(func.count())
+            .select_from(groups)
+            .where(
+                ~sa_select(model.id)
+                .where(
+                    model.store_id == groups.c.store_id,
+                    model.product_id == groups.c.product_id,
+                    getattr(model, date_field) == groups.c.report_date,
+                )
+                .exists()
+            )
+        ).scalar_one()
+        upsert = insert_factory(model).from_select(
+            ["store_id", "product_id", date_field, quantity_field], grouped
+        )
+        upsert = upsert.on_conflict_do_update(
+            index_elements=["store_id", "product_id", date_field],
+            set_={quantity_field: upsert.excluded[quantity_field]},
+            where=getattr(model, quantity_field) != upsert.excluded[quantity_field],
+        )
+        updated = max(0, db.execute(upsert).rowcount) - inserted
+    db.execute(sa_delete(ReportImportLine).where(*staged))
+    return {"inserted": inserted, "updated": updated, "unchanged": total - inserted - updated}
+
+
+def import_report_rows(db, sheet_name, rows, *, progress=None):
+    """Load sold/purchase report rows into ``sales``/``purchases``.
+
+    Stages the rows under a key of their own and merges them at once; chunked
+    imports stage each chunk and merge when the sheet ends instead.
+    """
+    import_key = uuid.uuid4().hex
+    counts = stage_report_rows(db, sheet_name, rows, import_key, progress=progress)
+    counts.update(merge_report_rows(db, sheet_name, import_key))
+    return counts
+
+
+def derive_inferred_sales(db, *, since=None):
+    """Turn quantity drops in ``inventory_deltas`` into ``inferred_sales`` rows.
+
+    Drops are summed per store, product and day in the database with a single
+    grouped statement; increases (restocks, transfers in) are ignored. Days
+    on or after ``since`` (every day when ``None``) are recomputed, so running
+    the job again is harmless. Returns the number of rows inserted or changed.
+    """
+    stmt = sa_select(
+        InventoryDelta.store_id,
+        InventoryDelta.product_id,
+        InventoryDelta.observed_date,
+        func.sum(InventoryDelta.previous_quantity - InventoryDelta.quantity),
+    ).where(InventoryDelta.quantity < InventoryDelta.previous_quantity)
+    if since is not None:
+        stmt = stmt.where(InventoryDelta.observed_date >= since)
+    stmt = stmt.group_by(
+        InventoryDelta.store_id,
+        InventoryDelta.product_id,
+        InventoryDelta.observed_date,
+    )
+
+    insert_factory = _bulk_insert_factory(db)
+    if insert_factory is None:
+        totals = {
+            (store_id, product_id, day): int(quantity)
+            for store_id, product_id, day, quantity in db.execute(stmt)
+        }
+        return sum(
+            _write_report_totals_preloaded(db, InferredSale, "sale_date", "quantity_sold", totals)
+        )
+
+    upsert = insert_factory(InferredSale).from_select(
+        ["store_id", "product_id", "sale_date", "quantity_sold"], stmt
+    )
+    upsert = upsert.on_conflict_do_update(
+        index_elements=["store_id", "product_id", "sale_date"],
+        set_={"quantity_sold": upsert.excluded.quantity_sold},
+        where=InferredSale.quantity_sold != upsert.excluded.quantity_sold,
+    )
+    return max(0, db.execute(upsert).rowcount)
+
+
+def import_rows(db, sheet_name, rows, *, progress=None, context=None):
+    """Apply one sheet's rows; ``progress``, if given, receives ``add_applied(n)`` calls.
+
+    ``context`` is the run's ``ImportContext``; without one every row looks
+    up its store, product and image afresh.
+    """
+    counts = {"inserted": 0, "updated": 0, "skipped": 0, "price_changes": []}
+    price_change_log = counts["price_changes"]
+    if sheet_name == DAILY_UPDATE_SHEET:
+        row_counts = import_daily_update_rows(
+            db, rows, price_change_log=price_change_log, progress=progress, context=context
+        )
+        for key, value in row_counts.items():
+            counts[key] = counts.get(key, 0) + value
+        return counts
+    if sheet_name in REPORT_SHEETS:
+        counts.update(import_report_rows(db, sheet_name, rows, progress=progress))
+        return counts
+    price_history = []
+    for row in rows:
         if sheet_name == "stores":
             action = upsert_store(db, row)
         elif sheet_name == "products":
-            action = upsert_product(db, row, price_change_log=price_change_log)
+            action = upsert_product(
+                db,
+                row,
+                price_change_log=price_change_log,
+                context=context,
+                price_history=price_history,
+            )
         elif sheet_name == "inventory":
-            action = upsert_inventory(db, row)
+            action = upsert_inventory(db, row, context=context)
         else:
             raise ValueError(f"Unsupported sheet: {sheet_name}")
         counts[action] += 1
+        if progress is not None:
+            progress.add_applied(1)
+    insert_price_history(db, price_history)
+    if context is not None and sheet_name != "stores":
+        context.forget_daily_update_states()
     return counts
 
 
-def import_workbook(workbook_path, sheets=None, dry_run=False):
-    workbook_path = Path(workbook_path)
-    if not workbook_path.exists():
-        raise FileNotFoundError(f"File not found: {workbook_path}")
-    if workbook_path.suffix.lower() != ".xlsx":
-        raise ValueError("Only .xlsx files are supported.")
-
-    workbook = load_workbook(workbook_path, data_only=True)
-    sheet_map = {normalize_sheet_name(name): name for name in workbook.sheetnames}
-    daily_update_aliases = get_daily_update_aliases()
-    apply_daily_update_aliases(sheet_map, daily_update_aliases)
+@dataclass
+class ParsedSheet:
+    """Compact, picklable rows of one parsed worksheet.
+
+    Rows are stored as tuples ordered like ``columns`` so they are cheap to
+    send back from a parse worker process. ``rejects`` lists the cells that
+    failed type coercion; their rows are not in ``rows``.
+    """
+
+    key: str
+    columns: tuple
+    rows: list
+    rejects: list = field(default_factory=list)
+
+    @classmethod
+    def from_records(cls, key, columns, records, rejects=None):
+        ordered = tuple(sorted(columns))
+        rows = [tuple(record.get(column) for column in ordered) for record in records]
+        return cls(key=key, columns=ordered, rows=rows, rejects=rejects if rejects is not None else [])
+
+    def iter_records(self):
+        columns = self.columns
+        for values in self.rows:
+            yield dict(zip(columns, values))
+
+
+def _plan_sheet_imports(sheetnames, sheets):
+    sheet_map = {normalize_sheet_name(name): name for name in sheetnames}
+    sheet_aliases = {DAILY_UPDATE_SHEET: get_daily_update_aliases(), **get_report_sheet_aliases()}
+    for sheet_key, aliases in sheet_aliases.items():
+        _apply_sheet_aliases(sheet_map, sheet_key, aliases)
+    report_names = {sheet_map[key] for key in REPORT_SHEETS if key in sheet_map}
+    store_sheets = [
+        name
+        for name in sheetnames
+        if name not in report_names and _infer_store_id_from_sheet_name(name) is not None
+    ]
+    alias_keys = {
+        alias: sheet_key for sheet_key, aliases in sheet_aliases.items() for alias in aliases
+    }
 
     sheet_list = normalize_sheet_list(sheets)
     if sheet_list:
         requested = []
         for name in sheet_list:
             key = normalize_sheet_name(name)
-            if key in daily_update_aliases:
-                key = DAILY_UPDATE_SHEET
-            requested.append(key)
+            requested.append(alias_keys.get(key, key))
     else:
         if DAILY_UPDATE_SHEET in sheet_map:
             requested = [DAILY_UPDATE_SHEET]
         else:
             requested = [name for name in DEFAULT_SHEET_ORDER if name in sheet_map]
+        reports = [name for name in REPORT_SHEET_ORDER if name in sheet_map]
+        if reports:
+            if not requested and store_sheets:
+                requested = [DAILY_UPDATE_SHEET]
+            requested += reports
 
     if not requested:
+        if store_sheets:
+            # One card-layout sheet per store: import them all as daily updates.
+            return [(DAILY_UPDATE_SHEET, name) for name in store_sheets]
         if len(sheet_map) == 1:
             only_key = next(iter(sheet_map))
             sheet_map[DAILY_UPDATE_SHEET] = sheet_map[only_key]
@@ -1219,6 +2695,436 @@ def import_workbook(workbook_path, sheets=None, dry_run=False):
         else:
             raise ValueError("No matching sheets found to import.")
 
+    plan = []
+    for sheet_key in requested:
+        actual_name = sheet_map.get(sheet_key)
+        if not actual_name and sheet_key == DAILY_UPDATE_SHEET and store_sheets:
+            plan.extend((DAILY_UPDATE_SHEET, name) for name in store_sheets)
+            continue
+        if not actual_name:
+            raise ValueError(f"Sheet not found: {sheet_key}")
+        plan.append((sheet_key, actual_name))
+    return plan
+
+
+def _group_by_sheet_key(entries):
+    """Group ``(sheet_key, item)`` pairs by key, keeping first-seen key order."""
+    grouped = {}
+    for sheet_key, item in entries:
+        grouped.setdefault(sheet_key, []).append(item)
+    return list(grouped.items())
+
+
+def _source_format(path):
+    """Return ``"xlsx"``, ``"csv"`` or ``"tsv"`` for a supported file name, else ``None``."""
+    suffixes = [suffix.lower() for suffix in Path(path).suffixes]
+    compressed = bool(suffixes) and suffixes[-1] == ".gz"
+    if compressed:
+        suffixes = suffixes[:-1]
+    source_format = _SOURCE_FORMATS.get(suffixes[-1]) if suffixes else None
+    if compressed and source_format == "xlsx":
+        return None
+    return source_format
+
+
+def is_supported_import_file(path):
+    return _source_format(path) is not None
+
+
+def _delimited_sheet_name(path):
+    name = Path(path).name
+    if name.lower().endswith(".gz"):
+        name = name[:-3]
+    return Path(name).stem
+
+
+class _DelimitedSource:
+    """Single-table stand-in for a workbook, backed by a CSV/TSV file."""
+
+    def __init__(self, path, delimiter):
+        self.path = Path(path)
+        self.delimiter = delimiter
+        self.sheetnames = [_delimited_sheet_name(path)]
+
+    def close(self):
+        pass
+
+
+def _open_delimited_text(path):
+    if str(path).lower().endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8-sig", newline="")
+    return open(path, encoding="utf-8-sig", newline="", buffering=_DELIMITED_READ_BUFFER)
+
+
+def iter_delimited_rows(path, delimiter=","):
+    """Return ``(columns, rows)`` for a CSV/TSV file, streaming rows lazily.
+
+    Headers and rows go through the same normalization and filtering as
+    tabular worksheets; empty fields become ``None`` like empty cells.
+    """
+    columns, records = iter_delimited_records(path, delimiter)
+    return columns, (record for _, record in records)
+
+
+def iter_delimited_records(path, delimiter=","):
+    """Like ``iter_delimited_rows`` but yields ``(row_number, record)`` pairs."""
+    handle = _open_delimited_text(path)
+    try:
+        reader = csv.reader(handle, delimiter=delimiter)
+        headers = next(reader, None)
+    except csv.Error as exc:
+        handle.close()
+        raise ValueError(f"{Path(path).name}: {exc}") from exc
+    except BaseException:
+        handle.close()
+        raise
+    if not headers:
+        handle.close()
+        return set(), iter(())
+    header_keys = [normalize_header(header) for header in headers]
+    columns = {key for key in header_keys if key}
+    return columns, _iter_delimited_records(path, handle, reader, header_keys, columns)
+
+
+def _iter_delimited_records(path, handle, reader, header_keys, columns):
+    with handle:
+        values = ([value if value != "" else None for value in row] for row in reader)
+        try:
+            yield from _iter_tabular_records(values, header_keys, columns)
+        except csv.Error as exc:
+            raise ValueError(f"{Path(path).name} line {reader.line_num}: {exc}") from exc
+
+
+def _open_source(path, streaming):
+    source_format = _source_format(path)
+    if source_format == "xlsx":
+        return load_workbook(path, read_only=streaming, data_only=True)
+    return _DelimitedSource(path, _DELIMITERS[source_format])
+
+
+def _source_sheet_records(source, actual_name):
+    if isinstance(source, _DelimitedSource):
+        return iter_delimited_records(source.path, source.delimiter)
+    return iter_sheet_records(source[actual_name])
+
+
+def _read_sheet_names(workbook_path):
+    """Read sheet names from the workbook part only, without loading any sheet."""
+    if _source_format(workbook_path) != "xlsx":
+        return [_delimited_sheet_name(workbook_path)]
+    reader = ExcelReader(str(workbook_path), read_only=True, keep_links=False)
+    try:
+        reader.read_manifest()
+        reader.read_workbook()
+        return [sheet.name for sheet in reader.parser.sheets]
+    finally:
+        reader.archive.close()
+
+
+def check_import_path(workbook_path):
+    """Return ``workbook_path`` as a Path, or raise if it is missing or unsupported."""
+    workbook_path = Path(workbook_path)
+    if not workbook_path.exists():
+        raise FileNotFoundError(f"File not found: {workbook_path}")
+    if _source_format(workbook_path) is None:
+        raise ValueError("Only .xlsx, .csv and .tsv (optionally .gz) files are supported.")
+    return workbook_path
+
+
+def _parse_planned_sheets(source, plan):
+    parsed = []
+    for sheet_key, actual_name in plan:
+        columns, records = _read_sheet_records(source, sheet_key, actual_name)
+        rejects = []
+        rows = coerce_sheet_records(sheet_key, actual_name, records, rejects)
+        parsed.append(ParsedSheet.from_records(sheet_key, columns, rows, rejects))
+    return parsed
+
+
+def parse_workbook(workbook_path, sheets=None, streaming=True):
+    """Parse and validate the requested sheets without touching the database."""
+    workbook_path = check_import_path(workbook_path)
+    source = _open_source(workbook_path, streaming)
+    try:
+        return _parse_planned_sheets(source, _plan_sheet_imports(source.sheetnames, sheets))
+    finally:
+        source.close()
+
+
+def parse_workbook_sheets(workbook_path, plan, streaming=True):
+    """Parse an explicit ``[(sheet_key, sheet_name)]`` plan; the unit of work of a parse worker."""
+    source = _open_source(workbook_path, streaming)
+    try:
+        parsed = _parse_planned_sheets(source, plan)
+    finally:
+        source.close()
+    return _drop_unwritten_images(parsed)
+
+
+def _get_parse_pool(max_workers):
+    global _PARSE_POOL, _PARSE_POOL_WORKERS
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None or _PARSE_POOL_WORKERS != max_workers:
+            if _PARSE_POOL is not None:
+                _PARSE_POOL.shutdown(wait=False, cancel_futures=True)
+            # spawn keeps the child free of the API's threads and open sockets.
+            _PARSE_POOL = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _PARSE_POOL_WORKERS = max_workers
+        return _PARSE_POOL
+
+
+def shutdown_parse_pool():
+    global _PARSE_POOL, _PARSE_POOL_WORKERS
+    with _PARSE_POOL_LOCK:
+        pool = _PARSE_POOL
+        _PARSE_POOL = None
+        _PARSE_POOL_WORKERS = 0
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _discard_parse_pool(pool):
+    global _PARSE_POOL, _PARSE_POOL_WORKERS
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is pool:
+            _PARSE_POOL = None
+            _PARSE_POOL_WORKERS = 0
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def parse_workbook_in_worker(workbook_path, sheets=None, streaming=True, max_workers=1):
+    """Parse the workbook in the shared process pool, one task per planned sheet.
+
+    Multi-store workbooks therefore parse their store sheets concurrently, up
+    to ``max_workers`` at a time. Results keep the plan order.
+    """
+    workbook_path = check_import_path(workbook_path)
+    plan = _plan_sheet_imports(_read_sheet_names(workbook_path), sheets)
+    pool = _get_parse_pool(max(1, int(max_workers)))
+    try:
+        futures = [
+            pool.submit(parse_workbook_sheets, str(workbook_path), [entry], streaming)
+            for entry in plan
+        ]
+        parsed = []
+        for future in futures:
+            parsed.extend(future.result())
+        return parsed
+    except BrokenProcessPool:
+        logger.warning("Workbook parse worker died; parsing %s in-process.", workbook_path)
+        _discard_parse_pool(pool)
+        return parse_workbook_sheets(workbook_path, plan, streaming)
+
+
+def import_workbook(
+    workbook_path,
+    sheets=None,
+    dry_run=False,
+    streaming=None,
+    parse_workers=None,
+    progress=None,
+    chunk_rows=None,
+    source_sha256=None,
+):
+    """Import a workbook or CSV/TSV file.
+
+    ``progress`` is an optional object with ``set_phase``, ``set_total``,
+    ``add_parsed`` and ``add_applied`` methods, called from the importing
+    thread as the import advances.
+
+    Unless ``dry_run`` is set, rows are committed every ``chunk_rows`` rows
+    (``EXCEL_IMPORT_CHUNK_ROWS``) together with a checkpoint keyed by the
+    file's SHA-256, and a retry of the same content resumes after the last
+    committed chunk.
+    """
+    workbook_path = check_import_path(workbook_path)
+    settings = get_settings()
+    if streaming is None:
+        streaming = bool(settings.EXCEL_STREAMING_IMPORT)
+    if parse_workers is None:
+        parse_workers = int(settings.EXCEL_PARSE_WORKERS)
+    if chunk_rows is None:
+        chunk_rows = int(settings.EXCEL_IMPORT_CHUNK_ROWS)
+    if dry_run:
+        chunk_rows = 0
+    if chunk_rows > 0 and source_sha256 is None:
+        source_sha256 = compute_file_sha256(workbook_path)
+    apply_options = {"chunk_rows": chunk_rows, "source_sha256": source_sha256}
+
+    if progress is not None:
+        progress.set_phase("parsing")
+    if parse_workers > 0:
+        parsed = parse_workbook_in_worker(
+            workbook_path,
+            sheets=sheets,
+            streaming=streaming,
+            max_workers=parse_workers,
+        )
+        if progress is not None:
+            row_total = sum(len(sheet.rows) for sheet in parsed)
+            progress.set_total(row_total)
+            progress.add_parsed(row_total)
+            progress.set_phase("applying")
+        return apply_parsed_sheets(parsed, dry_run=dry_run, progress=progress, **apply_options)
+
+    source = _open_source(workbook_path, streaming)
+    try:
+        return _import_loaded_workbook(
+            source,
+            sheets=sheets,
+            dry_run=dry_run,
+            progress=progress,
+            **apply_options,
+        )
+    finally:
+        source.close()
+
+
+def _count_parsed_rows(rows, progress):
+    for row in rows:
+        progress.add_parsed(1)
+        yield row
+
+
+def _count_applied_rows(rows, progress, batch_size=_BULK_BATCH_SIZE):
+    """Yield ``rows``, reporting them to ``progress`` every ``batch_size`` rows."""
+    done = 0
+    for row in rows:
+        yield row
+        done += 1
+        if done == batch_size:
+            progress.add_applied(done)
+            done = 0
+    if done:
+        progress.add_applied(done)
+
+
+def _import_loaded_workbook(source, *, sheets, dry_run, progress=None, **apply_options):
+    plan = _plan_sheet_imports(source.sheetnames, sheets)
+    rejects = {}
+
+    def _iter_rows(sheet_key, sheet_names):
+        sheet_rejects = rejects.setdefault(sheet_key, [])
+        for actual_name in sheet_names:
+            _, records = _read_sheet_records(source, sheet_key, actual_name)
+            if progress is not None:
+                records = _count_parsed_rows(records, progress)
+            yield from coerce_sheet_records(sheet_key, actual_name, records, sheet_rejects)
+
+    results = _apply_sheet_rows(
+        (
+            (sheet_key, _iter_rows(sheet_key, sheet_names))
+            for sheet_key, sheet_names in _group_by_sheet_key(plan)
+        ),
+        dry_run=dry_run,
+        progress=progress,
+        **apply_options,
+    )
+    return _attach_rejects(results, rejects)
+
+
+def apply_parsed_sheets(parsed_sheets, *, dry_run=False, progress=None, **apply_options):
+    """Apply parsed sheets in one transaction.
+
+    Sheets that share a key (such as per-store daily update sheets) are
+    merged into a single import so duplicates across sheets resolve the
+    same way they would inside one sheet.
+    """
+    grouped = _group_by_sheet_key((sheet.key, sheet) for sheet in parsed_sheets)
+    results = _apply_sheet_rows(
+        (
+            (sheet_key, (record for sheet in sheets for record in sheet.iter_records()))
+            for sheet_key, sheets in grouped
+        ),
+        dry_run=dry_run,
+        progress=progress,
+        **apply_options,
+    )
+    return _attach_rejects(
+        results,
+        {sheet_key: [reject for sheet in sheets for reject in sheet.rejects] for sheet_key, sheets in grouped},
+    )
+
+
+def _attach_rejects(results, rejects):
+    """Add each sheet's coercion ``rejects`` list to its counts."""
+    for sheet_key, counts in results.items():
+        counts["rejects"] = rejects.get(sheet_key, [])
+    return results
+
+
+def _merge_counts(total, counts):
+    for key, value in counts.items():
+        if isinstance(value, list):
+            total.setdefault(key, []).extend(value)
+        else:
+            total[key] = total.get(key, 0) + value
+    return total
+
+
+def _import_rows_chunked(
+    db, sheet_key, rows, *, chunk_rows, source_sha256, checkpoint, progress, context=None
+):
+    """Apply rows in committed chunks, skipping rows covered by ``checkpoint``.
+
+    Report sheets stage each chunk under the file's hash and are summed into
+    their table once the last chunk is in, so a line's date may span chunks.
+    """
+    rows_done = 0
+    counts = {}
+    report = sheet_key in REPORT_SHEETS
+    import_key = source_sha256 or uuid.uuid4().hex
+    if checkpoint is not None:
+        rows_done, counts = checkpoint
+        counts = dict(counts, price_changes=[], resumed_rows=rows_done)
+        rows = islice(rows, rows_done, None)
+        logger.info("Resuming %s import at row %s", sheet_key, rows_done)
+        if progress is not None:
+            progress.add_applied(rows_done)
+
+    for chunk in _iter_chunks(rows, chunk_rows):
+        if report:
+            chunk_counts = stage_report_rows(db, sheet_key, chunk, import_key, progress=progress)
+        else:
+            chunk_counts = import_rows(db, sheet_key, chunk, progress=progress, context=context)
+        _merge_counts(counts, chunk_counts)
+        rows_done += len(chunk)
+        if context is not None:
+            # Committed with the checkpoint: a resumed import skips these rows
+            # and would never see their images again.
+            _upsert_product_images(db, context.take_unsaved_images())
+        if source_sha256:
+            save_import_checkpoint(
+                db,
+                sha256=source_sha256,
+                sheet_key=sheet_key,
+                rows_done=rows_done,
+                counts=counts,
+            )
+        db.commit()
+        db.expunge_all()
+
+    if report:
+        counts = _merge_counts({"inserted": 0, "updated": 0, "skipped": 0, "price_changes": []}, counts)
+        _merge_counts(counts, merge_report_rows(db, sheet_key, import_key))
+        if source_sha256:
+            save_import_checkpoint(
+                db,
+                sha256=source_sha256,
+                sheet_key=sheet_key,
+                rows_done=rows_done,
+                counts=counts,
+            )
+        db.commit()
+    if not counts:
+        counts = import_rows(db, sheet_key, [], progress=progress, context=context)
+    return counts
+
+
+def _apply_sheet_rows(sheet_rows, *, dry_run, progress=None, chunk_rows=0, source_sha256=None):
     _import_models()
     Base.metadata.create_all(bind=engine)
     ensure_sqlite_schema()
@@ -1226,18 +3132,38 @@ def import_workbook(workbook_path, sheets=None, dry_run=False):
     results = {}
     db = SessionLocal()
     try:
-        for sheet_key in requested:
-            actual_name = sheet_map.get(sheet_key)
-            if not actual_name:
-                raise ValueError(f"Sheet not found: {sheet_key}")
-            worksheet = workbook[actual_name]
-            rows, columns = load_sheet_rows(worksheet)
-            validate_columns(sheet_key, columns)
-            results[sheet_key] = import_rows(db, sheet_key, rows)
+        context = ImportContext.load(db)
+        if dry_run or chunk_rows <= 0:
+            for sheet_key, rows in sheet_rows:
+                results[sheet_key] = import_rows(
+                    db, sheet_key, rows, progress=progress, context=context
+                )
+                results[sheet_key]["lookups"] = context.take_stats()
+        else:
+            checkpoints = load_import_checkpoints(db, source_sha256) if source_sha256 else {}
+            for sheet_key, rows in sheet_rows:
+                results[sheet_key] = _import_rows_chunked(
+                    db,
+                    sheet_key,
+                    rows,
+                    chunk_rows=chunk_rows,
+                    source_sha256=source_sha256,
+                    checkpoint=checkpoints.get(sheet_key),
+                    progress=progress,
+                    context=context,
+                )
+                results[sheet_key]["lookups"] = context.take_stats()
+            if source_sha256:
+                clear_import_checkpoints(db, source_sha256)
 
+        unwritten_images = wait_for_image_writes(set(context.product_images.values()))
         if dry_run:
             db.rollback()
         else:
+            _clear_unwritten_images(db, context, unwritten_images)
+            if DAILY_UPDATE_SHEET in results:
+                derive_inferred_sales(db, since=date.today())
+            _upsert_product_images(db, context.take_unsaved_images())
             db.commit()
     except SQLAlchemyError:
         db.rollback()
@@ -1257,24 +3183,55 @@ def ensure_datasource_dir(path):
 def summarize_results(results):
     parts = []
     for sheet_name, counts in results.items():
-        parts.append(
-            "{}: {} inserted, {} updated".format(
-                sheet_name,
-                counts.get("inserted", 0),
-                counts.get("updated", 0),
-            )
+        summary = "{}: {} inserted, {} updated, {} unchanged".format(
+            sheet_name,
+            counts.get("inserted", 0),
+            counts.get("updated", 0),
+            counts.get("unchanged", 0),
         )
+        rejected_rows = {(reject["sheet"], reject["row"]) for reject in counts.get("rejects", ())}
+        if rejected_rows:
+            summary += ", {} rejected".format(len(rejected_rows))
+        parts.append(summary)
     return "; ".join(parts) if parts else "no rows"
 
 
 class ExcelWatchService:
-    def __init__(self, watch_dir, poll_seconds=10, sheets=None):
+    """Import new or changed files dropped into ``watch_dir``.
+
+    ``import_jobs``, if given, returns the ``ImportJobManager`` that runs the
+    imports, so they share its concurrency limit and job progress with the
+    API's imports; without it files are imported on the watcher's thread.
+    """
+
+    def __init__(
+        self,
+        watch_dir,
+        poll_seconds=10,
+        sheets=None,
+        watch_mode="auto",
+        debounce_seconds=1.0,
+        queue_size=16,
+        import_jobs=None,
+    ):
         self.watch_dir = Path(watch_dir)
         self.poll_seconds = max(2, int(poll_seconds))
         self.sheets = normalize_sheet_list(sheets)
+        self.watch_mode = (watch_mode or "auto").strip().lower()
+        if self.watch_mode not in _WATCH_MODES:
+            raise ValueError("EXCEL_WATCH_MODE must be one of: {}".format(", ".join(_WATCH_MODES)))
+        self.debounce_seconds = max(0.0, float(debounce_seconds))
+        self.import_jobs = import_jobs
         self._stop_event = threading.Event()
         self._thread = None
+        self._worker = None
+        self._inotify = None
         self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._queue_lock = threading.Lock()
+        self._queued = set()
+        self._pending = {}
+        self._delayed = set()
         self._seen = {}
         self._processed = {}
 
@@ -1282,14 +3239,28 @@ class ExcelWatchService:
         if self._thread and self._thread.is_alive():
             return
         ensure_datasource_dir(self.watch_dir)
+        _import_models()
+        Base.metadata.create_all(bind=engine)
         self._stop_event.clear()
+        self._inotify = self._open_inotify()
+        if self._inotify is not None:
+            self._worker = threading.Thread(
+                target=self._run_worker,
+                name="excel-import-worker",
+                daemon=True,
+            )
+            self._worker.start()
         self._thread = threading.Thread(
-            target=self._run,
+            target=self._run_events if self._inotify is not None else self._run,
             name="excel-auto-import",
             daemon=True,
         )
         self._thread.start()
-        logger.info("Excel auto-import watching: %s", self.watch_dir)
+        logger.info(
+            "Excel auto-import watching: %s (%s)",
+            self.watch_dir,
+            "inotify" if self._inotify is not None else "polling",
+        )
 
     def stop(self):
         if not self._thread:
@@ -1297,23 +3268,135 @@ class ExcelWatchService:
         self._stop_event.set()
         self._thread.join(timeout=self.poll_seconds + 1)
         self._thread = None
+        if self._worker:
+            self._worker.join(timeout=self.poll_seconds + 1)
+            self._worker = None
+        self._close_inotify()
         logger.info("Excel auto-import stopped")
 
+    def _open_inotify(self):
+        if self.watch_mode == "poll":
+            return None
+        try:
+            return InotifyWatcher(self.watch_dir)
+        except OSError as exc:
+            if self.watch_mode == "inotify":
+                logger.warning("inotify watcher unavailable (%s); falling back to polling.", exc)
+            else:
+                logger.info("inotify watcher unavailable (%s); using polling.", exc)
+            return None
+
+    def _close_inotify(self):
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
     def _run(self):
         while not self._stop_event.is_set():
             self._scan_once()
             self._stop_event.wait(self.poll_seconds)
 
-    def _scan_once(self):
-        if not self.watch_dir.exists():
+    def _run_events(self):
+        self._schedule_existing_files()
+        while not self._stop_event.is_set():
+            try:
+                events = self._inotify.read_events(self._next_event_timeout())
+            except OSError:
+                logger.exception("inotify read failed for %s; falling back to polling.", self.watch_dir)
+                break
+            watch_removed = False
+            for mask, name in events:
+                if mask & IN_Q_OVERFLOW:
+                    self._schedule_existing_files()
+                elif mask & IN_IGNORED:
+                    watch_removed = True
+                elif name:
+                    self._schedule(self.watch_dir / name)
+            self._enqueue_due()
+            if watch_removed:
+                logger.warning("inotify watch on %s was removed; falling back to polling.", self.watch_dir)
+                break
+        self._close_inotify()
+        self._run()
+
+    def _schedule_existing_files(self):
+        for file_path in self._list_files():
+            if file_path not in self._processed:
+                self._schedule(file_path)
+
+    def _schedule(self, file_path, now=None):
+        if not self._is_watched_file(file_path):
             return
-        for file_path in sorted(self.watch_dir.glob("*.xlsx")):
+        now = time.monotonic() if now is None else now
+        self._pending[file_path] = now + self.debounce_seconds
+
+    def _next_event_timeout(self, now=None):
+        if not self._pending:
+            return 1.0
+        now = time.monotonic() if now is None else now
+        return min(1.0, max(0.05, min(self._pending.values()) - now))
+
+    def _enqueue_due(self, now=None):
+        now = time.monotonic() if now is None else now
+        due = sorted(
+            (item for item in self._pending.items() if item[1] <= now),
+            key=lambda item: item[1],
+        )
+        for index, (file_path, _due_at) in enumerate(due):
+            with self._queue_lock:
+                if file_path not in self._queued:
+                    try:
+                        self._queue.put_nowait(file_path)
+                    except queue.Full:
+                        self._delay(due[index:], now)
+                        return
+                    self._queued.add(file_path)
+            del self._pending[file_path]
+            self._delayed.discard(file_path)
+
+    def _delay(self, entries, now):
+        # Retry once the worker has had time to drain the queue instead of
+        # waking up on every event timeout while it is still full.
+        retry_at = now + max(1.0, self.debounce_seconds)
+        for file_path, _due_at in entries:
+            self._pending[file_path] = retry_at
+            if file_path not in self._delayed:
+                self._delayed.add(file_path)
+                logger.warning("Excel import queue is full; delaying %s", file_path)
+
+    def _run_worker(self):
+        while not self._stop_event.is_set():
+            try:
+                file_path = self._queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            with self._queue_lock:
+                self._queued.discard(file_path)
+            try:
+                if self._is_candidate(file_path):
+                    self._import_file(file_path)
+            finally:
+                self._queue.task_done()
+
+    def _list_files(self):
+        if not self.watch_dir.exists():
+            return []
+        return sorted(path for path in self.watch_dir.iterdir() if self._is_watched_file(path))
+
+    def _scan_once(self):
+        for file_path in self._list_files():
             if not self._is_candidate(file_path):
                 continue
             if not self._is_ready(file_path):
                 continue
             self._import_file(file_path)
 
+    @staticmethod
+    def _is_watched_file(file_path):
+        if file_path.name.startswith("~$"):
+            return False
+        return _source_format(file_path) is not None
+
     @staticmethod
     def _is_candidate(file_path):
         if not file_path.is_file():
@@ -1343,16 +3426,69 @@ class ExcelWatchService:
             try:
                 stat = file_path.stat()
                 file_modified_time = _read_stat_modified_time(stat)
+                sha256 = compute_file_sha256(file_path)
             except (OSError, AttributeError):
                 return
             try:
-                results = import_workbook(file_path, sheets=self.sheets, dry_run=False)
+                claim = claim_workbook_import(
+                    sha256=sha256,
+                    file_path=file_path,
+                    file_size=stat.st_size,
+                )
+            except SQLAlchemyError:
+                logger.exception("Could not record Excel import for %s", file_path)
+                return
+            if claim is None:
+                self._processed[file_path] = file_modified_time
+                logger.info(
+                    "Excel import skipped for %s: identical content already imported.",
+                    file_path,
+                )
+                return
+            if self.import_jobs is not None:
+                self._run_import_job(file_path, file_modified_time, claim, sha256)
+                return
+
+            started = time.monotonic()
+            try:
+                results = import_workbook(
+                    file_path,
+                    sheets=self.sheets,
+                    dry_run=False,
+                    source_sha256=sha256,
+                )
             except (OSError, ValueError, SQLAlchemyError, InvalidFileException) as exc:
                 logger.exception("Excel import failed for %s: %s", file_path, exc)
+                fail_workbook_import(claim.id, exc, time.monotonic() - started)
                 return
+            complete_workbook_import(claim.id, results, time.monotonic() - started)
             self._processed[file_path] = file_modified_time
             logger.info(
                 "Excel import completed for %s: %s",
                 file_path,
                 summarize_results(results),
             )
+
+    def _run_import_job(self, file_path, file_modified_time, claim, sha256):
+        # The job manager records the outcome on the claimed workbook_imports row.
+        try:
+            job = self.import_jobs().run(
+                file_path,
+                sheets=self.sheets,
+                workbook_import_id=claim.id,
+                source_sha256=sha256,
+            )
+        except (OSError, ValueError) as exc:
+            logger.exception("Excel import failed for %s: %s", file_path, exc)
+            fail_workbook_import(claim.id, exc, 0.0)
+            return
+        if job.results is None:
+            logger.error("Excel import job %s failed for %s: %s", job.id, file_path, job.error)
+            return
+        self._processed[file_path] = file_modified_time
+        logger.info(
+            "Excel import job %s completed for %s: %s",
+            job.id,
+            file_path,
+            summarize_results(job.results),
+        )
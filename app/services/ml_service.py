@@ -1,6 +1,9 @@
 import json
+from datetime import datetime, timezone
 
-from app.ml.predict import predict_risk
+from sqlalchemy import insert
+
+from app.ml.predict import predict_risk, predict_risk_batch
 from app.models.risk_log import RiskLog
 
 
@@ -31,23 +34,65 @@ def predict_and_log(
     )
 
     if db is not None:
-        context = {
-            "category": category,
-            "quantity": quantity,
-            "item_mrp": cost_price,
-            "current_price": current_price,
-            "mrp": mrp,
-            "department_name": department_name,
-            "supplier_name": supplier_name,
-            "store_id": store_id,
-            "product_id": product_id,
-        }
         db.add(
             RiskLog(
                 store_id=store_id,
                 product_id=product_id,
                 risk_score=float(score),
-                context=json.dumps(context, default=str),
+                context=_risk_log_context(
+                    {
+                        "category": category,
+                        "quantity": quantity,
+                        "cost_price": cost_price,
+                        "current_price": current_price,
+                        "mrp": mrp,
+                        "department_name": department_name,
+                        "supplier_name": supplier_name,
+                        "store_id": store_id,
+                        "product_id": product_id,
+                    }
+                ),
             )
         )
     return float(score)
+
+
+def _risk_log_context(row):
+    context = {
+        "category": row["category"],
+        "quantity": row["quantity"],
+        "item_mrp": row["cost_price"],
+        "current_price": row.get("current_price"),
+        "mrp": row.get("mrp"),
+        "department_name": row.get("department_name"),
+        "supplier_name": row.get("supplier_name"),
+        "store_id": row.get("store_id"),
+        "product_id": row.get("product_id"),
+    }
+    return json.dumps(context, default=str)
+
+
+def predict_and_log_batch(db, rows):
+    """Score ``rows`` (``predict_and_log`` keyword arguments) in one model call.
+
+    Risk logs are written with a single executemany INSERT; returns the
+    scores as floats in row order.
+    """
+    rows = list(rows)
+    scores = [float(score) for score in predict_risk_batch(rows)]
+    if db is not None and rows:
+        created_at = datetime.now(timezone.utc)
+        db.execute(
+            insert(RiskLog),
+            [
+                {
+                    "created_at": created_at,
+                    "store_id": row.get("store_id"),
+                    "product_id": row.get("product_id"),
+                    "risk_score": score,
+                    "context": _risk_log_context(row),
+                }
+                for row, score in zip(rows, scores)
+            ],
+        )
+    return scores
@@ -1,20 +1,21 @@
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from typing import cast
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
 
 from app.models.price_history import PriceHistory
 from app.models.product import Product
 
 
-def apply_price_update(
-    db: Session,
-    product: Product,
+def stage_price_update(
+    product,
     new_price: float | None,
     *,
     changed_at: datetime | None = None,
-) -> datetime | None:
+) -> dict | None:
+    """Set ``product.price`` in memory and return the price-history values to record."""
     if new_price is None:
         return None
 
@@ -30,18 +31,132 @@ def apply_price_update(
     else:
         changed_at = changed_at.astimezone(timezone.utc)
 
-    if product.id is not None:
-        db.add(
-            PriceHistory(
-                product_id=product.id,
-                old_price=old_price if old_price is not None else 0.0,
-                new_price=new_price,
-                changed_at=changed_at,
-            )
-        )
     product.price = new_price
     product.last_price_update = changed_at
-    return changed_at
+    return {
+        "product_id": product.id,
+        "old_price": old_price if old_price is not None else 0.0,
+        "new_price": new_price,
+        "changed_at": changed_at,
+    }
+
+
+def apply_price_update(
+    db: Session,
+    product: Product,
+    new_price: float | None,
+    *,
+    changed_at: datetime | None = None,
+) -> datetime | None:
+    history_values = stage_price_update(product, new_price, changed_at=changed_at)
+    if history_values is None:
+        return None
+
+    if history_values["product_id"] is not None:
+        db.add(PriceHistory(**history_values))
+    return history_values["changed_at"]
+
+
+def insert_price_history(db: Session, history_rows: list[dict]) -> int:
+    """Write staged price-history values in one executemany INSERT.
+
+    Values without a ``product_id`` (products not flushed yet) are skipped,
+    as ``apply_price_update`` does.
+    """
+    rows = [values for values in history_rows if values["product_id"] is not None]
+    if rows:
+        db.execute(insert(PriceHistory), rows)
+    return len(rows)
+
+
+def _load_price_targets(db: Session, style_codes: list[str], batch_size: int = 500) -> list:
+    codes = sorted(set(style_codes))
+    rows = []
+    for start in range(0, len(codes), batch_size):
+        rows.extend(
+            db.execute(
+                select(Product.id, Product.store_id, Product.style_code, Product.price).where(
+                    Product.style_code.in_(codes[start : start + batch_size])
+                )
+            ).all()
+        )
+    return rows
+
+
+def bulk_update_prices(
+    db: Session,
+    updates: list[dict],
+    *,
+    changed_at: datetime | None = None,
+) -> dict:
+    """Apply many ``{"style_code", "price", "store_id"}`` updates with set-based writes.
+
+    Products are read in one pass, changed prices are written with one
+    executemany UPDATE and their history with one INSERT; nothing is
+    committed. Updates without ``store_id`` must match a single product. When
+    any update matches nothing or is ambiguous no write is made and the
+    offending style codes are returned under ``not_found``/``ambiguous``.
+    A product listed more than once takes its last price.
+    """
+    result = {"updated": 0, "unchanged": 0, "not_found": [], "ambiguous": [], "price_changes": []}
+    by_key = {}
+    by_style = {}
+    for product_id, store_id, style_code, price in _load_price_targets(
+        db, [item["style_code"] for item in updates]
+    ):
+        state = {"id": product_id, "price": price}
+        by_key[(store_id, style_code)] = state
+        by_style.setdefault(style_code, []).append((store_id, state))
+
+    targets = {}
+    for item in updates:
+        style_code = item["style_code"]
+        store_id = item.get("store_id")
+        if store_id is None:
+            matches = by_style.get(style_code, [])
+            if len(matches) > 1:
+                result["ambiguous"].append(style_code)
+                continue
+            if matches:
+                store_id = matches[0][0]
+        state = by_key.get((store_id, style_code))
+        if state is None:
+            result["not_found"].append(style_code)
+            continue
+        targets[state["id"]] = (store_id, style_code, state, item["price"])
+    if result["not_found"] or result["ambiguous"]:
+        return result
+
+    product_rows = []
+    history_rows = []
+    for store_id, style_code, state, new_price in targets.values():
+        product = SimpleNamespace(**state)
+        history_values = stage_price_update(product, new_price, changed_at=changed_at)
+        if history_values is None:
+            result["unchanged"] += 1
+            continue
+        product_rows.append(
+            {
+                "id": product.id,
+                "price": product.price,
+                "last_price_update": product.last_price_update,
+            }
+        )
+        history_rows.append(history_values)
+        result["price_changes"].append(
+            {
+                "store_id": store_id,
+                "style_code": style_code,
+                "old_price": history_values["old_price"],
+                "new_price": history_values["new_price"],
+                "changed_at": history_values["changed_at"],
+            }
+        )
+    if product_rows:
+        db.execute(update(Product), product_rows)
+    insert_price_history(db, history_rows)
+    result["updated"] = len(product_rows)
+    return result
 
 
 def calculate_days_active(created_at: datetime | None) -> int | None:
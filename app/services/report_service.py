@@ -13,13 +13,15 @@ from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.pdfgen import canvas
 from sqlalchemy import select
 
-from app.core.constants import PROJECT_ROOT, STATIC_DIR
+from app.core.constants import PDF_IMAGE_SIZE, PROJECT_ROOT, STATIC_DIR
 from app.core.aging_rules import classify_status_with_default
 from app.database import SessionLocal
 from app.models.inventory import Inventory
 from app.models.product import Product
 from app.models.stores import Store
 from app.services.channels.telegram_service import send_telegram_document
+from app.services.image_service import RENDITION_PDF, find_rendition
+from app.services.sales_service import load_lifecycle_report_totals
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +35,7 @@ _PAGE_MARGIN = 36
 _ROW_HEIGHT = 160
 _ROW_GAP = 10
 _ROW_PADDING = 8
-_IMAGE_WIDTH = 122
-_IMAGE_HEIGHT = 108
+_IMAGE_WIDTH, _IMAGE_HEIGHT = PDF_IMAGE_SIZE
 _AGING_BADGE_STYLES: dict[str, tuple[str, str]] = {
     "HEALTHY": ("#DCFCE7", "#166534"),
     "TRANSFER": ("#FEF08A", "#854D0E"),
@@ -283,7 +284,19 @@ def _draw_image(
         pdf_canvas.drawCentredString(x + (width / 2), y + (height / 2), "No image")
         return
 
+    # Images imported from workbooks come with a copy already cut to the cell size.
+    rendition = find_rendition(image_path, RENDITION_PDF)
     try:
+        if rendition is not None:
+            pdf_canvas.drawImage(
+                str(rendition),
+                x,
+                y,
+                width=width,
+                height=height,
+                preserveAspectRatio=False,
+            )
+            return
         with Image.open(image_path) as image_file:
             rgb_image = image_file.convert("RGB")
             fitted_image = ImageOps.fit(
@@ -514,8 +527,16 @@ def _draw_alert_row(
     )
 
 
-def _build_grouped_alerts_from_rows(rows: Sequence[Any], *, today: date) -> list[dict[str, Any]]:
+def _build_grouped_alerts_from_rows(
+    rows: Sequence[Any],
+    *,
+    today: date,
+    sold_totals: Mapping[tuple[int, int], int] | None = None,
+    purchased_totals: Mapping[tuple[int, int], int] | None = None,
+) -> list[dict[str, Any]]:
     grouped: dict[str, dict[str, Any]] = {}
+    sold_totals = sold_totals or {}
+    purchased_totals = purchased_totals or {}
     image_match_cache: dict[str, bool] = {}
 
     for row in rows:
@@ -530,6 +551,9 @@ def _build_grouped_alerts_from_rows(rows: Sequence[Any], *, today: date) -> list
         age_days = max(0, (today - lifecycle_start).days)
         aging_status = classify_status_with_default(row.category, age_days)
         image_value = str(row.image_url or row.style_code or "").strip()
+        report_key = (row.store_id, getattr(row, "product_id", None))
+        sold_units = sold_totals.get(report_key, 0)
+        purchased_units = purchased_totals.get(report_key, 0)
         has_non_fallback_image = image_match_cache.get(image_value)
         if has_non_fallback_image is None:
             has_non_fallback_image = _has_non_fallback_image(image_value)
@@ -548,8 +572,8 @@ def _build_grouped_alerts_from_rows(rows: Sequence[Any], *, today: date) -> list
                 "max_age_days": age_days,
                 "aging_status": aging_status,
                 "image": image_value,
-                "purchase_report": "0",
-                "sold_report": "0",
+                "purchase_report": purchased_units,
+                "sold_report": sold_units,
                 "_has_non_fallback_image": bool(has_non_fallback_image),
                 "_stores": {
                     _format_group_store_label(row.store_id, row.store_name): quantity
@@ -559,6 +583,8 @@ def _build_grouped_alerts_from_rows(rows: Sequence[Any], *, today: date) -> list
             continue
 
         grouped_item["total_quantity"] += quantity
+        grouped_item["purchase_report"] += purchased_units
+        grouped_item["sold_report"] += sold_units
         grouped_item["max_age_days"] = max(grouped_item["max_age_days"], age_days)
 
         current_severity = _AGING_STATUS_SEVERITY.get(
@@ -607,8 +633,8 @@ def _build_grouped_alerts_from_rows(rows: Sequence[Any], *, today: date) -> list
                 ),
                 "store": _format_store_distribution(store_map),
                 "stock_days": str(grouped_item["max_age_days"]),
-                "purchase_report": grouped_item.get("purchase_report") or "0",
-                "sold_report": grouped_item.get("sold_report") or "0",
+                "purchase_report": _format_quantity(grouped_item["purchase_report"]),
+                "sold_report": _format_quantity(grouped_item["sold_report"]),
                 "cumulative_quantity": _format_quantity(total_quantity),
                 "aging_status": aging_status or "N/A",
                 "transfer_hint": "Same style matched across stores (case-insensitive).",
@@ -662,6 +688,7 @@ def build_alerts_from_database(*, limit: int | None = ALERTS_PER_PDF) -> list[di
                 Store.id.label("store_id"),
                 Store.name.label("store_name"),
                 Store.city.label("store_city"),
+                Inventory.product_id.label("product_id"),
                 Inventory.quantity.label("quantity"),
                 Inventory.lifecycle_start_date.label("lifecycle_start_date"),
             )
@@ -669,10 +696,16 @@ def build_alerts_from_database(*, limit: int | None = ALERTS_PER_PDF) -> list[di
             .outerjoin(Store, Store.id == Inventory.store_id)
             .order_by(Inventory.lifecycle_start_date.asc(), Inventory.quantity.desc())
         ).all()
+        sold_totals, purchased_totals = load_lifecycle_report_totals(db)
     finally:
         db.close()
 
-    grouped_alerts = _build_grouped_alerts_from_rows(rows, today=today)
+    grouped_alerts = _build_grouped_alerts_from_rows(
+        rows,
+        today=today,
+        sold_totals=sold_totals,
+        purchased_totals=purchased_totals,
+    )
     if limit is None:
         return grouped_alerts
 
@@ -0,0 +1,78 @@
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
+
+from app.models.inferred_sale import InferredSale
+from app.models.inventory import Inventory
+from app.models.purchase import Purchase
+from app.models.sales import Sales
+
+
+def _lifecycle_totals(db: Session, model, date_column, quantity_column) -> dict[tuple[int, int], int]:
+    # One start date per pair, so duplicate inventory rows don't multiply the sums.
+    lifecycle = (
+        select(
+            Inventory.store_id,
+            Inventory.product_id,
+            func.min(Inventory.lifecycle_start_date).label("lifecycle_start_date"),
+        )
+        .group_by(Inventory.store_id, Inventory.product_id)
+        .subquery()
+    )
+    stmt = (
+        select(model.store_id, model.product_id, func.sum(quantity_column))
+        .join(
+            lifecycle,
+            and_(
+                lifecycle.c.store_id == model.store_id,
+                lifecycle.c.product_id == model.product_id,
+            ),
+        )
+        .where(date_column >= lifecycle.c.lifecycle_start_date)
+        .group_by(model.store_id, model.product_id)
+    )
+    return {
+        (store_id, product_id): int(total or 0)
+        for store_id, product_id, total in db.execute(stmt)
+    }
+
+
+def load_lifecycle_report_totals(
+    db: Session,
+) -> tuple[dict[tuple[int, int], int], dict[tuple[int, int], int]]:
+    """Units sold and purchased per ``(store_id, product_id)`` since the stock's lifecycle start.
+
+    Returns ``(sold, purchased)`` dicts built from the imported sold and
+    purchase reports; pairs with no report lines are absent.
+    """
+    sold = _lifecycle_totals(db, Sales, Sales.sale_date, Sales.quantity_sold)
+    purchased = _lifecycle_totals(
+        db, Purchase, Purchase.purchase_date, Purchase.quantity_purchased
+    )
+    return sold, purchased
+
+
+def load_recent_sales_totals(db: Session, since) -> dict[tuple[int, int], int]:
+    """Units sold per ``(store_id, product_id)`` on or after ``since``.
+
+    Stores that send sold reports are counted from ``sales``; every other
+    store falls back to ``inferred_sales``, so the two never double count.
+    """
+    reporting_stores = select(Sales.store_id).distinct()
+    totals = {}
+    for model, extra_filter in (
+        (Sales, None),
+        (InferredSale, InferredSale.store_id.not_in(reporting_stores)),
+    ):
+        stmt = (
+            select(model.store_id, model.product_id, func.sum(model.quantity_sold))
+            .where(model.sale_date >= since)
+            .group_by(model.store_id, model.product_id)
+        )
+        if extra_filter is not None:
+            stmt = stmt.where(extra_filter)
+        for store_id, product_id, total in db.execute(stmt):
+            totals[(store_id, product_id)] = int(total or 0)
+    return totals
+
+
+__all__ = ["load_lifecycle_report_totals", "load_recent_sales_totals"]
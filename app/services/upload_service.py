@@ -0,0 +1,80 @@
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+
+from app.services.ingestion_service import is_supported_import_file
+
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+class UploadTooLargeError(ValueError):
+    pass
+
+
+class SpooledUpload:
+    """An upload written to a temp file next to its final, content-addressed path."""
+
+    def __init__(self, *, temp_path, path, sha256, size):
+        self.temp_path = Path(temp_path)
+        self.path = Path(path)
+        self.sha256 = sha256
+        self.size = size
+
+    def keep(self):
+        os.replace(self.temp_path, self.path)
+        return self.path
+
+    def discard(self):
+        try:
+            self.temp_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _safe_filename(filename):
+    name = _UNSAFE_FILENAME_CHARS.sub("_", Path(str(filename or "")).name).strip("._")
+    return name or "upload"
+
+
+def spool_upload(source, *, filename, upload_dir, max_bytes=None):
+    """Copy a file-like upload to disk in fixed-size chunks, hashing as it goes.
+
+    Memory use stays at one chunk regardless of upload size. The data lands
+    in a temp file inside ``upload_dir``; call ``keep()`` to move it to its
+    final ``<sha256 prefix>_<filename>`` path or ``discard()`` to drop it.
+    """
+    safe_name = _safe_filename(filename)
+    if not is_supported_import_file(safe_name):
+        raise ValueError("Only .xlsx, .csv and .tsv (optionally .gz) files are supported.")
+    upload_dir = Path(upload_dir)
+    upload_dir.mkdir(parents=True, exist_ok=True)
+
+    digest = hashlib.sha256()
+    size = 0
+    handle = tempfile.NamedTemporaryFile(dir=upload_dir, prefix=".upload-", delete=False)
+    temp_path = Path(handle.name)
+    try:
+        with handle:
+            for chunk in iter(lambda: source.read(_UPLOAD_CHUNK_SIZE), b""):
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise UploadTooLargeError(f"Upload exceeds the {max_bytes} byte limit.")
+                digest.update(chunk)
+                handle.write(chunk)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    sha256 = digest.hexdigest()
+    return SpooledUpload(
+        temp_path=temp_path,
+        path=upload_dir / "{}_{}".format(sha256[:16], safe_name),
+        sha256=sha256,
+        size=size,
+    )
+
+
+__all__ = ["SpooledUpload", "UploadTooLargeError", "spool_upload"]
@@ -51,6 +51,7 @@
   /**
    * @typedef {Object} InventoryItem
    * @property {string=} image_url
+   * @property {string=} thumbnail_url
    * @property {string=} style_code
    * @property {string=} article_name
    * @property {string=} category
@@ -404,6 +405,9 @@
     if (!value) return "--";
     const source = String(value);
     if (source.includes("weak_labels")) return "Weak labels";
+    if (source.endsWith("inferred_sales") && !source.includes("sales+inferred")) {
+      return "Inferred sales";
+    }
     if (source.includes("daily_snapshots+sales")) return "Sales outcomes";
     if (source.includes("inventory+recent_sales")) return "Recent sales";
     return source;
@@ -668,11 +672,11 @@
       image.className = "item-thumb";
       const imageUrl = item.image_url ?? item.image ?? item.thumbnail;
       const fallbackUrl = "/static/sindh-logo.png";
-      image.src = imageUrl || fallbackUrl;
+      image.src = item.thumbnail_url || imageUrl || fallbackUrl;
       image.alt = item.article_name ?? item.style_code ?? "Item image";
       image.loading = "lazy";
       image.decoding = "async";
-      thumbButton.dataset.previewSrc = image.src;
+      thumbButton.dataset.previewSrc = imageUrl || fallbackUrl;
       thumbButton.dataset.previewAlt = image.alt;
       thumbButton.dataset.previewCaption = [item.style_code, item.article_name].filter(Boolean).join(" - ");
       thumbButton.setAttribute("aria-label", "Open image preview");
@@ -0,0 +1,204 @@
+import argparse
+import base64
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Ensure repo root is on sys.path when running this script directly.
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from openpyxl import Workbook
+from openpyxl.drawing.image import Image as XLImage
+from openpyxl.drawing.spreadsheet_drawing import AnchorMarker, OneCellAnchor
+
+from app.services import ingestion_service
+
+_PNG_BYTES = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAwMCAO+/n1cAAAAASUVORK5CYII="
+)
+_CARD_LABELS = (
+    ("Supplier Name", "Supplier {}"),
+    ("Department", "DRESS"),
+    ("Style", "STYLE-{:05d}"),
+    ("ItemCode", "{:09d}"),
+    ("MRP", "{}.00"),
+    ("Image Name", "{:09d}"),
+    ("PUR Qty", "1.00"),
+)
+_CARD_HEIGHT = len(_CARD_LABELS) + 3
+_CARD_WIDTH = 5
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Time load_card_layout_rows on a synthetic card-layout sheet."
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Also time the baseline label scan and image assignment and check both give the same rows.",
+    )
+    parser.add_argument("--cards", type=int, default=3000, help="Number of cards to generate.")
+    parser.add_argument("--cards-per-band", type=int, default=4, help="Cards side by side per band.")
+    parser.add_argument("--no-images", action="store_true", help="Skip embedded images.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs; the best is reported.")
+    return parser.parse_args()
+
+
+def build_card_sheet(cards, cards_per_band, image_path=None):
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = "001_benchmark"
+    for index in range(cards):
+        band, slot = divmod(index, cards_per_band)
+        top = 2 + band * _CARD_HEIGHT
+        image_col = 1 + slot * _CARD_WIDTH
+        label_col = image_col + 2
+        for offset, (label, template) in enumerate(_CARD_LABELS):
+            worksheet.cell(row=top + offset, column=label_col, value=label)
+            worksheet.cell(row=top + offset, column=label_col + 2, value=template.format(index + 1))
+        if image_path is not None:
+            image = XLImage(str(image_path))
+            # Anchors are zero-based; images sit one row above the supplier row.
+            image.anchor = OneCellAnchor(_from=AnchorMarker(col=image_col - 1, row=top - 2))
+            worksheet.add_image(image)
+    return worksheet
+
+
+def _baseline_to_card_field(label):
+    """``_to_card_field`` before label lookups were memoized: every cell is normalized."""
+    return ingestion_service.CARD_LAYOUT_LABEL_MAP.get(ingestion_service.normalize_header(label))
+
+
+def _baseline_extract_card_layout_images(worksheet, rows, record_metas):
+    """``_extract_card_layout_images`` before it bisected: linear scans per image."""
+    if not rows or not record_metas:
+        return
+    images = ingestion_service._load_worksheet_images(worksheet)
+    if not images:
+        return
+
+    value_indices = sorted({meta[1] for meta in record_metas})
+    if not value_indices:
+        return
+
+    records_by_value_idx = {}
+    for row_index, value_idx, supplier_row in record_metas:
+        records_by_value_idx.setdefault(value_idx, []).append((supplier_row, row_index))
+    for value_idx in records_by_value_idx:
+        records_by_value_idx[value_idx].sort(key=lambda item: item[0])
+
+    anchored_images = []
+    for image in images:
+        col, row = ingestion_service._get_image_anchor_coordinates(image)
+        if col is None or row is None:
+            continue
+        anchored_images.append((row + 1, col, image))
+    if not anchored_images:
+        return
+
+    anchored_images.sort(key=lambda item: (item[0], item[1]))
+    used_rows = set()
+
+    for image_row, image_col, image in anchored_images:
+        right_side_indices = [
+            candidate_idx for candidate_idx in value_indices if candidate_idx > image_col
+        ]
+        if right_side_indices:
+            value_idx = min(right_side_indices, key=lambda candidate_idx: candidate_idx - image_col)
+        else:
+            value_idx = min(value_indices, key=lambda candidate_idx: abs(candidate_idx - image_col))
+
+        candidates = records_by_value_idx.get(value_idx) or []
+        if not candidates:
+            continue
+
+        supplier_target = image_row + 1
+        best_row_index = None
+        best_distance = None
+        for supplier_row, row_index in candidates:
+            if row_index in used_rows:
+                continue
+            distance = abs(supplier_row - supplier_target)
+            if best_distance is None or distance < best_distance:
+                best_distance = distance
+                best_row_index = row_index
+        if best_row_index is None:
+            continue
+
+        record = rows[best_row_index]
+        image_url = ingestion_service._save_embedded_image(image)
+        if not image_url:
+            continue
+        record["image_url"] = image_url
+        used_rows.add(best_row_index)
+
+
+def _fake_saver(worksheet):
+    """A ``_save_embedded_image`` that names each picture by its position in the sheet.
+
+    Nothing is written, so timings cover parsing and assignment only, and
+    distinct URLs let the baseline and current image assignments be compared.
+    """
+    positions = {id(image): index for index, image in enumerate(worksheet._images)}
+
+    def save(image):
+        return "/static/images/sha256/card-{}.png".format(positions[id(image)])
+
+    return save
+
+
+def time_load(worksheet, repeat):
+    """Best of ``repeat`` runs of ``load_card_layout_rows``, and the rows of the last."""
+    timings = []
+    rows = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        rows, _ = ingestion_service.load_card_layout_rows(worksheet)
+        timings.append(time.perf_counter() - started)
+    return min(timings), rows
+
+
+def _report(name, seconds, rows):
+    print(f"{name}: {seconds:.3f}s ({len(rows) / seconds:,.0f} cards/s)")
+
+
+def main():
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        image_path = None
+        if not args.no_images:
+            image_path = Path(tmp_dir) / "card.png"
+            image_path.write_bytes(_PNG_BYTES)
+        worksheet = build_card_sheet(args.cards, args.cards_per_band, image_path)
+
+        with patch.object(ingestion_service, "_save_embedded_image", _fake_saver(worksheet)):
+            best, rows = time_load(worksheet, args.repeat)
+            if args.compare:
+                with patch.object(
+                    ingestion_service, "_to_card_field", _baseline_to_card_field
+                ), patch.object(
+                    ingestion_service,
+                    "_extract_card_layout_images",
+                    _baseline_extract_card_layout_images,
+                ):
+                    baseline_best, baseline_rows = time_load(worksheet, args.repeat)
+
+    with_images = sum(1 for row in rows if str(row.get("image_url", "")).startswith("/static/"))
+    print(f"cards: {len(rows)} parsed, {with_images} with embedded images (best of {max(1, args.repeat)})")
+    if args.compare:
+        _report("baseline", baseline_best, baseline_rows)
+    _report("current", best, rows)
+    if args.compare:
+        print(f"speedup: {baseline_best / best:.2f}x")
+        if rows != baseline_rows:
+            sys.exit("Baseline and current rows or image assignments differ.")
+        print("rows and image assignments match")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Ensure repo root is on sys.path when running this script directly.
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+# App modules (and generate_workbook, which reads the header aliases) are
+# imported in main(): settings and the engine are built on first import, so
+# the benchmark database has to be configured before that.
+
+MODES = ("workers", "in-process")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Time import_workbook stage by stage on synthetic daily_update workbooks."
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="Row counts to benchmark (stores x styles).",
+    )
+    parser.add_argument("--stores", type=int, default=10, help="Stores per workbook.")
+    parser.add_argument("--layout", choices=("tabular", "card"), default="tabular")
+    parser.add_argument("--images", action="store_true", help="Embed one picture per row or card.")
+    parser.add_argument("--header-style", choices=("canonical", "variants"), default="variants")
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=None,
+        help="Commit every N rows (default: EXCEL_IMPORT_CHUNK_ROWS; 0 = one transaction).",
+    )
+    parser.add_argument(
+        "--modes",
+        choices=MODES,
+        nargs="+",
+        default=list(MODES),
+        help="Parse in worker processes (EXCEL_PARSE_WORKERS, at least 1) and/or in-process.",
+    )
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="Database to import into; its tables are dropped before every run. Default: a temporary SQLite file.",
+    )
+    parser.add_argument("--output", default=None, help="Write the JSON results here as well as to stdout.")
+    return parser.parse_args()
+
+
+class StageTimer:
+    """``progress`` hooks for ``import_workbook`` that timestamp its phases.
+
+    ``hash`` runs until the ``parsing`` phase starts. With parse workers,
+    ``parse`` runs until ``applying`` and ``apply`` until the import returns;
+    in-process imports parse and apply sheet rows as one stream, reported as
+    ``parse_apply``. Session commits, including per-chunk commits, are
+    timed through SQLAlchemy session events and reported as ``commit``,
+    excluded from the stage they happen in.
+    """
+
+    def __init__(self):
+        self.marks = {}
+        self.rows_parsed = 0
+        self.rows_applied = 0
+        self.commit_seconds = 0.0
+        self._commit_started = None
+        self._started = time.perf_counter()
+
+    def set_phase(self, phase):
+        self.marks.setdefault(phase, time.perf_counter())
+
+    def set_total(self, total):
+        pass
+
+    def add_parsed(self, count):
+        self.rows_parsed += count
+
+    def add_applied(self, count):
+        self.rows_applied += count
+
+    def before_commit(self, _session):
+        self._commit_started = time.perf_counter()
+
+    def after_commit(self, _session):
+        if self._commit_started is not None:
+            self.commit_seconds += time.perf_counter() - self._commit_started
+            self._commit_started = None
+
+    def stages(self, finished):
+        parsing = self.marks.get("parsing", finished)
+        timings = {"hash": parsing - self._started}
+        if "applying" in self.marks:
+            timings["parse"] = self.marks["applying"] - parsing
+            timings["apply"] = finished - self.marks["applying"] - self.commit_seconds
+        else:
+            timings["parse_apply"] = finished - parsing - self.commit_seconds
+        timings["commit"] = self.commit_seconds
+        return {stage: round(seconds, 3) for stage, seconds in timings.items()}
+
+
+def run_import(ingestion_service, workbook_path, *, chunk_rows, parse_workers):
+    """Run ``import_workbook`` and return ``(timings, results)`` from its progress hooks."""
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+
+    timer = StageTimer()
+    event.listen(Session, "before_commit", timer.before_commit)
+    event.listen(Session, "after_commit", timer.after_commit)
+    try:
+        results = ingestion_service.import_workbook(
+            workbook_path,
+            parse_workers=parse_workers,
+            progress=timer,
+            chunk_rows=chunk_rows,
+        )
+        finished = time.perf_counter()
+    finally:
+        event.remove(Session, "before_commit", timer.before_commit)
+        event.remove(Session, "after_commit", timer.after_commit)
+    return timer.stages(finished), results
+
+
+def _stored_images(image_store):
+    return set(image_store.iterdir()) if image_store.is_dir() else set()
+
+
+def main():
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        os.environ["DATABASE_URL"] = args.database_url or "sqlite:///{}".format(tmp_path / "benchmark.db")
+        os.environ["EXCEL_CREATE_MISSING_STORES"] = "true"
+
+        from generate_workbook import write_daily_update_workbook
+
+        from app.config import get_settings
+        from app.database import Base, engine
+        from app.services import ingestion_service
+
+        chunk_rows = args.chunk_rows
+        if chunk_rows is None:
+            chunk_rows = int(get_settings().EXCEL_IMPORT_CHUNK_ROWS)
+        report = {
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": engine.dialect.name,
+            "layout": args.layout,
+            "images": args.images,
+            "header_style": args.header_style,
+            "stores": args.stores,
+            "chunk_rows": chunk_rows,
+            "runs": [],
+        }
+
+        parse_workers = max(1, int(get_settings().EXCEL_PARSE_WORKERS))
+        report["parse_workers"] = parse_workers
+        # Parse workers are separate processes and save pictures to the app's
+        # image store like any import; pictures a run adds are removed again.
+        image_store = ingestion_service._IMAGE_DIR / ingestion_service._IMAGE_STORE_DIRNAME
+        try:
+            for rows in args.rows:
+                styles = max(1, rows // args.stores)
+                workbook_path = tmp_path / f"daily_update_{rows}.xlsx"
+                started = time.perf_counter()
+                row_count = write_daily_update_workbook(
+                    workbook_path,
+                    stores=args.stores,
+                    styles=styles,
+                    layout=args.layout,
+                    images=args.images,
+                    header_style=args.header_style,
+                )
+                generate_seconds = time.perf_counter() - started
+
+                for mode in args.modes:
+                    ingestion_service._import_models()
+                    Base.metadata.drop_all(bind=engine)
+                    existing_images = _stored_images(image_store)
+                    timings, results = run_import(
+                        ingestion_service,
+                        workbook_path,
+                        chunk_rows=chunk_rows,
+                        parse_workers=parse_workers if mode == "workers" else 0,
+                    )
+                    for path in _stored_images(image_store) - existing_images:
+                        path.unlink()
+                    total = sum(timings.values())
+                    report["runs"].append(
+                        {
+                            "mode": mode,
+                            "rows": row_count,
+                            "styles_per_store": styles,
+                            "workbook_bytes": workbook_path.stat().st_size,
+                            "generate_seconds": round(generate_seconds, 3),
+                            "stages": timings,
+                            "total_seconds": round(total, 3),
+                            "rows_per_second": round(row_count / total, 1) if total else None,
+                            "results": ingestion_service.summarize_results(results),
+                        }
+                    )
+                    print(
+                        "{:>9,} rows, {}: {} (total {:.2f}s)".format(
+                            row_count,
+                            mode,
+                            ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items()),
+                            total,
+                        ),
+                        file=sys.stderr,
+                    )
+                workbook_path.unlink()
+        finally:
+            ingestion_service.shutdown_parse_pool()
+        engine.dispose()
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
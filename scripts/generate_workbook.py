@@ -0,0 +1,295 @@
+import argparse
+import io
+import random
+import sys
+from pathlib import Path
+
+# Ensure repo root is on sys.path when running this script directly.
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from openpyxl import Workbook
+from openpyxl.drawing.image import Image as XLImage
+from openpyxl.drawing.spreadsheet_drawing import AnchorMarker, OneCellAnchor
+from PIL import Image
+
+from app.services.ingestion_service import _ALIAS_SPECS, CARD_LAYOUT_LABEL_MAP
+
+LAYOUTS = ("tabular", "card")
+HEADER_STYLES = ("canonical", "variants")
+MAX_SHEET_ROWS = 1_048_576
+FIRST_STORE_ID = 101
+
+# daily_update columns in sheet order.
+TABULAR_COLUMNS = (
+    "store_id",
+    "style_code",
+    "barcode",
+    "article_name",
+    "supplier_name",
+    "department_name",
+    "category",
+    "mrp",
+    "price",
+    "quantity",
+    "stock_days",
+    "cost_price",
+)
+CARD_FIELDS = (
+    "supplier_name",
+    "department_name",
+    "style_code",
+    "barcode",
+    "mrp",
+    "image_url",
+    "quantity",
+    "stock_days",
+)
+# Same geometry as scripts/benchmark_card_layout.py: the image sits in the
+# card's first two columns, labels in the third and values two to the right.
+_CARD_HEIGHT = len(CARD_FIELDS) + 3
+_CARD_WIDTH = 5
+_IMAGE_VARIANTS = 64
+
+_SUPPLIERS = tuple(f"Supplier {index:02d}" for index in range(1, 41))
+_DEPARTMENTS = (
+    ("Womenswear", ("Dress", "Kurti", "Top", "Saree")),
+    ("Menswear", ("Shirt", "Trouser", "Kurta")),
+    ("Kids", ("Frock", "Set")),
+    ("Accessories", ("Dupatta", "Stole", "Bag")),
+)
+
+
+def header_variants(target):
+    """Spellings of ``target`` that ``normalize_header`` maps back to it."""
+    variants = {target}
+    for parts, alias_target in _ALIAS_SPECS:
+        if alias_target != target:
+            continue
+        variants.update(
+            (
+                " ".join(part.title() for part in parts),
+                "_".join(part.upper() for part in parts),
+                "-".join(parts),
+                "".join(part.title() for part in parts),
+            )
+        )
+    return sorted(variants)
+
+
+def card_label_variants(target):
+    """Card labels (from ``CARD_LAYOUT_LABEL_MAP``) that read as ``target``."""
+    return sorted(
+        " ".join(part.title() for part in label.split("_"))
+        for label, label_target in CARD_LAYOUT_LABEL_MAP.items()
+        if label_target == target
+    )
+
+
+def pick_headers(fields, variants, header_style, rng):
+    if header_style == "canonical":
+        return {field: field for field in fields}
+    return {field: rng.choice(variants(field)) for field in fields}
+
+
+def style_values(style_index, rng):
+    department, categories = _DEPARTMENTS[style_index % len(_DEPARTMENTS)]
+    mrp = float(rng.randrange(10, 200) * 50 - 1)
+    return {
+        "style_code": f"STY-{style_index:07d}",
+        "barcode": f"{890000000000 + style_index}",
+        "article_name": f"{categories[style_index % len(categories)]} {style_index}",
+        "supplier_name": _SUPPLIERS[style_index % len(_SUPPLIERS)],
+        "department_name": department,
+        "category": categories[style_index % len(categories)],
+        "mrp": mrp,
+    }
+
+
+def stock_values(values, rng):
+    mrp = values["mrp"]
+    return dict(
+        values,
+        price=mrp if rng.random() < 0.7 else round(mrp * 0.7, 2),
+        quantity=rng.randrange(0, 40),
+        stock_days=rng.randrange(0, 365),
+        cost_price=round(mrp * 0.45, 2),
+    )
+
+
+def build_image_variants(count=_IMAGE_VARIANTS):
+    """Small distinct PNGs; rows reuse them by style so hashing dedupes like real sheets."""
+    images = []
+    for index in range(count):
+        color = ((index * 37) % 256, (index * 91) % 256, (index * 53) % 256)
+        buffer = io.BytesIO()
+        Image.new("RGB", (16, 16), color).save(buffer, format="PNG")
+        images.append(buffer.getvalue())
+    return images
+
+
+def _anchored_image(data, col, row):
+    image = XLImage(io.BytesIO(data))
+    # Anchors are zero-based.
+    image.anchor = OneCellAnchor(_from=AnchorMarker(col=col, row=row))
+    return image
+
+
+def _store_sheet_name(store_id):
+    return f"{store_id:03d} Store {store_id}"
+
+
+def _write_tabular_sheet(worksheet, rows, headers, images):
+    fields = list(headers)
+    worksheet.append([headers[field] for field in fields])
+    image_col = fields.index("image_url") if images is not None else None
+    for row_number, (style_index, values) in enumerate(rows, start=2):
+        worksheet.append([values.get(field) for field in fields])
+        if image_col is not None:
+            image = _anchored_image(images[style_index % len(images)], image_col, row_number - 1)
+            worksheet.add_image(image)
+
+
+def _write_card_sheet(worksheet, rows, labels, images, cards_per_band):
+    # A title row, as in exported stock sheets; it also leaves room for the
+    # first band's images. Write-only sheets are appended row by row, so
+    # cards are laid out one band at a time.
+    worksheet.append([f"{worksheet.title} stock"])
+    band = []
+    top = 2
+    for card in rows:
+        band.append(card)
+        if len(band) == cards_per_band:
+            top = _write_card_band(worksheet, band, labels, images, top)
+            band = []
+    if band:
+        _write_card_band(worksheet, band, labels, images, top)
+
+
+def _write_card_band(worksheet, band, labels, images, top):
+    grid = [[None] * (_CARD_WIDTH * len(band)) for _ in range(_CARD_HEIGHT)]
+    for slot, (style_index, values) in enumerate(band):
+        label_col = slot * _CARD_WIDTH + 2
+        for offset, field in enumerate(CARD_FIELDS):
+            value = values.get(field)
+            if field == "image_url":
+                if images is None:
+                    continue
+                value = values["barcode"]
+            grid[offset][label_col] = labels[field]
+            grid[offset][label_col + 2] = value
+        if images is not None:
+            # Images sit one row above the supplier row.
+            image = _anchored_image(images[style_index % len(images)], slot * _CARD_WIDTH, top - 2)
+            worksheet.add_image(image)
+    for row in grid:
+        worksheet.append(row)
+    return top + _CARD_HEIGHT
+
+
+def write_daily_update_workbook(
+    path,
+    *,
+    stores,
+    styles,
+    layout="tabular",
+    images=False,
+    header_style="variants",
+    per_store_sheets=None,
+    cards_per_band=4,
+    seed=0,
+):
+    """Write a ``daily_update`` workbook with ``stores`` x ``styles`` rows; return the row count.
+
+    Tabular workbooks have one ``daily_update`` sheet with a store column
+    unless ``per_store_sheets`` is set; card workbooks always use one sheet
+    per store, named with the 3-digit store code the importer infers.
+    ``header_style="variants"`` picks a random alias spelling per column and
+    sheet. Values are seeded, so the same arguments write the same data.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"layout must be one of {', '.join(LAYOUTS)}")
+    if header_style not in HEADER_STYLES:
+        raise ValueError(f"header_style must be one of {', '.join(HEADER_STYLES)}")
+    if stores < 1 or styles < 1:
+        raise ValueError("stores and styles must be positive.")
+    if FIRST_STORE_ID + stores - 1 > 999:
+        raise ValueError("At most {} stores fit the 3-digit store code.".format(1000 - FIRST_STORE_ID))
+    if per_store_sheets is None:
+        per_store_sheets = layout == "card"
+    if layout == "card" and not per_store_sheets:
+        raise ValueError("Card layouts need one sheet per store.")
+    sheet_rows = styles + 1 if per_store_sheets else stores * styles + 1
+    if layout == "card":
+        sheet_rows = -(-styles // cards_per_band) * _CARD_HEIGHT + 1
+    if sheet_rows > MAX_SHEET_ROWS:
+        raise ValueError(f"A sheet would need {sheet_rows:,} rows; Excel allows {MAX_SHEET_ROWS:,}.")
+
+    rng = random.Random(seed)
+    image_variants = build_image_variants() if images else None
+    catalogue = [style_values(style_index, rng) for style_index in range(1, styles + 1)]
+    store_ids = range(FIRST_STORE_ID, FIRST_STORE_ID + stores)
+
+    def store_rows(store_id):
+        for style_index, values in enumerate(catalogue, start=1):
+            yield style_index, dict(stock_values(values, rng), store_id=store_id)
+
+    columns = TABULAR_COLUMNS + (("image_url",) if images else ())
+    workbook = Workbook(write_only=True)
+    if not per_store_sheets:
+        headers = pick_headers(columns, header_variants, header_style, rng)
+        rows = (row for store_id in store_ids for row in store_rows(store_id))
+        _write_tabular_sheet(workbook.create_sheet("daily_update"), rows, headers, image_variants)
+    else:
+        for store_id in store_ids:
+            worksheet = workbook.create_sheet(_store_sheet_name(store_id))
+            if layout == "card":
+                labels = pick_headers(CARD_FIELDS, card_label_variants, header_style, rng)
+                _write_card_sheet(worksheet, store_rows(store_id), labels, image_variants, cards_per_band)
+            else:
+                headers = pick_headers(columns, header_variants, header_style, rng)
+                _write_tabular_sheet(worksheet, store_rows(store_id), headers, image_variants)
+    workbook.save(path)
+    return stores * styles
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Write a synthetic daily_update workbook.")
+    parser.add_argument("--output", required=True, help="Path of the .xlsx file to write.")
+    parser.add_argument("--stores", type=int, default=10, help="Number of stores (N).")
+    parser.add_argument("--styles", type=int, default=1000, help="Styles per store (M).")
+    parser.add_argument("--layout", choices=LAYOUTS, default="tabular")
+    parser.add_argument("--images", action="store_true", help="Embed one picture per row or card.")
+    parser.add_argument(
+        "--header-style",
+        choices=HEADER_STYLES,
+        default="variants",
+        help="Canonical column names, or random alias spellings per sheet.",
+    )
+    parser.add_argument(
+        "--per-store-sheets",
+        action="store_true",
+        help="Tabular layout only: one sheet per store instead of a single daily_update sheet.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    rows = write_daily_update_workbook(
+        args.output,
+        stores=args.stores,
+        styles=args.styles,
+        layout=args.layout,
+        images=args.images,
+        header_style=args.header_style,
+        per_store_sheets=args.per_store_sheets or None,
+        seed=args.seed,
+    )
+    print(f"wrote {rows:,} rows to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
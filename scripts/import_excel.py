@@ -18,7 +18,7 @@ def parse_args():
     parser = argparse.ArgumentParser(
         description="Import daily updates from an Excel workbook."
     )
-    parser.add_argument("--path", required=True, help="Path to .xlsx workbook.")
+    parser.add_argument("--path", required=True, help="Path to .xlsx workbook or .csv/.tsv file (optionally .gz).")
     parser.add_argument(
         "--sheets",
         nargs="*",
@@ -33,14 +33,21 @@ def main():
     setup_logging()
     args = parse_args()
     try:
-        results = import_workbook(args.path, sheets=args.sheets, dry_run=args.dry_run)
+        # Nothing else shares this process, so parse inline instead of spawning a worker.
+        results = import_workbook(
+            args.path,
+            sheets=args.sheets,
+            dry_run=args.dry_run,
+            parse_workers=0,
+        )
     except (OSError, ValueError, SQLAlchemyError, InvalidFileException) as exc:
         raise SystemExit(f"Import failed: {exc}") from exc
 
     for sheet_name, counts in results.items():
         print(
             f"{sheet_name}: {counts['inserted']} inserted, "
-            f"{counts['updated']} updated, {counts['skipped']} skipped"
+            f"{counts['updated']} updated, {counts['skipped']} skipped, "
+            f"{counts.get('unchanged', 0)} unchanged"
         )
         price_changes = counts.get("price_changes") or []
         if price_changes:
@@ -0,0 +1,39 @@
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database.base import Base
+from app.models import import_all_models
+
+
+class MemoryDatabaseMixin:
+    """Point service modules at a fresh in-memory SQLite database for one test."""
+
+    def use_memory_database(self, *modules, expire_on_commit=True):
+        """Create the schema and patch ``SessionLocal`` (and ``engine``/``ensure_sqlite_schema``
+        where the module has them) on each of ``modules``; returns the session factory.
+
+        One connection is shared across threads, so import jobs and parse
+        workers see the same database.
+        """
+        import_all_models()
+        self.engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.addCleanup(self.engine.dispose)
+        self.session_factory = sessionmaker(bind=self.engine, expire_on_commit=expire_on_commit)
+        for module in modules:
+            patchers = [patch.object(module, "SessionLocal", self.session_factory)]
+            if hasattr(module, "engine"):
+                patchers.append(patch.object(module, "engine", self.engine))
+            if hasattr(module, "ensure_sqlite_schema"):
+                patchers.append(patch.object(module, "ensure_sqlite_schema"))
+            for patcher in patchers:
+                patcher.start()
+                self.addCleanup(patcher.stop)
+        return self.session_factory
@@ -1,95 +1,35 @@
+import importlib
+import json
+import random
 import unittest
-from datetime import date
+from datetime import date, timedelta
+from types import SimpleNamespace
 from unittest.mock import patch
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, select, update
 from sqlalchemy.orm import sessionmaker
 
-from app.database.base import Base
 from app.models.alert import Alert
+from app.models.daily_snapshot import DailySnapshot
+from app.models.decision_profile import DecisionProfile
+from app.models.inventory import Inventory
+from app.models.product import Product
+from app.models.stores import Store
 from app.services import alert_service
 from app.services.alert_service import (
     _is_low_signal_ml_alert,
-    _recent_alert_sent,
+    _load_alert_index,
     _resolve_alert_reason,
-    alert_already_sent,
+    build_style_store_index,
     build_transfer_hint,
 )
+from app.core.decision_engine import evaluate_inventory
+from app.services.decision_profile_service import load_snapshot_decisions
 
+from db_support import MemoryDatabaseMixin
 
-class AlertServiceTest(unittest.TestCase):
-    def test_alert_dedup(self):
-        engine = create_engine("sqlite:///:memory:")
-        Base.metadata.create_all(bind=engine)
-        session_factory = sessionmaker(bind=engine)
-        db = None
-        try:
-            db = session_factory()
-            db.add(
-                Alert(
-                    alert_date=date.today(),
-                    alert_type="RULE-HIGH",
-                    category="dress",
-                    store_id=101,
-                    recipient="Founder",
-                    phone_number="12345",
-                    message="Test",
-                    capital_value=1000.0,
-                    delivered=True,
-                )
-            )
-            db.commit()
-
-            self.assertTrue(
-                alert_already_sent(
-                    db,
-                    alert_date=date.today(),
-                    alert_type="RULE-HIGH",
-                    category="dress",
-                    phone="12345",
-                )
-            )
-        finally:
-            if db is not None:
-                db.close()
-            engine.dispose()
-
-    def test_alert_dedup_ignores_failed_alerts(self):
-        engine = create_engine("sqlite:///:memory:")
-        Base.metadata.create_all(bind=engine)
-        session_factory = sessionmaker(bind=engine)
-        db = None
-        try:
-            db = session_factory()
-            db.add(
-                Alert(
-                    alert_date=date.today(),
-                    alert_type="RULE-HIGH",
-                    category="dress",
-                    store_id=101,
-                    recipient="Founder",
-                    phone_number="12345",
-                    message="Test",
-                    capital_value=1000.0,
-                    delivered=False,
-                )
-            )
-            db.commit()
-
-            self.assertFalse(
-                alert_already_sent(
-                    db,
-                    alert_date=date.today(),
-                    alert_type="RULE-HIGH",
-                    category="dress",
-                    phone="12345",
-                )
-            )
-        finally:
-            if db is not None:
-                db.close()
-            engine.dispose()
 
+class AlertServiceTest(MemoryDatabaseMixin, unittest.TestCase):
     def test_transfer_hint_prefers_healthy_peer_store(self):
         style_store_index = {
             "DRS-1001": [
@@ -132,6 +72,38 @@ class AlertServiceTest(unittest.TestCase):
         hint = build_transfer_hint("DRS-1001", style_store_index, current_store_id=101)
         self.assertIn("No peer-store data", hint)
 
+    def test_style_store_index_keeps_best_peer_for_every_store(self):
+        rng = random.Random(7)
+        today = date.today()
+        rows = [
+            SimpleNamespace(
+                Inventory=SimpleNamespace(
+                    store_id=rng.randrange(1, 6),
+                    quantity=rng.randrange(0, 4),
+                    lifecycle_start_date=today - timedelta(days=rng.choice((10, 100, 200, 300))),
+                ),
+                style_code=rng.choice(("A", "B", "C")),
+                category="dress",
+                store_name="",
+                store_city="",
+            )
+            for _ in range(300)
+        ]
+        full_index = {}
+        for row in rows:
+            single_row_index = build_style_store_index([row], today)
+            full_index.setdefault(row.style_code, []).extend(single_row_index[row.style_code])
+
+        style_store_index = build_style_store_index(rows, today)
+
+        for style_code, entries in style_store_index.items():
+            self.assertLessEqual(len(entries), 2)
+            for store_id in range(0, 7):
+                self.assertEqual(
+                    build_transfer_hint(style_code, style_store_index, store_id),
+                    build_transfer_hint(style_code, full_index, store_id),
+                )
+
     def test_resolve_alert_reason_prefers_rule_based_danger(self):
         self.assertEqual(_resolve_alert_reason("CRITICAL", 0.99), "RULE-CRITICAL")
         self.assertEqual(_resolve_alert_reason("HIGH", 0.99), "RULE-HIGH")
@@ -142,52 +114,334 @@ class AlertServiceTest(unittest.TestCase):
         self.assertFalse(_is_low_signal_ml_alert("ML-RISK-ELEVATED", "HIGH", 10.0))
         self.assertFalse(_is_low_signal_ml_alert("RULE-CRITICAL", "CRITICAL", 10.0))
 
-    def test_recent_alert_sent_checks_cooldown_window(self):
-        engine = create_engine("sqlite:///:memory:")
-        Base.metadata.create_all(bind=engine)
-        session_factory = sessionmaker(bind=engine)
-        db = None
+    def _seed_aged_inventory(self, session_factory, today):
+        db = session_factory()
         try:
-            db = session_factory()
-            today = date.today()
+            db.add(Store(id=101, name="Store 101", city=""))
+            for product_id, category in ((1, "dress"), (2, "kurti")):
+                db.add(
+                    Product(
+                        id=product_id,
+                        store_id=101,
+                        style_code=f"S{product_id}",
+                        barcode=f"B{product_id}",
+                        article_name=category,
+                        category=category,
+                        department_name="",
+                        supplier_name="Acme",
+                        mrp=1000.0,
+                        price=1000.0,
+                    )
+                )
+                db.add(
+                    Inventory(
+                        store_id=101,
+                        product_id=product_id,
+                        quantity=5,
+                        cost_price=400.0,
+                        current_price=1000.0,
+                        lifecycle_start_date=today - timedelta(days=300),
+                    )
+                )
+            for phone, delivered in (("111", True), ("222", False)):
+                db.add(
+                    Alert(
+                        alert_date=today,
+                        alert_type="RULE-HIGH",
+                        category="dress",
+                        store_id=101,
+                        recipient="Earlier",
+                        phone_number=phone,
+                        message="Earlier",
+                        capital_value=1.0,
+                        delivered=delivered,
+                    )
+                )
+            db.commit()
+        finally:
+            db.close()
+
+    def _run_alerts(self, cooldown_days=1):
+        with patch.multiple(
+            alert_service.settings,
+            FOUNDER_PHONE="111",
+            CO_FOUNDER_PHONE="222",
+            ALERT_ALWAYS_SEND=False,
+            ALERT_COOLDOWN_DAYS=cooldown_days,
+            ALERT_MAX_PER_RECIPIENT_PER_RUN=10,
+        ):
+            return alert_service.run_alerts(send_notifications=False)
+
+    def test_run_alerts_dedups_from_preloaded_index_and_bulk_inserts(self):
+        session_factory = self.use_memory_database(alert_service)
+        self._seed_aged_inventory(session_factory, date.today())
+
+        stats = self._run_alerts()
+
+        self.assertEqual(stats["alerts"], 3)
+        db = session_factory()
+        try:
+            alerts = {
+                (alert.category, alert.phone_number): alert
+                for alert in db.execute(select(Alert)).scalars()
+            }
+        finally:
+            db.close()
+        self.assertEqual(
+            sorted(alerts),
+            [("dress", "111"), ("dress", "222"), ("kurti", "111"), ("kurti", "222")],
+        )
+        self.assertEqual(alerts[("dress", "111")].message, "Earlier")
+        self.assertEqual(alerts[("dress", "222")].recipient, "Co-Founder")
+        self.assertEqual(alerts[("kurti", "111")].recipient, "Founder")
+        self.assertFalse(alerts[("kurti", "222")].delivered)
+
+    def test_alert_index_keys_alerts_from_cooldown_start(self):
+        session_factory = self.use_memory_database(alert_service)
+        today = date.today()
+        with session_factory() as db:
+            db.add_all(
+                [
+                    Alert(
+                        alert_date=alert_date,
+                        alert_type="RULE-HIGH",
+                        category="dress",
+                        store_id=101,
+                        recipient="Founder",
+                        phone_number=phone,
+                        message="Test",
+                        capital_value=1000.0,
+                        delivered=delivered,
+                    )
+                    for alert_date, phone, delivered in (
+                        (today, "12345", True),
+                        (today, "67890", False),
+                        (today - timedelta(days=2), "12345", True),
+                    )
+                ]
+            )
+            db.commit()
+
+            index = _load_alert_index(db, today - timedelta(days=1))
+
+        self.assertEqual(
+            {key: alert.delivered for key, alert in index.items()},
+            {
+                (today, "RULE-HIGH", "dress", "12345"): True,
+                (today, "RULE-HIGH", "dress", "67890"): False,
+            },
+        )
+
+    def test_run_alerts_skips_alerts_delivered_within_cooldown(self):
+        session_factory = self.use_memory_database(alert_service)
+        today = date.today()
+        self._seed_aged_inventory(session_factory, today)
+        with session_factory() as db:
             db.add(
                 Alert(
-                    alert_date=today,
+                    alert_date=today - timedelta(days=1),
                     alert_type="RULE-HIGH",
-                    category="dress",
+                    category="kurti",
                     store_id=101,
-                    recipient="Founder",
-                    phone_number="12345",
-                    message="Test",
-                    capital_value=1000.0,
+                    recipient="Earlier",
+                    phone_number="222",
+                    message="Yesterday",
+                    capital_value=1.0,
                     delivered=True,
                 )
             )
             db.commit()
 
-            self.assertTrue(
-                _recent_alert_sent(
-                    db,
-                    since_date=today,
-                    alert_type="RULE-HIGH",
-                    category="dress",
-                    phone="12345",
-                )
+        self._run_alerts(cooldown_days=2)
+
+        with session_factory() as db:
+            today_alerts = {
+                (alert.category, alert.phone_number)
+                for alert in db.execute(select(Alert).where(Alert.alert_date == today)).scalars()
+            }
+        self.assertEqual(
+            today_alerts,
+            {("dress", "111"), ("dress", "222"), ("kurti", "111")},
+        )
+
+    def test_run_alerts_upserts_one_snapshot_per_store_product_and_day(self):
+        session_factory = self.use_memory_database(alert_service)
+        today = date.today()
+        self._seed_aged_inventory(session_factory, today)
+
+        with patch.object(alert_service, "_SNAPSHOT_BATCH_SIZE", 1):
+            first = self._run_alerts()
+        db = session_factory()
+        try:
+            db.execute(update(Inventory).where(Inventory.product_id == 1).values(quantity=2))
+            db.commit()
+        finally:
+            db.close()
+        second = self._run_alerts()
+
+        self.assertEqual((first["snapshots"], second["snapshots"]), (2, 2))
+        db = session_factory()
+        try:
+            snapshots = db.execute(
+                select(DailySnapshot).order_by(DailySnapshot.product_id)
+            ).scalars().all()
+        finally:
+            db.close()
+        self.assertEqual(
+            [(item.snapshot_date, item.store_id, item.product_id, item.quantity) for item in snapshots],
+            [(today, 101, 1, 2), (today, 101, 2, 5)],
+        )
+        self.assertEqual(snapshots[0].stock_value, 2 * 1000.0)
+
+    def test_run_alerts_updates_snapshots_without_unique_key(self):
+        session_factory = self.use_memory_database(alert_service)
+        today = date.today()
+        self._seed_aged_inventory(session_factory, today)
+        snapshot_selects = []
+
+        def count_snapshot_selects(_conn, _cursor, statement, *_args):
+            if statement.startswith("SELECT") and "FROM daily_snapshots" in statement:
+                snapshot_selects.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", count_snapshot_selects)
+        with patch.object(alert_service, "_has_snapshot_unique_key", return_value=False), patch.object(
+            alert_service, "_SNAPSHOT_BATCH_SIZE", 1
+        ):
+            self._run_alerts()
+            with session_factory() as db:
+                db.execute(update(Inventory).where(Inventory.product_id == 2).values(quantity=3))
+                db.commit()
+            self._run_alerts()
+        event.remove(self.engine, "before_cursor_execute", count_snapshot_selects)
+
+        db = session_factory()
+        try:
+            snapshots = db.execute(
+                select(DailySnapshot.snapshot_date, DailySnapshot.store_id, DailySnapshot.product_id,
+                       DailySnapshot.quantity)
+                .order_by(DailySnapshot.product_id)
+            ).all()
+        finally:
+            db.close()
+        self.assertEqual(snapshots, [(today, 101, 1, 5), (today, 101, 2, 3)])
+        # One lookup of today's stored keys per run, not one per batch.
+        self.assertEqual(len(snapshot_selects), 2)
+
+    def test_sqlite_schema_dedupes_snapshots_before_unique_index(self):
+        engine_module = importlib.import_module("app.database.engine")
+        engine = create_engine("sqlite:///:memory:")
+        self.addCleanup(engine.dispose)
+        with engine.begin() as conn:
+            conn.exec_driver_sql(
+                "CREATE TABLE daily_snapshots (id INTEGER PRIMARY KEY, snapshot_date DATE, "
+                "store_id INTEGER, product_id INTEGER, quantity INTEGER)"
             )
-            self.assertFalse(
-                _recent_alert_sent(
-                    db,
-                    since_date=today,
-                    alert_type="RULE-CRITICAL",
-                    category="dress",
-                    phone="12345",
-                )
+            conn.exec_driver_sql(
+                "INSERT INTO daily_snapshots (id, snapshot_date, store_id, product_id, quantity) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (1, "2024-01-01", 101, 1, 5),
+                    (2, "2024-01-01", 101, 1, 3),
+                    (3, "2024-01-01", 101, 2, 7),
+                ],
             )
+        db = sessionmaker(bind=engine)()
+        self.addCleanup(db.close)
+        self.assertIsNone(alert_service._snapshot_insert_factory(db))
+        db.rollback()
+
+        with engine.begin() as conn:
+            engine_module._ensure_sqlite_unique_indexes(conn)
+            rows = conn.exec_driver_sql(
+                "SELECT id, product_id, quantity FROM daily_snapshots ORDER BY id"
+            ).fetchall()
+        self.assertEqual(rows, [(2, 1, 3), (3, 2, 7)])
+        self.assertIsNotNone(alert_service._snapshot_insert_factory(db))
+
+    def test_snapshots_store_shared_decision_profile_ids(self):
+        session_factory = self.use_memory_database(alert_service)
+        self._seed_aged_inventory(session_factory, date.today())
+
+        self._run_alerts()
+        self._run_alerts()
+
+        db = session_factory()
+        try:
+            snapshots = db.execute(
+                select(DailySnapshot).order_by(DailySnapshot.product_id)
+            ).scalars().all()
+            profile_count = len(db.execute(select(DecisionProfile)).scalars().all())
+            decisions = load_snapshot_decisions(db, snapshots)
         finally:
-            if db is not None:
-                db.close()
-            engine.dispose()
+            db.close()
+        self.assertEqual(profile_count, 1)
+        self.assertEqual(snapshots[0].decision_profile_id, snapshots[1].decision_profile_id)
+        self.assertEqual(
+            decisions,
+            [
+                evaluate_inventory("dress", 300, snapshots[0].demand_band, "HIGH"),
+                evaluate_inventory("kurti", 300, snapshots[1].demand_band, "HIGH"),
+            ],
+        )
+
+    def test_sqlite_schema_moves_legacy_decision_json_into_profiles(self):
+        engine_module = importlib.import_module("app.database.engine")
+        engine = create_engine("sqlite:///:memory:")
+        self.addCleanup(engine.dispose)
+        legacy = [
+            evaluate_inventory("dress", 300, "M", "HIGH"),
+            evaluate_inventory("kurti", 320, "M", "HIGH"),
+            evaluate_inventory("dress", 10, "M", None),
+        ]
+        with engine.begin() as conn:
+            DecisionProfile.__table__.create(conn)
+            conn.exec_driver_sql(
+                "CREATE TABLE daily_snapshots (id INTEGER PRIMARY KEY, decision TEXT NOT NULL, "
+                "decision_profile_id INTEGER)"
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO daily_snapshots (id, decision) VALUES (?, ?)",
+                [(index, json.dumps(decision)) for index, decision in enumerate(legacy, start=1)],
+            )
+            engine_module._migrate_sqlite_snapshot_decisions(conn)
+
+            columns = engine_module._get_sqlite_columns(conn, "daily_snapshots")
+            profile_ids = [
+                row[0]
+                for row in conn.exec_driver_sql(
+                    "SELECT decision_profile_id FROM daily_snapshots ORDER BY id"
+                )
+            ]
+            profiles = dict(conn.exec_driver_sql("SELECT id, decision FROM decision_profiles").fetchall())
+        self.assertNotIn("decision", columns)
+        self.assertEqual(len(profiles), 2)
+        self.assertEqual(profile_ids[0], profile_ids[1])
+        self.assertEqual(json.loads(profiles[profile_ids[2]])["status"], "HEALTHY")
+
+
+    def test_sqlite_schema_refuses_to_keep_legacy_decision_column(self):
+        engine_module = importlib.import_module("app.database.engine")
+        engine = create_engine("sqlite:///:memory:")
+        self.addCleanup(engine.dispose)
+        with engine.begin() as conn:
+            DecisionProfile.__table__.create(conn)
+            conn.exec_driver_sql(
+                "CREATE TABLE daily_snapshots (id INTEGER PRIMARY KEY, snapshot_date DATE, "
+                "store_id INTEGER, product_id INTEGER, decision TEXT NOT NULL, "
+                "decision_profile_id INTEGER)"
+            )
+        with patch.object(engine_module.sqlite3, "sqlite_version_info", (3, 31, 1)):
+            with engine.begin() as conn, self.assertRaises(RuntimeError):
+                engine_module._migrate_sqlite_snapshot_decisions(conn)
 
+        with patch.object(engine_module, "engine", engine), patch.object(
+            engine_module, "is_sqlite", True
+        ), patch.object(
+            engine_module,
+            "_migrate_sqlite_snapshot_decisions",
+            side_effect=engine_module.SQLAlchemyError("locked"),
+        ), self.assertRaises(RuntimeError):
+            engine_module.ensure_sqlite_schema()
 
 if __name__ == "__main__":
     unittest.main()
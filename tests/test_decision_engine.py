@@ -1,6 +1,9 @@
+import subprocess
+import sys
 import unittest
 
-from app.core.decision_engine import evaluate_inventory
+from app.core.decision_encoding import DECISION_PROFILE_FIELDS
+from app.core.decision_engine import decision_profile, decision_profile_key, evaluate_inventory
 
 
 class DecisionEngineTest(unittest.TestCase):
@@ -24,6 +27,35 @@ class DecisionEngineTest(unittest.TestCase):
         self.assertEqual(result["status"], "HEALTHY")
         self.assertNotIn("TRANSFER_REVIEW", result["eligible_actions"])
 
+    def test_results_share_memoized_profile_but_not_its_lists(self):
+        first = evaluate_inventory("dress", 200, "L", "HIGH")
+        second = evaluate_inventory("saree", 300, "l", "HIGH")
+
+        self.assertEqual(decision_profile_key(200, "L", "HIGH"), decision_profile_key(300, "l", "HIGH"))
+        self.assertEqual(first["context"], {"category": "dress", "age_days": 200})
+        self.assertEqual(second["context"], {"category": "saree", "age_days": 300})
+        first["eligible_actions"].append("MUTATED")
+        profile = decision_profile(*decision_profile_key(200, "L", "HIGH"))
+        self.assertEqual(profile["eligible_actions"], ["PRIORITY_TRANSFER", "TRANSFER_REVIEW"])
+        self.assertEqual(second["eligible_actions"], profile["eligible_actions"])
+
+
+    def test_profile_fields_match_decision_profile(self):
+        profile = decision_profile(*decision_profile_key(300, "M", "HIGH"))
+        self.assertEqual(sorted(profile), sorted(DECISION_PROFILE_FIELDS))
+
+    def test_database_engine_does_not_import_decision_rules(self):
+        loaded = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, app.database.engine; print('app.core.decision_engine' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        self.assertEqual(loaded, "False")
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,91 @@
+import hashlib
+from pathlib import Path
+import tempfile
+from types import SimpleNamespace
+import unittest
+from unittest.mock import patch
+
+from app.core.inotify import IN_CLOSE_WRITE, IN_MOVED_TO, InotifyWatcher, inotify_available
+from app.services import ingestion_service
+from app.services.import_job_service import ImportJobManager
+from app.services.ingestion_service import ExcelWatchService
+
+
+class ExcelWatchServiceTest(unittest.TestCase):
+    @unittest.skipUnless(inotify_available(), "inotify is Linux-only")
+    def test_inotify_reports_closed_and_renamed_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            watcher = InotifyWatcher(temp_dir)
+            try:
+                Path(temp_dir, "daily.xlsx").write_bytes(b"data")
+                Path(temp_dir, "upload.tmp").write_bytes(b"data")
+                Path(temp_dir, "upload.tmp").rename(Path(temp_dir, "moved.xlsx"))
+                events = watcher.read_events(1.0)
+            finally:
+                watcher.close()
+
+        self.assertIn((IN_CLOSE_WRITE, "daily.xlsx"), events)
+        self.assertIn((IN_MOVED_TO, "moved.xlsx"), events)
+
+    def test_events_are_debounced_into_bounded_queue(self):
+        service = ExcelWatchService("datasource", debounce_seconds=1.0, queue_size=1)
+        first = Path("datasource/a.xlsx")
+        second = Path("datasource/b.xlsx")
+
+        service._schedule(first, now=10.0)
+        service._schedule(Path("datasource/~$a.xlsx"), now=10.0)
+        service._schedule(Path("datasource/notes.txt"), now=10.0)
+        service._schedule(first, now=10.5)
+        service._enqueue_due(now=11.0)
+        self.assertEqual(service._queue.qsize(), 0)
+        self.assertEqual(list(service._pending), [first])
+
+        service._schedule(second, now=10.8)
+        with self.assertLogs("app.services.ingestion_service", level="WARNING") as logs:
+            service._enqueue_due(now=12.0)
+            service._enqueue_due(now=13.5)
+        self.assertEqual(len(logs.output), 1)
+        self.assertEqual(service._pending, {second: 14.5})
+        self.assertEqual(service._next_event_timeout(now=13.5), 1.0)
+
+        self.assertEqual(service._queue.get_nowait(), first)
+        service._enqueue_due(now=14.0)
+        self.assertEqual(service._queue.qsize(), 0)
+        service._enqueue_due(now=14.5)
+        self.assertEqual(service._queue.get_nowait(), second)
+        self.assertEqual(service._pending, {})
+        self.assertEqual(service._delayed, set())
+
+    def test_imports_run_through_the_job_manager(self):
+        manager = ImportJobManager(max_concurrent=1, max_pending=1)
+        self.addCleanup(manager.shutdown)
+        results = {"daily_update": {"inserted": 2, "updated": 0, "unchanged": 0}}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / "daily_update.csv"
+            file_path.write_text("store_id\n1\n", encoding="utf-8")
+            service = ExcelWatchService(tmp_dir, import_jobs=lambda: manager)
+            with patch.object(
+                ingestion_service, "claim_workbook_import", return_value=SimpleNamespace(id=7)
+            ), patch.object(ingestion_service, "import_workbook") as direct_import, patch(
+                "app.services.import_job_service.import_workbook", return_value=results
+            ) as job_import, patch(
+                "app.services.import_job_service.complete_workbook_import"
+            ) as complete:
+                service._import_file(file_path)
+
+        direct_import.assert_not_called()
+        job_import.assert_called_once()
+        self.assertIsNotNone(job_import.call_args.kwargs["progress"])
+        self.assertEqual(
+            job_import.call_args.kwargs["source_sha256"], hashlib.sha256(b"store_id\n1\n").hexdigest()
+        )
+        self.assertEqual(complete.call_args.args[:2], (7, results))
+        self.assertIn(file_path, service._processed)
+
+    def test_rejects_unknown_watch_mode(self):
+        with self.assertRaises(ValueError):
+            ExcelWatchService("datasource", watch_mode="fanotify")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from PIL import Image
+
+from app.services import image_service
+from app.services.image_service import (
+    RENDITION_PDF,
+    RENDITION_TELEGRAM,
+    RENDITION_THUMB,
+    create_renditions,
+    find_rendition,
+    rendition_url,
+)
+
+
+class ImageServiceTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.static_dir = Path(temp_dir.name)
+        self.original = self.static_dir / "images" / "sha256" / "abc.png"
+        self.original.parent.mkdir(parents=True)
+        Image.new("RGBA", (2000, 1000), (200, 30, 30, 128)).save(self.original)
+
+    def test_create_renditions_writes_each_standard_size(self):
+        written = create_renditions(self.original)
+
+        self.assertEqual(
+            sorted(path.name for path in written),
+            ["abc.pdf.jpg", "abc.telegram.jpg", "abc.thumb.webp"],
+        )
+        with Image.open(find_rendition(self.original, RENDITION_PDF)) as pdf_image:
+            self.assertEqual(pdf_image.size, (122, 108))
+            self.assertTrue(pdf_image.info.get("progressive"))
+        with Image.open(find_rendition(self.original, RENDITION_TELEGRAM)) as telegram_image:
+            self.assertEqual(telegram_image.size, (1280, 640))
+        with Image.open(find_rendition(self.original, RENDITION_THUMB)) as thumb_image:
+            self.assertEqual((thumb_image.format, thumb_image.size), ("WEBP", (96, 96)))
+
+    def test_rendition_url_only_points_at_generated_files(self):
+        with patch.object(image_service, "STATIC_DIR", self.static_dir):
+            self.assertIsNone(rendition_url("/static/images/sha256/abc.png", RENDITION_THUMB))
+            create_renditions(self.original)
+            self.assertEqual(
+                rendition_url("/static/images/sha256/abc.png", RENDITION_THUMB),
+                "/static/images/sha256/abc.thumb.webp",
+            )
+            self.assertIsNone(rendition_url("https://cdn.example.com/abc.png", RENDITION_THUMB))
+
+    def test_unreadable_image_gets_no_renditions(self):
+        broken = self.original.with_name("broken.jpg")
+        broken.write_bytes(b"not an image")
+        self.assertEqual(create_renditions(broken), [])
+        self.assertIsNone(find_rendition(broken, RENDITION_PDF))
+
+
+if __name__ == "__main__":
+    unittest.main()
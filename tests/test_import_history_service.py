@@ -0,0 +1,88 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.services import import_history_service
+from app.services.import_history_service import (
+    STATUS_FAILED,
+    STATUS_SUCCESS,
+    claim_workbook_import,
+    complete_workbook_import,
+    compute_file_sha256,
+    fail_workbook_import,
+    list_workbook_imports,
+)
+
+from db_support import MemoryDatabaseMixin
+
+
+class ImportHistoryServiceTest(MemoryDatabaseMixin, unittest.TestCase):
+    def setUp(self):
+        self.use_memory_database(import_history_service, expire_on_commit=False)
+
+    def test_identical_content_is_claimed_once(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            first_path = Path(tmp_dir) / "daily_update.xlsx"
+            copy_path = Path(tmp_dir) / "daily_update_copy.xlsx"
+            first_path.write_bytes(b"workbook-bytes")
+            copy_path.write_bytes(b"workbook-bytes")
+            sha256 = compute_file_sha256(first_path)
+            self.assertEqual(sha256, compute_file_sha256(copy_path))
+
+            claim = claim_workbook_import(sha256=sha256, file_path=first_path, file_size=14)
+            self.assertIsNotNone(claim)
+            self.assertIsNone(
+                claim_workbook_import(sha256=sha256, file_path=copy_path, file_size=14)
+            )
+
+            complete_workbook_import(
+                claim.id,
+                {"daily_update": {"inserted": 2, "updated": 0, "price_changes": [{}]}},
+                1.5,
+            )
+            self.assertIsNone(
+                claim_workbook_import(sha256=sha256, file_path=copy_path, file_size=14)
+            )
+
+        db = self.session_factory()
+        try:
+            history = list_workbook_imports(db)
+        finally:
+            db.close()
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history[0].status, STATUS_SUCCESS)
+        self.assertIn('"price_changes": 1', history[0].result)
+        self.assertEqual(history[0].duration_seconds, 1.5)
+
+    def test_failed_import_can_be_retried(self):
+        claim = claim_workbook_import(sha256="a" * 64, file_path="a.xlsx", file_size=1)
+        fail_workbook_import(claim.id, ValueError("bad sheet"), 0.2)
+
+        retry = claim_workbook_import(sha256="a" * 64, file_path="a.xlsx", file_size=1)
+        self.assertIsNotNone(retry)
+        self.assertEqual(retry.attempt, 2)
+        self.assertIsNone(retry.error_message)
+
+        db = self.session_factory()
+        try:
+            self.assertNotEqual(list_workbook_imports(db)[0].status, STATUS_FAILED)
+        finally:
+            db.close()
+
+    def test_stale_running_import_is_reclaimed(self):
+        claim_workbook_import(sha256="b" * 64, file_path="b.xlsx", file_size=1)
+        self.assertIsNone(
+            claim_workbook_import(sha256="b" * 64, file_path="b.xlsx", file_size=1)
+        )
+        reclaimed = claim_workbook_import(
+            sha256="b" * 64,
+            file_path="b.xlsx",
+            file_size=1,
+            stale_seconds=-1,
+        )
+        self.assertIsNotNone(reclaimed)
+        self.assertEqual(reclaimed.attempt, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
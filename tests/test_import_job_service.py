@@ -0,0 +1,112 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app.services.import_job_service import (
+    STATUS_FAILED,
+    STATUS_SUCCESS,
+    ImportJobManager,
+    ImportQueueFullError,
+)
+
+
+class ImportJobServiceTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = Path(temp_dir.name) / "daily_update.csv"
+        self.path.write_text("store_id\n1\n", encoding="utf-8")
+
+    def test_job_reports_progress_and_results(self):
+        release = threading.Event()
+        applying = threading.Event()
+
+        def fake_import(path, *, sheets, dry_run, progress, source_sha256):
+            progress.set_phase("parsing")
+            progress.set_total(10)
+            progress.add_parsed(10)
+            progress.set_phase("applying")
+            progress.add_applied(4)
+            applying.set()
+            release.wait(5)
+            progress.add_applied(6)
+            return {"daily_update": {"inserted": 10}}
+
+        manager = ImportJobManager(max_concurrent=1)
+        self.addCleanup(manager.shutdown)
+        with patch("app.services.import_job_service.import_workbook", side_effect=fake_import):
+            job = manager.submit(self.path)
+            self.assertTrue(applying.wait(5))
+            running = manager.get(job.id).to_dict()
+            release.set()
+            self.assertTrue(job.wait(5))
+
+        self.assertEqual(running["status"], "running")
+        self.assertEqual(running["progress"]["phase"], "applying")
+        self.assertEqual(running["progress"]["rows_applied"], 4)
+        self.assertIsNotNone(running["progress"]["eta_seconds"])
+
+        finished = job.to_dict()
+        self.assertEqual(finished["status"], STATUS_SUCCESS)
+        self.assertEqual(finished["results"], {"daily_update": {"inserted": 10}})
+        self.assertEqual(finished["progress"]["rows_applied"], 10)
+        self.assertIsNone(finished["progress"]["eta_seconds"])
+
+    def test_failed_job_records_error(self):
+        manager = ImportJobManager(max_concurrent=1)
+        self.addCleanup(manager.shutdown)
+        with patch(
+            "app.services.import_job_service.import_workbook",
+            side_effect=ValueError("daily_update sheet missing columns: mrp"),
+        ):
+            job = manager.submit(self.path)
+            self.assertTrue(job.wait(5))
+
+        self.assertEqual(job.status, STATUS_FAILED)
+        self.assertIn("missing columns", job.error)
+
+    def test_submit_validates_path_and_bounds_pending_jobs(self):
+        manager = ImportJobManager(max_concurrent=1, max_pending=1)
+        self.addCleanup(manager.shutdown)
+        with self.assertRaises(FileNotFoundError):
+            manager.submit(self.path.with_name("missing.csv"))
+
+        release = threading.Event()
+        with patch(
+            "app.services.import_job_service.import_workbook",
+            side_effect=lambda *args, **kwargs: release.wait(5),
+        ):
+            job = manager.submit(self.path)
+            with self.assertRaises(ImportQueueFullError):
+                manager.submit(self.path)
+            release.set()
+            self.assertTrue(job.wait(5))
+
+
+    def test_run_waits_for_the_job_and_ignores_pending_limit(self):
+        manager = ImportJobManager(max_concurrent=1, max_pending=1)
+        self.addCleanup(manager.shutdown)
+        release = threading.Event()
+
+        def fake_import(path, *, sheets, dry_run, progress, source_sha256):
+            release.wait(5)
+            return {"daily_update": {"inserted": 1}}
+
+        timer = threading.Timer(0.2, release.set)
+        self.addCleanup(timer.cancel)
+        with patch("app.services.import_job_service.import_workbook", side_effect=fake_import):
+            queued = manager.submit(self.path)
+            timer.start()
+            job = manager.run(self.path, sheets=["daily_update"])
+
+        self.assertTrue(queued.wait(0))
+
+        self.assertEqual(job.status, STATUS_SUCCESS)
+        self.assertEqual(job.sheets, ["daily_update"])
+        self.assertEqual(job.results, {"daily_update": {"inserted": 1}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,22 +1,49 @@
 import base64
+import csv
+import gzip
+import hashlib
+from datetime import date
 from pathlib import Path
+import pickle
 import tempfile
+import threading
+import tracemalloc
 import unittest
 from unittest.mock import patch
 
 from openpyxl import Workbook, load_workbook
 from openpyxl.drawing.image import Image as XLImage
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
 
+from app.database.base import Base
+from app.models import import_all_models
+from app.models.import_checkpoint import ImportCheckpoint
+from app.models.inferred_sale import InferredSale
+from app.models.inventory import Inventory
+from app.models.inventory_delta import InventoryDelta
+from app.models.price_history import PriceHistory
+from app.models.product import Product
+from app.models.product_image import ProductImage
+from app.models.report_import_line import ReportImportLine
+from app.models.sales import Sales
+from app.models.stores import Store
 from app.services import ingestion_service
 from app.services.ingestion_service import (
+    import_rows,
     load_sheet_rows,
     normalize_header,
     normalize_sheet_list,
     validate_columns,
 )
+from app.services.product_service import bulk_update_prices
+from app.services.sales_service import load_lifecycle_report_totals, load_recent_sales_totals
 
+from db_support import MemoryDatabaseMixin
 
-class IngestionServiceTest(unittest.TestCase):
+
+class IngestionServiceTest(MemoryDatabaseMixin, unittest.TestCase):
     def test_header_aliases(self):
         self.assertEqual(normalize_header("Style Code"), "style_code")
         self.assertEqual(normalize_header("Item MRP"), "mrp")
@@ -102,12 +129,117 @@ class IngestionServiceTest(unittest.TestCase):
 
             with patch.object(ingestion_service, "_IMAGE_DIR", image_dir):
                 rows, _ = load_sheet_rows(loaded_sheet)
+                ingestion_service.wait_for_image_writes()
 
             self.assertEqual(len(rows), 1)
-            image_url = rows[0].get("image_url")
-            self.assertIsNotNone(image_url)
-            self.assertTrue(image_url.startswith("/static/images/001261397."))
-            self.assertEqual(len(list(image_dir.glob("001261397.*"))), 1)
+            digest = hashlib.sha256(png_bytes).hexdigest()
+            self.assertEqual(rows[0].get("image_url"), f"/static/images/sha256/{digest}.png")
+            self.assertEqual((image_dir / "sha256" / f"{digest}.png").read_bytes(), png_bytes)
+
+    def test_card_layout_embedded_image_survives_worker_round_trip(self):
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = "001000000000760_20260220120225"
+
+        worksheet.cell(row=6, column=7, value="Supplier Name")
+        worksheet.cell(row=6, column=9, value="Sampat Sachin Sarees")
+        worksheet.cell(row=8, column=7, value="Department")
+        worksheet.cell(row=8, column=9, value="DRESS")
+        worksheet.cell(row=9, column=7, value="Style")
+        worksheet.cell(row=9, column=9, value="PSD3-80279")
+        worksheet.cell(row=12, column=7, value="MRP")
+        worksheet.cell(row=12, column=9, value="6995.00")
+        worksheet.cell(row=15, column=7, value="PUR Qty")
+        worksheet.cell(row=15, column=9, value="1.00")
+
+        png_bytes = base64.b64decode(
+            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAwMCAO+/n1cAAAAASUVORK5CYII="
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            image_path = tmp_path / "embedded.png"
+            image_path.write_bytes(png_bytes)
+            worksheet.add_image(XLImage(str(image_path)), "E5")
+            workbook_path = tmp_path / "card_layout.xlsx"
+            workbook.save(workbook_path)
+
+            plan = ingestion_service._plan_sheet_imports([worksheet.title], None)
+            with patch.object(ingestion_service, "_IMAGE_DIR", tmp_path / "images"):
+                # The unit of work a parse worker runs, sent back through pickle.
+                parsed = pickle.loads(
+                    pickle.dumps(ingestion_service.parse_workbook_sheets(str(workbook_path), plan))
+                )
+
+        digest = hashlib.sha256(png_bytes).hexdigest()
+        records = [record for sheet in parsed for record in sheet.iter_records()]
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["image_url"], f"/static/images/sha256/{digest}.png")
+
+    def test_reimporting_embedded_images_writes_nothing_new(self):
+        session_factory = self.use_memory_database(ingestion_service)
+        with session_factory() as db:
+            db.add(Store(id=1, name="Store 1", city="City"))
+            db.commit()
+
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = "daily_update"
+        worksheet.append(
+            ["store_id", "supplier_name", "stock_days", "style_code", "department_name", "item_mrp", "image"]
+        )
+        worksheet.append([1, "Supplier", 2, "STYLE-1", "DRESS", 4999, None])
+        worksheet.append([1, "Supplier", 2, "STYLE-2", "DRESS", 2999, None])
+        png_bytes = base64.b64decode(
+            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAwMCAO+/n1cAAAAASUVORK5CYII="
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            image_path = tmp_path / "embedded.png"
+            image_path.write_bytes(png_bytes)
+            worksheet.add_image(XLImage(str(image_path)), "G2")
+            worksheet.add_image(XLImage(str(image_path)), "G3")
+            workbook_path = tmp_path / "daily_update.xlsx"
+            workbook.save(workbook_path)
+            image_dir = tmp_path / "images"
+
+            with patch.object(ingestion_service, "_IMAGE_DIR", image_dir), patch.object(
+                ingestion_service, "_write_image_file", wraps=ingestion_service._write_image_file
+            ) as write_mock:
+                ingestion_service.import_workbook(workbook_path, parse_workers=0, chunk_rows=0)
+                first_writes = write_mock.call_count
+                ingestion_service.import_workbook(workbook_path, parse_workers=0, chunk_rows=0)
+
+            stored = sorted(path.name for path in (image_dir / "sha256").iterdir())
+
+        digest = hashlib.sha256(png_bytes).hexdigest()
+        self.assertEqual(first_writes, 1)
+        self.assertEqual(write_mock.call_count, 1)
+        self.assertEqual(
+            stored,
+            [f"{digest}.pdf.jpg", f"{digest}.png", f"{digest}.telegram.jpg", f"{digest}.thumb.webp"],
+        )
+        with session_factory() as db:
+            mapping = db.execute(
+                select(ProductImage.style_code, ProductImage.sha256).order_by(ProductImage.style_code)
+            ).all()
+            image_urls = set(db.scalars(select(Product.image_url)))
+        self.assertEqual(mapping, [("STYLE-1", digest), ("STYLE-2", digest)])
+        self.assertEqual(image_urls, {f"/static/images/sha256/{digest}.png"})
+
+    def test_card_image_assignment_picks_nearest_column_and_record(self):
+        value_indices = [4, 9, 14]
+        self.assertEqual(ingestion_service._nearest_value_index(value_indices, 2), 4)
+        self.assertEqual(ingestion_service._nearest_value_index(value_indices, 9), 14)
+        self.assertEqual(ingestion_service._nearest_value_index(value_indices, 20), 14)
+
+        supplier_rows = [2, 12, 22]
+        self.assertEqual(ingestion_service._nearest_record_position(supplier_rows, 1), 0)
+        self.assertEqual(ingestion_service._nearest_record_position(supplier_rows, 7), 0)
+        self.assertEqual(ingestion_service._nearest_record_position(supplier_rows, 8), 1)
+        self.assertEqual(ingestion_service._nearest_record_position(supplier_rows, 40), 2)
+        self.assertIsNone(ingestion_service._nearest_record_position([], 5))
 
     def test_load_sheet_rows_prefers_embedded_image_over_identifier_text(self):
         workbook = Workbook()
@@ -147,12 +279,59 @@ class IngestionServiceTest(unittest.TestCase):
 
             with patch.object(ingestion_service, "_IMAGE_DIR", image_dir):
                 rows, _ = load_sheet_rows(loaded_sheet)
+                ingestion_service.wait_for_image_writes()
 
             self.assertEqual(len(rows), 1)
-            image_url = rows[0].get("image_url")
-            self.assertIsNotNone(image_url)
-            self.assertTrue(image_url.startswith("/static/images/STYLE-123."))
-            self.assertEqual(len(list(image_dir.glob("STYLE-123.*"))), 1)
+            digest = hashlib.sha256(png_bytes).hexdigest()
+            self.assertEqual(rows[0].get("image_url"), f"/static/images/sha256/{digest}.png")
+            self.assertEqual(len(list(image_dir.glob("sha256/*.png"))), 1)
+
+    def test_load_sheet_rows_reads_embedded_images_from_read_only_workbook(self):
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = "daily_update"
+        worksheet.append(
+            [
+                "store_id",
+                "supplier_name",
+                "stock_days",
+                "style_code",
+                "department_name",
+                "category_name",
+                "item_mrp",
+                "image",
+            ]
+        )
+        worksheet.append([1, "Supplier", 2, "STYLE-RO", "DRESS", "DRESS", 4999, None])
+        worksheet.append([1, "Supplier", 3, "STYLE-RO2", "DRESS", "DRESS", 2999])
+
+        png_bytes = base64.b64decode(
+            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAwMCAO+/n1cAAAAASUVORK5CYII="
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            image_path = tmp_path / "embedded.png"
+            image_path.write_bytes(png_bytes)
+
+            worksheet.add_image(XLImage(str(image_path)), "H2")
+            workbook_path = tmp_path / "streaming.xlsx"
+            workbook.save(workbook_path)
+
+            loaded_workbook = load_workbook(workbook_path, read_only=True, data_only=True)
+            image_dir = tmp_path / "images"
+            try:
+                with patch.object(ingestion_service, "_IMAGE_DIR", image_dir):
+                    rows, _ = load_sheet_rows(loaded_workbook["daily_update"])
+                    ingestion_service.wait_for_image_writes()
+            finally:
+                loaded_workbook.close()
+
+            self.assertEqual(len(rows), 2)
+            digest = hashlib.sha256(png_bytes).hexdigest()
+            self.assertEqual(rows[0]["image_url"], f"/static/images/sha256/{digest}.png")
+            self.assertIsNone(rows[1]["image_url"])
+            self.assertEqual(len(list(image_dir.glob("sha256/*.png"))), 1)
 
     def test_resolve_image_url_preserves_explicit_reference(self):
         with patch.object(ingestion_service, "_get_image_index", return_value={}):
@@ -168,6 +347,107 @@ class IngestionServiceTest(unittest.TestCase):
         self.assertFalse(image_explicit)
         self.assertIsNone(image_url)
 
+    def test_resolve_image_url_falls_back_to_stored_product_image(self):
+        session_factory = self.use_memory_database(ingestion_service)
+        image_url = "/static/images/sha256/{}.png".format("a" * 64)
+        with session_factory() as db:
+            db.add(ProductImage(style_code="STYLE-1", sha256="a" * 64, image_url=image_url))
+            db.commit()
+            with patch.object(ingestion_service, "_get_image_index", return_value={}):
+                context = ingestion_service.ImportContext.load(db)
+
+        self.assertEqual(
+            ingestion_service.resolve_image_url({"style_code": "STYLE-1"}, context=context),
+            (image_url, False),
+        )
+        self.assertEqual(
+            ingestion_service.resolve_image_url({"style_code": "STYLE-2"}, context=context),
+            (None, False),
+        )
+
+    def test_wait_for_image_writes_only_waits_for_given_images(self):
+        release = threading.Event()
+        write_image_file = ingestion_service._write_image_file
+
+        def slow_write(path, data):
+            if data == b"slow":
+                release.wait(5)
+            return write_image_file(path, data)
+
+        with tempfile.TemporaryDirectory() as tmp_dir, patch.object(
+            ingestion_service, "_IMAGE_DIR", Path(tmp_dir)
+        ), patch.object(ingestion_service, "_write_image_file", side_effect=slow_write), patch.object(
+            ingestion_service, "create_renditions"
+        ):
+            slow_url = ingestion_service.store_image_bytes(b"slow", ".png")
+            fast_url = ingestion_service.store_image_bytes(b"fast", ".png")
+            self.assertEqual(ingestion_service.wait_for_image_writes([fast_url]), set())
+            self.assertFalse(ingestion_service._image_store_path(slow_url).exists())
+            release.set()
+            self.assertEqual(ingestion_service.wait_for_image_writes([slow_url]), set())
+
+    def test_store_image_bytes_renders_existing_original_once(self):
+        png_bytes = base64.b64decode(
+            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAwMCAO+/n1cAAAAASUVORK5CYII="
+        )
+        digest = hashlib.sha256(png_bytes).hexdigest()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            image_dir = Path(tmp_dir)
+            (image_dir / "sha256").mkdir()
+            (image_dir / "sha256" / f"{digest}.png").write_bytes(png_bytes)
+
+            with patch.object(ingestion_service, "_IMAGE_DIR", image_dir), patch.object(
+                ingestion_service, "_write_image_file"
+            ) as write_mock:
+                image_url = ingestion_service.store_image_bytes(png_bytes, ".png")
+                ingestion_service.wait_for_image_writes([image_url])
+                with patch.object(ingestion_service, "create_renditions") as render_mock:
+                    ingestion_service.store_image_bytes(png_bytes, ".png")
+
+            stored = sorted(path.name for path in (image_dir / "sha256").iterdir())
+
+        write_mock.assert_not_called()
+        render_mock.assert_not_called()
+        self.assertEqual(
+            stored,
+            [f"{digest}.pdf.jpg", f"{digest}.png", f"{digest}.telegram.jpg", f"{digest}.thumb.webp"],
+        )
+
+    def test_failed_image_write_clears_image_url(self):
+        session_factory = self.use_memory_database(ingestion_service)
+        with session_factory() as db:
+            db.add(Store(id=1, name="Store 1", city="City"))
+            db.commit()
+
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = "daily_update"
+        worksheet.append(["store_id", "supplier_name", "stock_days", "style_code", "department_name", "mrp", "image"])
+        worksheet.append([1, "Supplier", 2, "STYLE-1", "DRESS", 4999, None])
+        png_bytes = base64.b64decode(
+            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAwMCAO+/n1cAAAAASUVORK5CYII="
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            image_path = tmp_path / "embedded.png"
+            image_path.write_bytes(png_bytes)
+            worksheet.add_image(XLImage(str(image_path)), "G2")
+            workbook_path = tmp_path / "daily_update.xlsx"
+            workbook.save(workbook_path)
+            plan = [("daily_update", "daily_update")]
+
+            with patch.object(ingestion_service, "_IMAGE_DIR", tmp_path / "images"), patch.object(
+                ingestion_service, "_write_image_file", side_effect=OSError("disk full")
+            ):
+                parsed = ingestion_service.parse_workbook_sheets(str(workbook_path), plan)
+                ingestion_service.import_workbook(workbook_path, parse_workers=0, chunk_rows=0)
+
+        self.assertEqual([record["image_url"] for record in parsed[0].iter_records()], [None])
+        with session_factory() as db:
+            self.assertEqual(db.scalars(select(Product.image_url)).all(), [None])
+            self.assertEqual(db.scalar(select(func.count(ProductImage.id))), 0)
+
     def test_build_product_values_keeps_explicit_image_reference(self):
         existing = type("ProductStub", (), {"image_url": "/static/images/old.jpg"})()
         values = ingestion_service.build_product_values(
@@ -186,6 +466,771 @@ class IngestionServiceTest(unittest.TestCase):
         self.assertIn("image_url", values)
         self.assertEqual(values["image_url"], "C.C[12]")
 
+    def test_import_rows_bulk_daily_update_matches_row_by_row(self):
+        def daily_row(style_code, mrp, **extra):
+            return {
+                "store_id": 1,
+                "style_code": style_code,
+                "supplier_name": "SUP",
+                "stock_days": 10,
+                "department_name": "DRESS",
+                "category": "DRESS",
+                "mrp": mrp,
+                **extra,
+            }
+
+        batches = [
+            [
+                daily_row("A", 100, quantity=3),
+                daily_row("B", 200),
+                daily_row("A", 120, price=110),
+            ],
+            [
+                daily_row("A", 130, quantity=2),
+                daily_row("B", 250),
+                daily_row("C", 50, price=40),
+                daily_row("C", 50, price=45),
+            ],
+        ]
+
+        def run_import(use_bulk):
+            import_all_models()
+            engine = create_engine("sqlite:///:memory:")
+            Base.metadata.create_all(bind=engine)
+            db = sessionmaker(bind=engine)()
+            try:
+                db.add(Store(id=1, name="Store 1", city="City"))
+                db.commit()
+                summaries = []
+                factory = None if not use_bulk else ingestion_service._bulk_insert_factory(db)
+                with patch.object(ingestion_service, "_bulk_insert_factory", return_value=factory):
+                    for rows in batches:
+                        counts = import_rows(db, "daily_update", [dict(row) for row in rows])
+                        db.commit()
+                        summaries.append(
+                            (
+                                counts["inserted"],
+                                counts["updated"],
+                                [
+                                    (item["style_code"], item["new_price"], item["source"])
+                                    for item in counts["price_changes"]
+                                ],
+                            )
+                        )
+                products = [
+                    (item.id, item.style_code, item.mrp, item.price)
+                    for item in db.scalars(select(Product).order_by(Product.id))
+                ]
+                inventory = [
+                    (item.product_id, item.quantity, item.cost_price)
+                    for item in db.scalars(select(Inventory).order_by(Inventory.id))
+                ]
+                history = [
+                    (item.product_id, item.old_price, item.new_price)
+                    for item in db.scalars(select(PriceHistory).order_by(PriceHistory.id))
+                ]
+                return summaries, products, inventory, history
+            finally:
+                db.close()
+                engine.dispose()
+
+        bulk_result = run_import(use_bulk=True)
+        self.assertEqual(bulk_result, run_import(use_bulk=False))
+        summaries, products, _, history = bulk_result
+        self.assertEqual(summaries[1][:2], (2, 6))
+        self.assertEqual([item[3] for item in products], [110.0, 250.0, 45.0])
+        self.assertEqual(len(history), 3)
+
+    def test_import_rows_skips_rows_matching_stored_fingerprint(self):
+        rows = [
+            {
+                "store_id": 1,
+                "style_code": style_code,
+                "supplier_name": "SUP",
+                "stock_days": 10,
+                "department_name": "DRESS",
+                "category": "DRESS",
+                "mrp": mrp,
+                "quantity": 2,
+            }
+            for style_code, mrp in (("A", 100), ("B", 200), ("C", 300))
+        ]
+        import_all_models()
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        try:
+            db.add(Store(id=1, name="Store 1", city="City"))
+            db.commit()
+
+            first = import_rows(db, "daily_update", [dict(row) for row in rows])
+            db.commit()
+            self.assertEqual((first["inserted"], first["unchanged"]), (6, 0))
+
+            rows[1]["quantity"] = 7
+            second = import_rows(db, "daily_update", [dict(row) for row in rows])
+            db.commit()
+            self.assertEqual((second["updated"], second["unchanged"]), (2, 2))
+
+            db.execute(Inventory.__table__.delete().where(Inventory.quantity == 7))
+            db.commit()
+            third = import_rows(db, "daily_update", [dict(row) for row in rows])
+            db.commit()
+            self.assertEqual(
+                (third["inserted"], third["updated"], third["unchanged"]),
+                (1, 1, 2),
+            )
+            quantities = sorted(db.scalars(select(Inventory.quantity)).all())
+            self.assertEqual(quantities, [2, 2, 7])
+        finally:
+            db.close()
+            engine.dispose()
+
+    def test_reimport_restores_values_changed_outside_the_import(self):
+        rows = [
+            {
+                "store_id": 1,
+                "style_code": style_code,
+                "supplier_name": "SUP",
+                "stock_days": 10,
+                "department_name": "DRESS",
+                "category": "DRESS",
+                "mrp": 100,
+                "price": 90,
+                "quantity": 2,
+            }
+            for style_code in ("A", "B")
+        ]
+        import_all_models()
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        try:
+            db.add(Store(id=1, name="Store 1", city="City"))
+            db.commit()
+            import_rows(db, "daily_update", [dict(row) for row in rows])
+            db.commit()
+
+            bulk_update_prices(db, [{"style_code": "A", "store_id": 1, "price": 50.0}])
+            db.execute(Inventory.__table__.update().values(quantity=9))
+            db.commit()
+            counts = import_rows(db, "daily_update", [dict(row) for row in rows])
+            db.commit()
+
+            self.assertEqual((counts["updated"], counts["unchanged"]), (4, 0))
+            self.assertEqual(set(db.scalars(select(Product.price)).all()), {90.0})
+            self.assertEqual(set(db.scalars(select(Inventory.quantity)).all()), {2})
+            again = import_rows(db, "daily_update", [dict(row) for row in rows])
+            self.assertEqual(again["unchanged"], 2)
+        finally:
+            db.close()
+            engine.dispose()
+
+    def test_quantity_drops_between_imports_become_inferred_sales(self):
+        def daily_row(store_id, style_code, quantity):
+            return {
+                "store_id": store_id,
+                "style_code": style_code,
+                "supplier_name": "SUP",
+                "stock_days": 10,
+                "department_name": "DRESS",
+                "category": "DRESS",
+                "mrp": 100,
+                "quantity": quantity,
+            }
+
+        batches = [
+            [daily_row(1, "A", 5), daily_row(1, "B", 4), daily_row(2, "A", 6)],
+            [daily_row(1, "A", 3), daily_row(1, "B", 9), daily_row(2, "A", 4)],
+            [daily_row(1, "A", 2), daily_row(1, "B", 9), daily_row(2, "A", 4)],
+        ]
+
+        def run_import(use_bulk):
+            import_all_models()
+            engine = create_engine("sqlite:///:memory:")
+            Base.metadata.create_all(bind=engine)
+            db = sessionmaker(bind=engine)()
+            try:
+                db.add_all([Store(id=1, name="Store 1", city="City"), Store(id=2, name="Store 2", city="City")])
+                db.commit()
+                factory = None if not use_bulk else ingestion_service._bulk_insert_factory(db)
+                with patch.object(ingestion_service, "_bulk_insert_factory", return_value=factory):
+                    for rows in batches:
+                        import_rows(db, "daily_update", rows)
+                        db.commit()
+                    written = ingestion_service.derive_inferred_sales(db)
+                    rerun = ingestion_service.derive_inferred_sales(db)
+                deltas = db.execute(
+                    select(InventoryDelta.store_id, InventoryDelta.previous_quantity, InventoryDelta.quantity)
+                    .order_by(InventoryDelta.id)
+                ).all()
+                inferred = db.execute(
+                    select(InferredSale.store_id, InferredSale.product_id, InferredSale.quantity_sold)
+                    .order_by(InferredSale.store_id)
+                ).all()
+                product_a = db.scalar(select(Product.id).where(Product.store_id == 2))
+                db.add(Sales(store_id=2, product_id=product_a, sale_date=date.today(), quantity_sold=1))
+                db.commit()
+                recent = load_recent_sales_totals(db, date.today())
+                return written, rerun, deltas, inferred, recent
+            finally:
+                db.close()
+                engine.dispose()
+
+        bulk_result = run_import(use_bulk=True)
+        self.assertEqual(bulk_result, run_import(use_bulk=False))
+        written, rerun, deltas, inferred, recent = bulk_result
+        self.assertEqual(deltas, [(1, 5, 3), (1, 4, 9), (2, 6, 4), (1, 3, 2)])
+        self.assertEqual([(store_id, quantity) for store_id, _, quantity in inferred], [(1, 3), (2, 2)])
+        self.assertEqual((written, rerun), (2, 0))
+        self.assertEqual(sorted(recent.items()), [((1, inferred[0][1]), 3), ((2, inferred[1][1]), 1)])
+
+    def test_import_context_reuses_store_product_and_image_lookups(self):
+        def product_row(store_id, style_code, mrp):
+            return {
+                "store_id": store_id,
+                "style_code": style_code,
+                "barcode": style_code,
+                "article_name": style_code,
+                "category": "DRESS",
+                "supplier_name": "SUP",
+                "mrp": mrp,
+            }
+
+        import_all_models()
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(bind=engine)
+        self.addCleanup(engine.dispose)
+        db = sessionmaker(bind=engine)()
+        self.addCleanup(db.close)
+        db.add(Store(id=1, name="Store 1", city="City"))
+        db.commit()
+
+        with patch.dict("os.environ", {"EXCEL_CREATE_MISSING_STORES": "true"}), patch.object(
+            ingestion_service, "_get_image_index", return_value={"a": "A.jpg"}
+        ) as image_index_mock:
+            ingestion_service.get_settings.cache_clear()
+            self.addCleanup(ingestion_service.get_settings.cache_clear)
+            context = ingestion_service.ImportContext.load(db)
+            counts = import_rows(
+                db,
+                "products",
+                [product_row(1, "A", 100), product_row(1, "B", 100), product_row(2, "A", 100),
+                 product_row(1, "A", 120)],
+                context=context,
+            )
+            db.commit()
+
+        self.assertEqual((counts["inserted"], counts["updated"]), (3, 1))
+        self.assertEqual(image_index_mock.call_count, 1)
+        self.assertEqual(
+            context.take_stats(),
+            {
+                "store_hits": 3,
+                "store_misses": 1,
+                "image_hits": 3,
+                "image_misses": 1,
+                "product_hits": 1,
+                "product_misses": 3,
+            },
+        )
+        products = db.execute(
+            select(Product.store_id, Product.style_code, Product.mrp, Product.image_url).order_by(Product.id)
+        ).all()
+        self.assertEqual(
+            products,
+            [
+                (1, "A", 120.0, "/static/images/A.jpg"),
+                (1, "B", 100.0, None),
+                (2, "A", 100.0, "/static/images/A.jpg"),
+            ],
+        )
+
+    def test_import_workbook_parses_in_worker_process(self):
+        session_factory = self.use_memory_database(ingestion_service)
+        with session_factory() as db:
+            db.add(Store(id=1, name="Store 1", city="City"))
+            db.commit()
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "daily_update"
+        sheet.append(["store_id", "supplier_name", "stock_days", "style_code", "department_name", "mrp", "qty"])
+        sheet.append([1, "SUP", 10, "A", "DRESS", 100, 3])
+        sheet.append([1, "SUP", 12, "B", "DRESS", 200, None])
+
+        self.addCleanup(ingestion_service.shutdown_parse_pool)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            workbook_path = Path(tmp_dir) / "daily_update.xlsx"
+            workbook.save(workbook_path)
+            inline = ingestion_service.parse_workbook(workbook_path)
+            parsed = ingestion_service.parse_workbook_in_worker(workbook_path)
+            self.assertEqual(parsed, inline)
+            self.assertEqual(
+                [record["style_code"] for record in parsed[0].iter_records()],
+                ["A", "B"],
+            )
+
+            results = ingestion_service.import_workbook(workbook_path, parse_workers=1)
+
+        self.assertEqual(results["daily_update"]["inserted"], 4)
+        with session_factory() as db:
+            self.assertEqual(sorted(db.scalars(select(Product.style_code)).all()), ["A", "B"])
+            self.assertEqual(sorted(db.scalars(select(Inventory.quantity)).all()), [0, 3])
+
+    def test_import_workbook_merges_store_sheets_parsed_in_parallel(self):
+        session_factory = self.use_memory_database(ingestion_service)
+        with session_factory() as db:
+            db.add_all(
+                [
+                    Store(id=101, name="Store 101", city="City"),
+                    Store(id=102, name="Store 102", city="City"),
+                ]
+            )
+            db.commit()
+
+        workbook = Workbook()
+        workbook.remove(workbook.active)
+        for title, style_codes in (("101_stock", ["A", "B"]), ("102_stock", ["A"])):
+            worksheet = workbook.create_sheet(title)
+            for offset, style_code in enumerate(style_codes):
+                top = 1 + offset * 6
+                worksheet.cell(row=top, column=1, value="Supplier Name")
+                worksheet.cell(row=top, column=3, value="SUP")
+                worksheet.cell(row=top + 1, column=1, value="Department")
+                worksheet.cell(row=top + 1, column=3, value="DRESS")
+                worksheet.cell(row=top + 2, column=1, value="Style")
+                worksheet.cell(row=top + 2, column=3, value=style_code)
+                worksheet.cell(row=top + 3, column=1, value="MRP")
+                worksheet.cell(row=top + 3, column=3, value=100)
+        workbook.create_sheet("Summary")
+
+        self.assertEqual(
+            ingestion_service._plan_sheet_imports(workbook.sheetnames, None),
+            [("daily_update", "101_stock"), ("daily_update", "102_stock")],
+        )
+
+        self.addCleanup(ingestion_service.shutdown_parse_pool)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            workbook_path = Path(tmp_dir) / "stores.xlsx"
+            workbook.save(workbook_path)
+            results = ingestion_service.import_workbook(workbook_path, parse_workers=2)
+
+        self.assertEqual(list(results), ["daily_update"])
+        self.assertEqual(results["daily_update"]["inserted"], 6)
+        with session_factory() as db:
+            self.assertEqual(
+                sorted(db.execute(select(Product.store_id, Product.style_code)).all()),
+                [(101, "A"), (101, "B"), (102, "A")],
+            )
+
+    def test_import_workbook_accepts_csv_tsv_and_gzip(self):
+        session_factory = self.use_memory_database(ingestion_service)
+        with session_factory() as db:
+            db.add(Store(id=1, name="Store 1", city="City"))
+            db.commit()
+
+        header = ["Store ID", "Supplier Name", "Stock Days", "Style Code", "Department Name", "MRP", "Qty"]
+        data = [
+            ["1", "SUP", "10", "A", "DRESS", "1,200.00", "3"],
+            ["", "", "", "", "", "", ""],
+            ["1", "SUP", "12", "B", "DRESS", "200", ""],
+            ["Total", "", "", "", "", "", "3"],
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = Path(tmp_dir) / "daily_update.csv.gz"
+            with gzip.open(csv_path, "wt", newline="", encoding="utf-8") as handle:
+                csv.writer(handle).writerows([header, *data])
+            tsv_path = Path(tmp_dir) / "daily_update.tsv"
+            with open(tsv_path, "w", newline="", encoding="utf-8") as handle:
+                csv.writer(handle, delimiter="\t").writerows([header, *data[:1]])
+
+            parsed = ingestion_service.parse_workbook(csv_path)
+            self.assertEqual([sheet.key for sheet in parsed], ["daily_update"])
+            self.assertEqual(
+                [record["style_code"] for record in parsed[0].iter_records()],
+                ["A", "B"],
+            )
+            unsupported_path = Path(tmp_dir) / "daily_update.xlsx.gz"
+            unsupported_path.write_bytes(b"")
+            with self.assertRaises(ValueError):
+                ingestion_service.import_workbook(unsupported_path)
+
+            first = ingestion_service.import_workbook(csv_path, parse_workers=0)
+            second = ingestion_service.import_workbook(tsv_path, parse_workers=0)
+
+        self.assertEqual(first["daily_update"]["inserted"], 4)
+        self.assertEqual(second["daily_update"]["unchanged"], 1)
+        with session_factory() as db:
+            self.assertEqual(
+                sorted(db.execute(select(Product.style_code, Product.mrp)).all()),
+                [("A", 1200.0), ("B", 200.0)],
+            )
+
+    def test_column_profile_picks_one_date_format_and_converters(self):
+        profile = ingestion_service.ColumnProfile.infer(
+            "daily_update",
+            [
+                {"lifecycle_start_date": "13/01/2024", "mrp": "1,200.00", "store_id": 1},
+                {"lifecycle_start_date": "02/01/2024", "mrp": "950", "store_id": 2},
+            ],
+        )
+        record = {"lifecycle_start_date": "03/02/2024", "mrp": "2,500", "store_id": 3.0, "quantity": " "}
+        self.assertEqual(profile.coerce(record), [])
+        self.assertEqual(
+            record,
+            {"lifecycle_start_date": date(2024, 2, 3), "mrp": 2500.0, "store_id": 3, "quantity": " "},
+        )
+
+        bad = {"lifecycle_start_date": "2024-02-30", "mrp": "12", "store_id": "x"}
+        failures = profile.coerce(bad)
+        self.assertEqual([column for column, _, _ in failures], ["store_id", "lifecycle_start_date"])
+
+    def test_import_workbook_reports_rows_that_fail_coercion(self):
+        session_factory = self.use_memory_database(ingestion_service)
+        with session_factory() as db:
+            db.add(Store(id=1, name="Store 1", city="City"))
+            db.commit()
+
+        header = ["Store ID", "Supplier Name", "Lifecycle Start Date", "Style Code", "Department Name", "MRP"]
+        data = [
+            ["1", "SUP", "25/12/2023", "A", "DRESS", "100"],
+            ["1", "SUP", "01/01/2024", "B", "DRESS", "n/a"],
+            ["1", "SUP", "05/01/2024", "C", "DRESS", "300"],
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = Path(tmp_dir) / "daily_update.csv"
+            with open(csv_path, "w", newline="", encoding="utf-8") as handle:
+                csv.writer(handle).writerows([header, *data])
+
+            parsed = ingestion_service.parse_workbook(csv_path)
+            results = ingestion_service.import_workbook(csv_path, parse_workers=0, chunk_rows=0)
+
+        expected_rejects = [
+            {
+                "sheet": "daily_update",
+                "row": 3,
+                "column": "mrp",
+                "value": "n/a",
+                "error": "could not convert string to float: 'n/a'",
+            }
+        ]
+        self.assertEqual(parsed[0].rejects, expected_rejects)
+        self.assertEqual(len(parsed[0].rows), 2)
+        self.assertEqual(results["daily_update"]["rejects"], expected_rejects)
+        self.assertEqual(results["daily_update"]["inserted"], 4)
+        self.assertIn("1 rejected", ingestion_service.summarize_results(results))
+        with session_factory() as db:
+            self.assertEqual(
+                sorted(db.execute(select(Inventory.lifecycle_start_date)).scalars()),
+                [date(2023, 12, 25), date(2024, 1, 5)],
+            )
+
+    def test_import_workbook_loads_sold_and_purchase_reports(self):
+        session_factory = self.use_memory_database(ingestion_service)
+        with session_factory() as db:
+            db.add(Store(id=1, name="Store 1", city="City"))
+            db.add_all(
+                [
+                    Product(id=1, store_id=1, style_code="A", barcode="111", article_name="A",
+                            category="DRESS", supplier_name="SUP", mrp=100, price=100),
+                    Product(id=2, store_id=1, style_code="B", barcode="222", article_name="B",
+                            category="DRESS", supplier_name="SUP", mrp=100, price=100),
+                ]
+            )
+            db.add(Inventory(store_id=1, product_id=1, quantity=5, cost_price=50, current_price=100,
+                             lifecycle_start_date=date(2024, 1, 2)))
+            db.commit()
+
+        workbook = Workbook()
+        sold = workbook.active
+        sold.title = "Sales Lines"
+        sold.append(["Store ID", "Style Code", "Item Code", "Bill Date", "Sold Qty"])
+        sold.append([1, "A", None, date(2024, 1, 1), 1])
+        sold.append([1, "A", None, date(2024, 1, 3), 2])
+        sold.append([1, "A", None, date(2024, 1, 3), 1])
+        sold.append([1, None, "222", date(2024, 1, 3), 4])
+        sold.append([1, "UNKNOWN", None, date(2024, 1, 3), 9])
+        purchases = workbook.create_sheet("purchase_report")
+        purchases.append(["Store ID", "Style Code", "GRN Date", "Qty"])
+        purchases.append([1, "A", "2024-01-02", 6])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            workbook_path = Path(tmp_dir) / "reports.xlsx"
+            workbook.save(workbook_path)
+            with patch.dict("os.environ", {"EXCEL_SOLD_REPORT_SHEET_ALIASES": "sales lines"}):
+                ingestion_service.get_settings.cache_clear()
+                self.addCleanup(ingestion_service.get_settings.cache_clear)
+                plan = ingestion_service._plan_sheet_imports(["Sales Lines", "purchase_report"], None)
+                first = ingestion_service.import_workbook(workbook_path, parse_workers=0)
+                sold.cell(row=2, column=5, value=3)
+                workbook.save(workbook_path)
+                second = ingestion_service.import_workbook(workbook_path, parse_workers=0, chunk_rows=2)
+
+        self.assertEqual(plan, [("sold_report", "Sales Lines"), ("purchase_report", "purchase_report")])
+        self.assertEqual(
+            {key: first["sold_report"][key] for key in ("inserted", "updated", "unchanged", "skipped")},
+            {"inserted": 3, "updated": 0, "unchanged": 0, "skipped": 1},
+        )
+        self.assertEqual(first["purchase_report"]["inserted"], 1)
+        self.assertEqual(
+            {key: second["sold_report"][key] for key in ("inserted", "updated", "unchanged", "skipped")},
+            {"inserted": 0, "updated": 1, "unchanged": 2, "skipped": 1},
+        )
+        with session_factory() as db:
+            self.assertEqual(
+                sorted(db.execute(select(Sales.product_id, Sales.sale_date, Sales.quantity_sold)).all()),
+                [(1, date(2024, 1, 1), 3), (1, date(2024, 1, 3), 3), (2, date(2024, 1, 3), 4)],
+            )
+            sold_totals, purchased_totals = load_lifecycle_report_totals(db)
+        self.assertEqual(sold_totals, {(1, 1): 3})
+        self.assertEqual(purchased_totals, {(1, 1): 6})
+
+    def _seed_report_products(self, session_factory):
+        with session_factory() as db:
+            db.add(Store(id=1, name="Store 1", city="City"))
+            db.add_all(
+                [
+                    Product(id=product_id, store_id=1, style_code=style_code, barcode=barcode,
+                            article_name=style_code, category="DRESS", supplier_name="SUP",
+                            mrp=100, price=100)
+                    for product_id, style_code, barcode in ((1, "A", "111"), (2, "B", "222"))
+                ]
+            )
+            db.commit()
+
+    @staticmethod
+    def _report_lines(count):
+        for index in range(count):
+            yield {
+                "store_id": 1,
+                "style_code": "AB"[index % 2],
+                "barcode": None,
+                "sale_date": date(2024, 1, 1 + index % 5),
+                "quantity_sold": 1,
+            }
+
+    def test_report_rows_stream_in_memory_independent_of_length(self):
+        session_factory = self.use_memory_database(ingestion_service)
+        self._seed_report_products(session_factory)
+
+        peaks = []
+        for count in (20_000, 80_000):
+            with session_factory() as db:
+                tracemalloc.start()
+                try:
+                    counts = ingestion_service.import_report_rows(
+                        db, "sold_report", self._report_lines(count)
+                    )
+                    peaks.append(tracemalloc.get_traced_memory()[1])
+                finally:
+                    tracemalloc.stop()
+                db.commit()
+                totals = db.execute(select(func.sum(Sales.quantity_sold))).scalar_one()
+                staged = db.execute(select(func.count()).select_from(ReportImportLine)).scalar_one()
+            self.assertEqual(counts["skipped"], 0)
+            self.assertEqual(counts["inserted"] + counts["updated"], 10)
+            self.assertEqual((totals, staged), (count, 0))
+
+        self.assertLess(peaks[1], peaks[0] * 1.5)
+
+    def test_report_rows_merge_without_upsert_support(self):
+        session_factory = self.use_memory_database(ingestion_service)
+        self._seed_report_products(session_factory)
+
+        with session_factory() as db, patch.object(
+            ingestion_service, "_bulk_insert_factory", return_value=None
+        ):
+            first = ingestion_service.import_report_rows(db, "sold_report", self._report_lines(20))
+            second = ingestion_service.import_report_rows(db, "sold_report", self._report_lines(30))
+            db.commit()
+            rows = db.execute(
+                select(Sales.product_id, Sales.sale_date, Sales.quantity_sold)
+                .order_by(Sales.sale_date, Sales.product_id)
+            ).all()
+
+        self.assertEqual((first["inserted"], first["updated"], first["unchanged"]), (10, 0, 0))
+        self.assertEqual((second["inserted"], second["updated"], second["unchanged"]), (0, 10, 0))
+        self.assertEqual(len(rows), 10)
+        self.assertEqual({quantity for _, _, quantity in rows}, {3})
+
+    def test_lifecycle_totals_count_duplicate_inventory_rows_once(self):
+        session_factory = self.use_memory_database(ingestion_service)
+        with session_factory() as db:
+            db.add(Store(id=1, name="Store 1", city="City"))
+            db.add(Product(id=1, store_id=1, style_code="A", barcode="111", article_name="A",
+                           category="DRESS", supplier_name="SUP", mrp=100, price=100))
+            for start in (date(2024, 1, 5), date(2024, 1, 2)):
+                db.add(Inventory(store_id=1, product_id=1, quantity=5, cost_price=50, current_price=100,
+                                 lifecycle_start_date=start))
+            db.add_all(
+                [
+                    Sales(store_id=1, product_id=1, sale_date=date(2024, 1, 1), quantity_sold=7),
+                    Sales(store_id=1, product_id=1, sale_date=date(2024, 1, 3), quantity_sold=2),
+                    Sales(store_id=1, product_id=1, sale_date=date(2024, 1, 6), quantity_sold=1),
+                ]
+            )
+            db.commit()
+
+            sold_totals, purchased_totals = load_lifecycle_report_totals(db)
+
+        self.assertEqual(sold_totals, {(1, 1): 3})
+        self.assertEqual(purchased_totals, {})
+
+    def test_import_workbook_commits_chunks_and_resumes_from_checkpoint(self):
+        session_factory = self.use_memory_database(ingestion_service)
+        with session_factory() as db:
+            db.add(Store(id=1, name="Store 1", city="City"))
+            db.commit()
+
+        header = ["store_id", "supplier_name", "stock_days", "style_code", "department_name", "mrp"]
+        real_import_rows = ingestion_service.import_rows
+        calls = []
+
+        def flaky_import_rows(db, sheet_key, rows, **kwargs):
+            calls.append([row["style_code"] for row in rows])
+            if len(calls) == 3:
+                raise OperationalError("INSERT", {}, Exception("database is locked"))
+            return real_import_rows(db, sheet_key, rows, **kwargs)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = Path(tmp_dir) / "daily_update.csv"
+            with open(csv_path, "w", newline="", encoding="utf-8") as handle:
+                writer = csv.writer(handle)
+                writer.writerow(header)
+                for index in range(5):
+                    writer.writerow([1, "SUP", 10, f"S{index}", "DRESS", 100 + index])
+
+            with patch.object(ingestion_service, "import_rows", side_effect=flaky_import_rows):
+                with self.assertRaises(OperationalError):
+                    ingestion_service.import_workbook(csv_path, parse_workers=0, chunk_rows=2)
+                with session_factory() as db:
+                    self.assertEqual(db.scalar(select(func.count(Product.id))), 4)
+                    self.assertEqual(db.scalar(select(ImportCheckpoint.rows_done)), 4)
+
+                results = ingestion_service.import_workbook(csv_path, parse_workers=0, chunk_rows=2)
+
+        self.assertEqual(calls, [["S0", "S1"], ["S2", "S3"], ["S4"], ["S4"]])
+        counts = results["daily_update"]
+        self.assertEqual((counts["inserted"], counts["resumed_rows"]), (10, 4))
+        with session_factory() as db:
+            self.assertEqual(db.scalar(select(func.count(Product.id))), 5)
+            self.assertEqual(db.scalar(select(func.count(ImportCheckpoint.id))), 0)
+
+    def test_resumed_import_keeps_images_from_committed_chunks(self):
+        session_factory = self.use_memory_database(ingestion_service)
+        with session_factory() as db:
+            db.add(Store(id=1, name="Store 1", city="City"))
+            db.commit()
+
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = "daily_update"
+        worksheet.append(["store_id", "supplier_name", "stock_days", "style_code", "department_name", "mrp", "image"])
+        for index in range(5):
+            worksheet.append([1, "SUP", 10, f"S{index}", "DRESS", 100 + index, None])
+        png_bytes = base64.b64decode(
+            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAwMCAO+/n1cAAAAASUVORK5CYII="
+        )
+        real_import_rows = ingestion_service.import_rows
+        calls = []
+
+        def flaky_import_rows(db, sheet_key, rows, **kwargs):
+            calls.append(len(rows))
+            if len(calls) == 3:
+                raise OperationalError("INSERT", {}, Exception("database is locked"))
+            return real_import_rows(db, sheet_key, rows, **kwargs)
+
+        def stored_styles():
+            with session_factory() as db:
+                return sorted(db.scalars(select(ProductImage.style_code)))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            image_path = tmp_path / "embedded.png"
+            image_path.write_bytes(png_bytes)
+            for row in range(2, 7):
+                worksheet.add_image(XLImage(str(image_path)), f"G{row}")
+            workbook_path = tmp_path / "daily_update.xlsx"
+            workbook.save(workbook_path)
+
+            with patch.object(ingestion_service, "_IMAGE_DIR", tmp_path / "images"), patch.object(
+                ingestion_service, "import_rows", side_effect=flaky_import_rows
+            ):
+                with self.assertRaises(OperationalError):
+                    ingestion_service.import_workbook(workbook_path, parse_workers=0, chunk_rows=2)
+                after_failure = stored_styles()
+                ingestion_service.import_workbook(workbook_path, parse_workers=0, chunk_rows=2)
+
+        self.assertEqual(after_failure, ["S0", "S1", "S2", "S3"])
+        self.assertEqual(stored_styles(), ["S0", "S1", "S2", "S3", "S4"])
+
+    def test_chunked_import_loads_stored_state_once(self):
+        session_factory = self.use_memory_database(ingestion_service)
+        with session_factory() as db:
+            db.add(Store(id=1, name="Store 1", city="City"))
+            db.commit()
+
+        header = ["store_id", "supplier_name", "stock_days", "style_code", "department_name", "mrp", "qty"]
+        rows = [
+            [1, "SUP", 10, "S0", "DRESS", 100, 5],
+            [1, "SUP", 10, "S1", "DRESS", 101, 5],
+            [1, "SUP", 10, "S0", "DRESS", 100, 5],
+            [1, "SUP", 10, "S1", "DRESS", 101, 3],
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = Path(tmp_dir) / "daily_update.csv"
+            with open(csv_path, "w", newline="", encoding="utf-8") as handle:
+                writer = csv.writer(handle)
+                writer.writerow(header)
+                writer.writerows(rows)
+
+            with patch.object(
+                ingestion_service, "_load_product_states", wraps=ingestion_service._load_product_states
+            ) as load_mock:
+                first = ingestion_service.import_workbook(csv_path, parse_workers=0, chunk_rows=1)
+                self.assertEqual(load_mock.call_count, 1)
+                second = ingestion_service.import_workbook(csv_path, parse_workers=0, chunk_rows=1)
+            self.assertEqual(load_mock.call_count, 2)
+
+        self.assertEqual((first["daily_update"]["inserted"], first["daily_update"]["unchanged"]), (4, 1))
+        self.assertEqual(first["daily_update"]["updated"], 2)
+        self.assertEqual((second["daily_update"]["unchanged"], second["daily_update"]["updated"]), (2, 4))
+        with session_factory() as db:
+            quantities = dict(
+                db.execute(
+                    select(Product.style_code, Inventory.quantity).join(
+                        Inventory, Inventory.product_id == Product.id
+                    )
+                ).all()
+            )
+            self.assertEqual(db.scalar(select(func.count(Inventory.id))), 2)
+        self.assertEqual(quantities, {"S0": 5, "S1": 3})
+
+    def test_bulk_daily_update_reports_progress_per_batch(self):
+        session_factory = self.use_memory_database(ingestion_service)
+        rows = [
+            {
+                "store_id": 1,
+                "style_code": f"S{index}",
+                "supplier_name": "SUP",
+                "stock_days": 10,
+                "department_name": "DRESS",
+                "category": "DRESS",
+                "mrp": 100,
+            }
+            for index in range(1200)
+        ]
+        applied = []
+        progress = type("Progress", (), {"add_applied": lambda self, count: applied.append(count)})()
+
+        with session_factory() as db:
+            db.add(Store(id=1, name="Store 1", city="City"))
+            db.flush()
+            counts = import_rows(db, "daily_update", rows, progress=progress)
+
+        self.assertEqual(counts["inserted"], 2400)
+        self.assertEqual(applied, [500, 500, 200])
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,17 @@
+import json
 import unittest
 from datetime import date, timedelta
 
+from sqlalchemy import select
+
 from app.ml.predict import predict_risk
+from app.models.risk_log import RiskLog
+from app.services import ml_service
+
+from db_support import MemoryDatabaseMixin
 
 
-class MLServiceTest(unittest.TestCase):
+class MLServiceTest(MemoryDatabaseMixin, unittest.TestCase):
     def test_predict_risk_range(self):
         score = predict_risk(
             category="dress",
@@ -15,6 +22,30 @@ class MLServiceTest(unittest.TestCase):
         self.assertGreaterEqual(score, 0.0)
         self.assertLessEqual(score, 1.0)
 
+    def test_predict_and_log_batch_matches_single_scores_and_logs_each_row(self):
+        session_factory = self.use_memory_database()
+        rows = [
+            {
+                "category": category,
+                "quantity": quantity,
+                "cost_price": 2500.0,
+                "lifecycle_start_date": date.today() - timedelta(days=age_days),
+                "store_id": 101,
+                "product_id": product_id,
+            }
+            for product_id, category, quantity, age_days in ((1, "dress", 10, 120), (2, "kurti", 3, 400))
+        ]
+
+        with session_factory() as db:
+            scores = ml_service.predict_and_log_batch(db, rows)
+            db.commit()
+            logs = db.execute(select(RiskLog).order_by(RiskLog.product_id)).scalars().all()
+
+        self.assertEqual(scores, [ml_service.predict_and_log(**row) for row in rows])
+        self.assertEqual([log.product_id for log in logs], [1, 2])
+        self.assertEqual([log.risk_score for log in logs], scores)
+        self.assertEqual(json.loads(logs[1].context)["category"], "kurti")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,7 +3,7 @@ from datetime import date, timedelta
 from unittest.mock import patch
 
 from app.ml import predict as predict_module
-from app.ml.predict import get_model_runtime_info, model_is_available, predict_risk
+from app.ml.predict import get_model_runtime_info, model_is_available, predict_risk, predict_risk_batch
 
 
 class PredictRiskTest(unittest.TestCase):
@@ -126,6 +126,81 @@ class PredictRiskTest(unittest.TestCase):
         self.assertLessEqual(score, 1.0)
         self.assertIsNone(predict_module._MODEL)
 
+    def test_batch_heuristic_scores_age_bands_value_and_category(self):
+        predict_module._MODEL = None
+        predict_module._MODEL_METADATA = None
+        predict_module._MODEL_LOAD_ERROR = None
+        today = date.today()
+
+        def row(age_days, category="other", quantity=1, cost_price=100.0):
+            return {
+                "category": category,
+                "quantity": quantity,
+                "cost_price": cost_price,
+                "lifecycle_start_date": today - timedelta(days=age_days),
+            }
+
+        # Each band boundary with a 100-unit stock value (0.00002 value risk).
+        cases = [
+            (row(0), 0.15002),
+            (row(89), 0.15002),
+            (row(90), 0.30002),
+            (row(179), 0.30002),
+            (row(180), 0.55002),
+            (row(249), 0.55002),
+            (row(250), 0.75002),
+            (row(364), 0.75002),
+            (row(365), 0.90002),
+            (row(900), 0.90002),
+            (row(-5), 0.15002),
+            (row(10, category="Dress"), 0.18002),
+            (row(10, category="dress material"), 0.17002),
+            (row(10, category="LEHENGA"), 0.20002),
+            (row(10, category="saree"), 0.18002),
+            (row(10, quantity=500, cost_price=900.0), 0.24),
+            (row(10, quantity=2000, cost_price=1000.0), 0.35),
+            (row(10, quantity=-3, cost_price=100.0), 0.15),
+            (row(400, category="lehenga", quantity=2000, cost_price=1000.0), 1.0),
+        ]
+
+        with patch.object(predict_module, "model_available", return_value=False):
+            batch = predict_risk_batch([case for case, _ in cases])
+            single = predict_risk(**cases[4][0])
+
+        self.assertEqual(len(batch), len(cases))
+        for score, (case, expected) in zip(batch, cases):
+            self.assertAlmostEqual(float(score), expected, msg=case)
+        self.assertAlmostEqual(single, 0.55002)
+        self.assertEqual(len(predict_risk_batch([])), 0)
+
+    def test_batch_scores_all_rows_with_one_model_call(self):
+        class CountingModel:
+            calls = []
+
+            def predict_proba(self, rows):
+                self.calls.append(len(rows))
+                return [[0.0, 0.1 * (index + 1)] for index in range(len(rows))]
+
+        predict_module._MODEL = CountingModel()
+        predict_module._MODEL_METADATA = {"training_source": "inventory+weak_labels_no_sales"}
+        predict_module._MODEL_LOAD_ERROR = None
+        today = date.today()
+        rows = [
+            {"category": "dress", "quantity": index, "cost_price": 100.0, "lifecycle_start_date": today}
+            for index in range(5)
+        ]
+
+        batch = predict_risk_batch(rows)
+
+        self.assertEqual(CountingModel.calls, [5])
+        single = [predict_risk(**row) for row in rows]
+        self.assertEqual(CountingModel.calls, [5, 1, 1, 1, 1, 1])
+        heuristic = predict_module._heuristic_risk(rows)
+        for index, score in enumerate(batch):
+            expected = 0.65 * 0.1 * (index + 1) + 0.35 * heuristic[index]
+            self.assertAlmostEqual(float(score), expected)
+        self.assertAlmostEqual(float(batch[0]), single[0])
+
 
 if __name__ == "__main__":
     unittest.main()
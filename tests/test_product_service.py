@@ -0,0 +1,112 @@
+import unittest
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.database.base import Base
+from app.models import import_all_models
+from app.models.price_history import PriceHistory
+from app.models.product import Product
+from app.models.stores import Store
+from app.routers.products import bulk_update_product_prices
+from app.schemas.product import ProductPriceBulkRequest
+from app.services import ingestion_service
+
+
+class ProductPriceBulkTest(unittest.TestCase):
+    def setUp(self):
+        import_all_models()
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(bind=engine)
+        self.addCleanup(engine.dispose)
+        self.db = sessionmaker(bind=engine)()
+        self.addCleanup(self.db.close)
+        self.db.add_all([Store(id=1, name="Store 1", city=""), Store(id=2, name="Store 2", city="")])
+        for store_id, style_code in ((1, "A"), (1, "B"), (2, "B"), (1, "C")):
+            self.db.add(
+                Product(
+                    store_id=store_id,
+                    style_code=style_code,
+                    barcode=f"{store_id}{style_code}",
+                    article_name=style_code,
+                    category="Tops",
+                    department_name="",
+                    supplier_name="Acme",
+                    mrp=100.0,
+                    price=100.0,
+                )
+            )
+        self.db.commit()
+
+    def _prices(self):
+        return {
+            (product.store_id, product.style_code): product.price
+            for product in self.db.scalars(select(Product))
+        }
+
+    def test_bulk_endpoint_writes_changed_prices_and_history_in_one_batch(self):
+        payload = ProductPriceBulkRequest(
+            items=[
+                {"style_code": "A", "price": 80.0},
+                {"style_code": "B", "store_id": 2, "price": 90.0},
+                {"style_code": "C", "store_id": 1, "price": 100.0},
+            ]
+        )
+
+        result = bulk_update_product_prices(payload, db=self.db, _auth=None)
+
+        self.assertEqual((result.updated, result.unchanged), (2, 1))
+        self.assertEqual(
+            sorted((item["store_id"], item["style_code"], item["new_price"]) for item in result.price_changes),
+            [(1, "A", 80.0), (2, "B", 90.0)],
+        )
+        self.db.expire_all()
+        self.assertEqual(
+            self._prices(),
+            {(1, "A"): 80.0, (1, "B"): 100.0, (2, "B"): 90.0, (1, "C"): 100.0},
+        )
+        history = self.db.scalars(select(PriceHistory).order_by(PriceHistory.new_price)).all()
+        self.assertEqual([(item.old_price, item.new_price) for item in history], [(100.0, 80.0), (100.0, 90.0)])
+
+    def test_bulk_endpoint_rejects_whole_batch_on_unknown_or_ambiguous_style(self):
+        for items, status_code in (
+            ([{"style_code": "A", "price": 50.0}, {"style_code": "B", "price": 50.0}], 400),
+            ([{"style_code": "A", "price": 50.0}, {"style_code": "Z", "store_id": 1, "price": 50.0}], 404),
+            ([{"style_code": "A", "price": -1.0}], 400),
+        ):
+            with self.assertRaises(HTTPException) as error_context:
+                bulk_update_product_prices(ProductPriceBulkRequest(items=items), db=self.db, _auth=None)
+            self.assertEqual(error_context.exception.status_code, status_code)
+
+        self.assertEqual(set(self._prices().values()), {100.0})
+        self.assertEqual(self.db.scalars(select(PriceHistory)).all(), [])
+
+    def test_products_sheet_stages_price_history_for_one_insert(self):
+        rows = [
+            {
+                "store_id": store_id,
+                "style_code": style_code,
+                "barcode": f"{store_id}{style_code}",
+                "article_name": style_code,
+                "category": "Tops",
+                "supplier_name": "Acme",
+                "mrp": 100.0,
+                "price": price,
+            }
+            for store_id, style_code, price in ((1, "A", 70.0), (1, "B", 100.0), (2, "B", 60.0))
+        ]
+        context = ingestion_service.ImportContext.load(self.db)
+
+        counts = ingestion_service.import_rows(self.db, "products", rows, context=context)
+        self.db.commit()
+
+        self.assertEqual(counts["updated"], 3)
+        self.assertEqual(len(counts["price_changes"]), 2)
+        history = self.db.scalars(select(PriceHistory).order_by(PriceHistory.new_price)).all()
+        self.assertEqual([item.new_price for item in history], [60.0, 70.0])
+        self.assertTrue(all(item.product_id is not None for item in history))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import hashlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi import Response, UploadFile
+
+from app.config import get_settings
+from app.routers.ingest import ingest_upload
+from app.services import import_history_service, import_job_service
+from app.services.import_history_service import STATUS_SUCCESS, list_workbook_imports
+from app.services.upload_service import UploadTooLargeError, spool_upload
+
+from db_support import MemoryDatabaseMixin
+
+_CSV_BYTES = b"store_id,style_code\n1,A\n" * 1000
+
+
+class UploadServiceTest(MemoryDatabaseMixin, unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = Path(temp_dir.name)
+
+    def test_spool_upload_hashes_and_names_by_content(self):
+        upload = spool_upload(
+            io.BytesIO(_CSV_BYTES),
+            filename="../Daily Update.csv",
+            upload_dir=self.temp_dir,
+        )
+        self.assertEqual(upload.sha256, hashlib.sha256(_CSV_BYTES).hexdigest())
+        self.assertEqual(upload.size, len(_CSV_BYTES))
+        self.assertEqual(upload.path.name, "{}_Daily_Update.csv".format(upload.sha256[:16]))
+        self.assertFalse(upload.path.exists())
+
+        upload.keep()
+        self.assertEqual(upload.path.read_bytes(), _CSV_BYTES)
+        self.assertFalse(upload.temp_path.exists())
+
+    def test_spool_upload_rejects_oversized_and_unsupported_files(self):
+        with self.assertRaises(UploadTooLargeError):
+            spool_upload(io.BytesIO(_CSV_BYTES), filename="a.csv", upload_dir=self.temp_dir, max_bytes=100)
+        with self.assertRaises(ValueError):
+            spool_upload(io.BytesIO(b"x"), filename="notes.txt", upload_dir=self.temp_dir)
+        self.assertEqual(list(self.temp_dir.iterdir()), [])
+
+    def test_upload_endpoint_skips_duplicate_content(self):
+        session_factory = self.use_memory_database(import_history_service, expire_on_commit=False)
+
+        manager = import_job_service.ImportJobManager(max_concurrent=1)
+        self.addCleanup(manager.shutdown)
+
+        with patch.dict("os.environ", {"EXCEL_DATASOURCE_DIR": str(self.temp_dir)}), patch.object(
+            import_job_service, "get_import_job_manager", return_value=manager
+        ), patch.object(
+            import_job_service,
+            "import_workbook",
+            return_value={"daily_update": {"inserted": 2, "price_changes": []}},
+        ) as import_mock:
+            get_settings.cache_clear()
+            self.addCleanup(get_settings.cache_clear)
+
+            def post_upload():
+                response = Response()
+                body = ingest_upload(
+                    response,
+                    file=UploadFile(file=io.BytesIO(_CSV_BYTES), filename="daily_update.csv"),
+                    sheets=None,
+                    dry_run=False,
+                    _auth=None,
+                )
+                return response.status_code, body
+
+            first_status, first = post_upload()
+            self.assertTrue(manager.get(first.job.id).wait(5))
+            second_status, second = post_upload()
+
+        self.assertEqual(first_status, 202)
+        self.assertFalse(first.duplicate)
+        self.assertIsNotNone(first.job)
+        self.assertEqual(second_status, 200)
+        self.assertTrue(second.duplicate)
+        self.assertIsNone(second.job)
+        self.assertEqual(import_mock.call_count, 1)
+        self.assertEqual(
+            import_mock.call_args.kwargs["source_sha256"], hashlib.sha256(_CSV_BYTES).hexdigest()
+        )
+
+        stored = list((self.temp_dir / "uploads").iterdir())
+        self.assertEqual([path.name for path in stored], [Path(import_mock.call_args.args[0]).name])
+        with session_factory() as db:
+            history = list_workbook_imports(db)
+        self.assertEqual([item.status for item in history], [STATUS_SUCCESS])
+
+
+if __name__ == "__main__":
+    unittest.main()